@@ -0,0 +1,348 @@
+"""Firefly benchmark suite.
+
+Times the compound interest engine, the /api/calculate request path and the
+visualizer's chart data, writes the timings with environment metadata as
+JSON, and compares them against a stored baseline.
+
+Usage:
+    python benchmarks/run.py                      # run and compare to baseline
+    python benchmarks/run.py --save-baseline      # run and store as new baseline
+    python benchmarks/run.py --filter calculate/daily --threshold 0.2
+
+Exits with status 1 when any benchmark is slower than its baseline by more
+than the threshold. Baselines are machine-specific: store one per machine.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).parent
+DEFAULT_OUTPUT = BENCH_DIR / "results.json"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+
+HORIZONS = [1, 10, 30, 60]
+CONTRIBUTION_MODES = {
+    "none": {},
+    "monthly": {"monthly_contribution": 500},
+    "annual": {"annual_contribution": 6000},
+}
+
+
+def time_call(func: Callable[[], object], rounds: int, min_round_time: float) -> dict:
+    """Time `func`, calibrating loops per round so each round lasts `min_round_time`."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_round_time:
+            break
+        loops *= 2 if elapsed == 0 else max(2, int(min_round_time / elapsed * 1.2))
+
+    per_call = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        per_call.append((time.perf_counter() - start) / loops)
+
+    return {
+        "median": statistics.median(per_call),
+        "min": min(per_call),
+        "stdev": statistics.stdev(per_call) if rounds > 1 else 0.0,
+        "rounds": rounds,
+        "loops": loops,
+    }
+
+
+def calculator_benchmarks() -> dict[str, Callable[[], object]]:
+    """
+    CompoundInterestCalculator.calculate across frequencies, horizons and
+    contributions, plans with schedules, the exact-cents engine, and incremental
+    CalculationSession edits.
+    """
+    from dataclasses import replace
+
+    from firefly.core.calculators.compound_interest import CompoundInterestCalculator
+    from firefly.core.models.compound_interest import (
+        CompoundingFrequency,
+        CompoundInterestInput,
+        RoundingPolicy,
+        Schedule,
+    )
+    from firefly.core.session import CalculationSession
+
+    calculator = CompoundInterestCalculator()
+    cases = {}
+    for frequency in CompoundingFrequency:
+        for years in HORIZONS:
+            for mode, contributions in CONTRIBUTION_MODES.items():
+                params = CompoundInterestInput(
+                    principal=10000,
+                    annual_rate=7,
+                    years=years,
+                    compounding_frequency=frequency,
+                    **contributions,
+                )
+                name = f"calculate/{frequency.name.lower()}/{years}y/{mode}"
+                cases[name] = lambda params=params: calculator.calculate(params)
+
+    # A 50-year plan whose rate and contribution change every month
+    for frequency in CompoundingFrequency:
+        months = range(1, 600)
+        params = CompoundInterestInput(
+            principal=10000,
+            annual_rate=7,
+            years=50,
+            monthly_contribution=500,
+            compounding_frequency=frequency,
+            schedule=Schedule(
+                start_month=months,
+                annual_rate=[4 + (month % 60) / 10 for month in months],
+                monthly_contribution=[500 + month for month in months],
+                annual_contribution=[None] * len(months),
+                compounding_frequency=[0] * len(months),
+            ),
+        )
+        name = f"calculate/{frequency.name.lower()}/50y/schedule-600"
+        cases[name] = lambda params=params: calculator.calculate(params)
+
+    # Whole-cent ledgers under each rounding policy
+    for rounding in RoundingPolicy:
+        cents_calculator = CompoundInterestCalculator(rounding=rounding)
+        for frequency in CompoundingFrequency:
+            params = CompoundInterestInput(
+                principal=10000,
+                annual_rate=7,
+                years=30,
+                monthly_contribution=500,
+                compounding_frequency=frequency,
+            )
+            name = f"cents/{rounding.value}/{frequency.name.lower()}/30y/monthly"
+            cases[name] = lambda params=params, calc=cents_calculator: calc.calculate(params)
+
+    # An interactive edit: extend the horizon by a year, then undo it
+    for years in HORIZONS:
+        session = CalculationSession()
+        params = CompoundInterestInput(principal=10000, annual_rate=7, years=years)
+        extended = replace(params, years=years + 1)
+        session.calculate(params)
+
+        def edit(session=session, params=params, extended=extended):
+            session.calculate(extended)
+            session.calculate(params)
+
+        cases[f"session/extend/{years}y"] = edit
+    return cases
+
+
+def api_benchmarks() -> dict[str, Callable[[], object]]:
+    """
+    Full POST /api/calculate, /api/sensitivity, /api/milestones and
+    /api/geo-arbitrage paths in-process.
+    """
+    import httpx
+
+    from firefly.api.main import app
+    from firefly.api.routes import calculator as calculator_routes
+
+    loop = asyncio.new_event_loop()
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+    def request(body: dict, breakdown: str) -> None:
+        # Measure the computation, not the result cache
+        calculator_routes.RESULT_CACHE.clear()
+        response = loop.run_until_complete(
+            client.post("/api/calculate", params={"breakdown": breakdown}, json=body)
+        )
+        response.raise_for_status()
+
+    def post(path: str, body: dict) -> None:
+        response = loop.run_until_complete(client.post(path, json=body))
+        response.raise_for_status()
+
+    cases = {}
+    for years in (10, 40):
+        for frequency in ("annually", "daily"):
+            body = {
+                "principal": 10000,
+                "annual_rate": 7,
+                "years": years,
+                "monthly_contribution": 500,
+                "compounding_frequency": frequency,
+            }
+            for breakdown in ("none", "yearly", "monthly"):
+                name = f"api/calculate/{frequency}/{years}y/{breakdown}"
+                cases[name] = lambda body=body, breakdown=breakdown: request(body, breakdown)
+            target = {**body, "target": 1_000_000}
+            cases[f"api/sensitivity/{frequency}/{years}y"] = lambda body=target: post(
+                "/api/sensitivity", body
+            )
+            # Dozens of balance milestones plus the crossover point
+            milestones = {
+                **body,
+                "inflation_rate": 3,
+                "milestones": [
+                    *({"amount": 25_000 * (k + 1)} for k in range(40)),
+                    {"amount": 40_000, "kind": "crossover"},
+                ],
+            }
+            cases[f"api/milestones/{frequency}/{years}y"] = lambda body=milestones: post(
+                "/api/milestones", body
+            )
+    geo = {"portfolio": 600_000, "annual_expenses": 60_000, "annual_savings": 30_000}
+    cases["api/geo-arbitrage/all"] = lambda: post("/api/geo-arbitrage", geo)
+    cases["api/geo-arbitrage/top10"] = lambda: post(
+        "/api/geo-arbitrage",
+        {**geo, "regions": ["europe", "asia"], "max_years_to_fi": 5, "limit": 10},
+    )
+    return cases
+
+
+def visualizer_benchmarks() -> dict[str, Callable[[], object]]:
+    """CompoundInterestVisualizer._generate_monthly_data, full and terminal-downsampled."""
+    from firefly.cli.visualizer import CompoundInterestVisualizer
+    from firefly.core.calculators.compound_interest import CompoundInterestCalculator
+    from firefly.core.models.compound_interest import CompoundingFrequency, CompoundInterestInput
+
+    visualizer = CompoundInterestVisualizer()
+    calculator = CompoundInterestCalculator()
+    cases = {}
+    for frequency in (CompoundingFrequency.MONTHLY, CompoundingFrequency.DAILY):
+        for years in (10, 50):
+            result = calculator.calculate(
+                CompoundInterestInput(
+                    principal=10000,
+                    annual_rate=7,
+                    years=years,
+                    monthly_contribution=500,
+                    compounding_frequency=frequency,
+                )
+            )
+            base = f"visualizer/monthly_data/{frequency.name.lower()}/{years}y"
+            cases[f"{base}/full"] = lambda result=result: visualizer._generate_monthly_data(result)
+            cases[f"{base}/200pts"] = lambda result=result: visualizer._generate_monthly_data(
+                result, max_points=200
+            )
+    return cases
+
+
+SUITES = {
+    "calculator": calculator_benchmarks,
+    "api": api_benchmarks,
+    "visualizer": visualizer_benchmarks,
+}
+
+
+def environment_metadata() -> dict:
+    """Describe the machine and code the timings were taken on."""
+    import numpy
+
+    import firefly
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=BENCH_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "git_commit": commit,
+        "firefly_version": firefly.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": numpy.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Print a comparison table and return the names of regressed benchmarks."""
+    regressions = []
+    print(f"\n{'benchmark':<52} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<52} {'-':>12} {current['median'] * 1e6:>10.1f}us {'new':>8}")
+            continue
+        change = current["median"] / previous["median"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<52} {previous['median'] * 1e6:>10.1f}us "
+            f"{current['median'] * 1e6:>10.1f}us {change:>+8.1%}{flag}"
+        )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--suite", choices=sorted(SUITES), action="append")
+    parser.add_argument("--filter", default="", help="only run benchmarks containing this text")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--min-round-time", type=float, default=0.1, help="seconds per round")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="allowed slowdown, e.g. 0.10 for 10%%"
+    )
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for suite in args.suite or SUITES:
+        try:
+            cases = SUITES[suite]()
+        except ImportError as e:
+            print(f"skipping {suite}: {e}", file=sys.stderr)
+            continue
+        for name, func in cases.items():
+            if args.filter in name:
+                results[name] = time_call(func, args.rounds, args.min_round_time)
+                print(f"{name:<52} {results[name]['median'] * 1e6:>10.1f}us")
+
+    report = {"metadata": environment_metadata(), "results": results}
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\nwrote {args.output}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"saved baseline {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(results, baseline["results"], args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""Firefly cold-start budget check.
+
+Runs each entry point in a fresh interpreter under `python -X importtime`
+and fails when its import time exceeds the budget. Only imports made by the
+entry point count; the interpreter's own startup (site, encodings) does not.
+
+Usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 9 --verbose
+    python benchmarks/startup.py --budget "import firefly=20"
+
+Exits with status 1 when any entry point is over budget.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# Entry point name -> code run with `python -c`
+ENTRY_POINTS = {
+    "import firefly": "import firefly",
+    "firefly --help": "from firefly.cli import main; main(['--help'])",
+    "import firefly.api.main": "import firefly.api.main",
+}
+
+# Import time budgets in milliseconds, with headroom over a typical laptop. The API
+# entry point's median ranged from 710ms to 845ms over repeated runs, nearly all of it
+# fastapi (which loads pydantic.v1 to vet route annotations), pydantic and numpy;
+# its budget leaves room for that spread so that only a real regression fails it
+DEFAULT_BUDGETS_MS = {
+    "import firefly": 15,
+    "firefly --help": 40,
+    "import firefly.api.main": 1200,
+}
+
+
+def parse_importtime(stderr: str) -> tuple[dict[str, float], dict[str, float]]:
+    """
+    Parse `-X importtime` output into seconds per module.
+
+    Returns the cumulative time of each top-level import and the self time
+    (excluding nested imports) of every module.
+    """
+    top_level, self_times = {}, {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|", 2)
+        self_times[name.strip()] = int(self_us) / 1e6
+        # Nested imports are indented two spaces per level past the first
+        if not name.startswith("  "):
+            top_level[name.strip()] = int(cumulative_us) / 1e6
+    return top_level, self_times
+
+
+def run_once(code: str) -> tuple[dict[str, float], dict[str, float], float]:
+    """Run `code` in a fresh interpreter; return its parsed import times and wall time."""
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise RuntimeError(f"{code!r} failed:\n{completed.stderr}")
+    return *parse_importtime(completed.stderr), wall
+
+
+def measure(code: str, runs: int, interpreter_modules: set[str]) -> dict:
+    """Median import time of `code` over `runs` fresh interpreters."""
+    totals, walls, self_times = [], [], {}
+    for _ in range(runs):
+        top_level, module_times, wall = run_once(code)
+        totals.append(sum(t for name, t in top_level.items() if name not in interpreter_modules))
+        walls.append(wall)
+        for name, seconds in module_times.items():
+            if name not in interpreter_modules:
+                self_times.setdefault(name, []).append(seconds)
+
+    return {
+        "import_time": statistics.median(totals),
+        "wall_time": statistics.median(walls),
+        "heaviest": sorted(
+            ((name, statistics.median(times)) for name, times in self_times.items()),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:8],
+    }
+
+
+def parse_budget(value: str) -> tuple[str, float]:
+    name, _, milliseconds = value.rpartition("=")
+    if name not in ENTRY_POINTS:
+        raise argparse.ArgumentTypeError(f"unknown entry point {name!r}")
+    return name, float(milliseconds)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget",
+        type=parse_budget,
+        action="append",
+        default=[],
+        help='override a budget, e.g. "import firefly=20" (milliseconds)',
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="show the modules with the highest self time"
+    )
+    args = parser.parse_args(argv)
+    budgets = {**DEFAULT_BUDGETS_MS, **dict(args.budget)}
+
+    # Whatever a bare interpreter imports is startup cost we can't influence
+    interpreter_modules = set(run_once("pass")[1])
+
+    over_budget = []
+    print(f"{'entry point':<28} {'import':>10} {'wall':>10} {'budget':>10}")
+    for name, code in ENTRY_POINTS.items():
+        result = measure(code, args.runs, interpreter_modules)
+        import_ms = result["import_time"] * 1000
+        flag = ""
+        if import_ms > budgets[name]:
+            over_budget.append(name)
+            flag = "  OVER BUDGET"
+        print(
+            f"{name:<28} {import_ms:>8.1f}ms {result['wall_time'] * 1000:>8.1f}ms "
+            f"{budgets[name]:>8.1f}ms{flag}"
+        )
+        if args.verbose:
+            for module, seconds in result["heaviest"]:
+                print(f"    {module:<40} {seconds * 1000:>8.1f}ms")
+
+    if over_budget:
+        print(f"\n{len(over_budget)} entry point(s) over their import-time budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,21 +3,144 @@
 A CLI tool for compound interest calculations and FIRE planning.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
-# Public API exports (for programmatic use)
-from firefly.core.calculators.compound_interest import CompoundInterestCalculator
-from firefly.core.models.compound_interest import (
-    CompoundingFrequency,
-    CompoundInterestInput,
-    CompoundInterestResult,
-    YearlyBreakdown,
-)
-
-__all__ = [
-    "CompoundInterestCalculator",
-    "CompoundInterestInput",
-    "CompoundInterestResult",
-    "YearlyBreakdown",
-    "CompoundingFrequency",
-]
+# Public API exports (for programmatic use). They are resolved on first
+# attribute access (PEP 562), so `import firefly` stays cheap for the CLI
+# and API entry points, which only need part of the package.
+_EXPORTS = {
+    "CompoundInterestCalculator": "firefly.core.calculators.compound_interest",
+    "CompoundInterestInput": "firefly.core.models.compound_interest",
+    "CompoundInterestResult": "firefly.core.models.compound_interest",
+    "YearlyBreakdown": "firefly.core.models.compound_interest",
+    "YearlyBreakdownTable": "firefly.core.models.compound_interest",
+    "Schedule": "firefly.core.models.compound_interest",
+    "ScheduleSegment": "firefly.core.models.compound_interest",
+    "CompoundingFrequency": "firefly.core.models.compound_interest",
+    "CalculationEngine": "firefly.core.models.compound_interest",
+    "RoundingPolicy": "firefly.core.models.compound_interest",
+    "CentsBreakdown": "firefly.core.models.compound_interest",
+    "BatchCompoundInterestCalculator": "firefly.core.calculators.batch",
+    "BatchCompoundInterestInput": "firefly.core.models.batch",
+    "BatchCompoundInterestResult": "firefly.core.models.batch",
+    "MonteCarloSimulator": "firefly.core.calculators.monte_carlo",
+    "MonteCarloInput": "firefly.core.models.monte_carlo",
+    "MonteCarloResult": "firefly.core.models.monte_carlo",
+    "ReturnDistribution": "firefly.core.models.monte_carlo",
+    "DistributionType": "firefly.core.models.monte_carlo",
+    "HistoricalBacktester": "firefly.core.calculators.backtest",
+    "BacktestInput": "firefly.core.models.backtest",
+    "BacktestResult": "firefly.core.models.backtest",
+    "FormulaSolver": "firefly.core.calculators.solver",
+    "FormulaSolverInput": "firefly.core.models.solver",
+    "FormulaSolverResult": "firefly.core.models.solver",
+    "SolveFor": "firefly.core.models.solver",
+    "SensitivityAnalyzer": "firefly.core.calculators.sensitivity",
+    "SensitivityInput": "firefly.core.models.sensitivity",
+    "SensitivityResult": "firefly.core.models.sensitivity",
+    "CoastFireCalculator": "firefly.core.calculators.coast_fire",
+    "CoastFireInput": "firefly.core.models.coast_fire",
+    "CoastFireResult": "firefly.core.models.coast_fire",
+    "DrawdownSimulator": "firefly.core.calculators.drawdown",
+    "DrawdownInput": "firefly.core.models.drawdown",
+    "DrawdownResult": "firefly.core.models.drawdown",
+    "WithdrawalStrategy": "firefly.core.models.drawdown",
+    "WithdrawalStrategyType": "firefly.core.models.drawdown",
+    "StrategyOutcome": "firefly.core.models.drawdown",
+    "MilestoneFinder": "firefly.core.calculators.milestones",
+    "Milestone": "firefly.core.models.milestones",
+    "MilestoneInput": "firefly.core.models.milestones",
+    "MilestoneKind": "firefly.core.models.milestones",
+    "MilestoneResult": "firefly.core.models.milestones",
+    "BatchMilestoneResult": "firefly.core.models.milestones",
+    "OneMoreYearCalculator": "firefly.core.calculators.one_more_year",
+    "OneMoreYearInput": "firefly.core.models.one_more_year",
+    "OneMoreYearResult": "firefly.core.models.one_more_year",
+    "GeoArbitrageCalculator": "firefly.core.calculators.geo_arbitrage",
+    "LocationTable": "firefly.core.calculators.geo_arbitrage",
+    "GeoArbitrageInput": "firefly.core.models.geo_arbitrage",
+    "GeoArbitrageResult": "firefly.core.models.geo_arbitrage",
+    "LocationOrder": "firefly.core.models.geo_arbitrage",
+    "LocationQuery": "firefly.core.models.geo_arbitrage",
+    "ResultCache": "firefly.core.cache",
+    "CalculationSession": "firefly.core.session",
+    "RecomputeCost": "firefly.core.session",
+}
+
+# Derived from _EXPORTS so the two can't diverge
+__all__ = [*_EXPORTS]
+
+if TYPE_CHECKING:
+    from firefly.core.cache import ResultCache
+    from firefly.core.calculators.backtest import HistoricalBacktester
+    from firefly.core.calculators.batch import BatchCompoundInterestCalculator
+    from firefly.core.calculators.coast_fire import CoastFireCalculator
+    from firefly.core.calculators.compound_interest import CompoundInterestCalculator
+    from firefly.core.calculators.drawdown import DrawdownSimulator
+    from firefly.core.calculators.geo_arbitrage import GeoArbitrageCalculator, LocationTable
+    from firefly.core.calculators.milestones import MilestoneFinder
+    from firefly.core.calculators.monte_carlo import MonteCarloSimulator
+    from firefly.core.calculators.one_more_year import OneMoreYearCalculator
+    from firefly.core.calculators.sensitivity import SensitivityAnalyzer
+    from firefly.core.calculators.solver import FormulaSolver
+    from firefly.core.models.backtest import BacktestInput, BacktestResult
+    from firefly.core.models.batch import BatchCompoundInterestInput, BatchCompoundInterestResult
+    from firefly.core.models.coast_fire import CoastFireInput, CoastFireResult
+    from firefly.core.models.compound_interest import (
+        CalculationEngine,
+        CentsBreakdown,
+        CompoundingFrequency,
+        CompoundInterestInput,
+        CompoundInterestResult,
+        RoundingPolicy,
+        Schedule,
+        ScheduleSegment,
+        YearlyBreakdown,
+        YearlyBreakdownTable,
+    )
+    from firefly.core.models.drawdown import (
+        DrawdownInput,
+        DrawdownResult,
+        StrategyOutcome,
+        WithdrawalStrategy,
+        WithdrawalStrategyType,
+    )
+    from firefly.core.models.geo_arbitrage import (
+        GeoArbitrageInput,
+        GeoArbitrageResult,
+        LocationOrder,
+        LocationQuery,
+    )
+    from firefly.core.models.milestones import (
+        BatchMilestoneResult,
+        Milestone,
+        MilestoneInput,
+        MilestoneKind,
+        MilestoneResult,
+    )
+    from firefly.core.models.monte_carlo import (
+        DistributionType,
+        MonteCarloInput,
+        MonteCarloResult,
+        ReturnDistribution,
+    )
+    from firefly.core.models.one_more_year import OneMoreYearInput, OneMoreYearResult
+    from firefly.core.models.sensitivity import SensitivityInput, SensitivityResult
+    from firefly.core.models.solver import FormulaSolverInput, FormulaSolverResult, SolveFor
+    from firefly.core.session import CalculationSession, RecomputeCost
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
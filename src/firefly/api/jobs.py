@@ -0,0 +1,231 @@
+"""Background jobs for long-running computations, run on a process pool."""
+
+import multiprocessing
+import os
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import BrokenExecutor, Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from threading import Lock
+from typing import Any
+
+
+class JobStatus(Enum):
+    """Lifecycle state of a job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def finished(self) -> bool:
+        return self in (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class JobQueueFull(Exception):
+    """Raised when a job is submitted while `max_pending` jobs are unfinished."""
+
+
+# One unit of work for the pool: a picklable module-level function and its arguments
+Task = tuple[Callable[..., Any], tuple]
+
+
+@dataclass(eq=False)
+class Job:
+    """
+    A submitted computation: one or more pool tasks plus a combine step.
+
+    Progress is the share of tasks completed, so jobs split into many tasks
+    (e.g. Monte Carlo chunks) report it in useful steps.
+    """
+
+    id: str
+    kind: str
+    created_at: float
+    total_tasks: int
+    status: JobStatus = JobStatus.QUEUED
+    completed_tasks: int = 0
+    finished_at: float | None = None
+    result: Any = None
+    error: str | None = None
+    futures: list[Future] = field(default_factory=list, repr=False)
+    combining: bool = field(default=False, repr=False)  # all tasks done, combine running
+
+    @property
+    def progress(self) -> float:
+        if self.status is JobStatus.SUCCEEDED:
+            return 1.0
+        return self.completed_tasks / self.total_tasks if self.total_tasks else 0.0
+
+
+def default_workers() -> int:
+    """Leave one CPU for the event loop and the interactive request threads."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+class JobManager:
+    """
+    Runs jobs on a process pool so heavy work never holds the GIL of the
+    process serving requests.
+
+    At most `max_pending` jobs may be queued or running at once; further
+    submissions raise JobQueueFull instead of growing the backlog. Finished
+    jobs are kept for `result_ttl` seconds (and at most `max_retained` of
+    them), then forgotten. The pool is started on first submission.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_pending: int = 16,
+        result_ttl: float = 600,
+        max_retained: int = 1024,
+        clock: Callable[[], float] = time.time,
+        executor_factory: Callable[[int], Executor] | None = None,
+    ):
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self.max_workers = max_workers or default_workers()
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self.max_retained = max_retained
+        self._clock = clock
+        self._executor_factory = executor_factory or _spawn_pool
+        self._executor: Executor | None = None
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._lock = Lock()
+
+    def submit(self, kind: str, tasks: list[Task], combine: Callable[[list], Any]) -> Job:
+        """
+        Queue `tasks` on the pool; once all succeed, `combine(results)` (with
+        results in task order) becomes the job's result.
+        """
+        with self._lock:
+            self._purge()
+            pending = sum(not job.status.finished for job in self._jobs.values())
+            if pending >= self.max_pending:
+                raise JobQueueFull(f"Job queue full ({pending} pending); try again later")
+
+            job = Job(
+                id=uuid.uuid4().hex,
+                kind=kind,
+                created_at=self._clock(),
+                total_tasks=len(tasks),
+            )
+            self._jobs[job.id] = job
+            if self._executor is None:
+                self._executor = self._executor_factory(self.max_workers)
+            try:
+                job.futures = [self._executor.submit(func, *args) for func, args in tasks]
+            except BrokenExecutor:
+                # A worker died; start a fresh pool for the next submission
+                del self._jobs[job.id]
+                self._executor = None
+                raise
+
+        if not tasks:
+            job.combining = True
+            self._finish(job, combine, [])
+        for future in job.futures:
+            future.add_done_callback(lambda _, job=job: self._task_done(job, combine))
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        """Return the job, or None if it is unknown or has expired."""
+        with self._lock:
+            self._purge()
+            job = self._jobs.get(job_id)
+            if job is not None and job.status is JobStatus.QUEUED:
+                if any(future.running() or future.done() for future in job.futures):
+                    job.status = JobStatus.RUNNING
+            return job
+
+    def cancel(self, job_id: str) -> Job | None:
+        """
+        Cancel a job. Tasks not yet started are dropped; tasks already running
+        in a worker finish, but their results are discarded.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status.finished:
+                return job
+            futures = job.futures
+            self._mark_finished(job, JobStatus.CANCELLED)
+        for future in futures:
+            future.cancel()
+        return job
+
+    def shutdown(self) -> None:
+        """Cancel queued tasks and stop the pool's workers."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _task_done(self, job: Job, combine: Callable[[list], Any]) -> None:
+        to_cancel, futures = [], None
+        with self._lock:
+            if job.status.finished or job.combining:
+                return
+            done = [future for future in job.futures if future.done() and not future.cancelled()]
+            job.completed_tasks = len(done)
+            failed = next((future for future in done if future.exception()), None)
+            if failed is not None:
+                # The job can't succeed any more; don't spend workers on the rest of it
+                to_cancel = job.futures
+                error = failed.exception()
+                self._mark_finished(job, JobStatus.FAILED, error=f"{type(error).__name__}: {error}")
+            elif job.completed_tasks < job.total_tasks:
+                job.status = JobStatus.RUNNING
+            else:
+                job.combining = True
+                futures = job.futures
+
+        # Outside the lock: cancel() runs done callbacks inline
+        for future in to_cancel:
+            future.cancel()
+        if futures is not None:
+            self._finish(job, combine, [future.result() for future in futures])
+
+    def _finish(self, job: Job, combine: Callable[[list], Any], results: list) -> None:
+        # Combine outside the lock: it may take a while for large jobs
+        try:
+            result = combine(results)
+        except Exception as e:
+            status, result, error = JobStatus.FAILED, None, f"{type(e).__name__}: {e}"
+        else:
+            status, error = JobStatus.SUCCEEDED, None
+        with self._lock:
+            if not job.status.finished:  # may have been cancelled meanwhile
+                self._mark_finished(job, status, result=result, error=error)
+
+    def _mark_finished(self, job: Job, status: JobStatus, result=None, error=None) -> None:
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = self._clock()
+        job.futures = []  # results now live on the job (or were discarded)
+
+    def _purge(self) -> None:
+        """Drop expired finished jobs, then the oldest finished ones beyond max_retained."""
+        now = self._clock()
+        finished = [job for job in self._jobs.values() if job.status.finished]
+        for job in finished:
+            if now - job.finished_at >= self.result_ttl:
+                del self._jobs[job.id]
+        finished = [job for job in finished if job.id in self._jobs]
+        for job in finished[: max(0, len(finished) - self.max_retained)]:
+            del self._jobs[job.id]
+
+
+def _spawn_pool(max_workers: int) -> ProcessPoolExecutor:
+    # Forking a process that runs server threads can copy held locks, so
+    # workers start fresh; thanks to lazy imports they only load what they run
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
@@ -1,14 +1,36 @@
 """Main FastAPI Application"""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
+from firefly.api.metrics import CONTENT_TYPE, REGISTRY, MetricsMiddleware
 from firefly.api.routes.calculator import router as calculator_routes
+from firefly.api.routes.coast_fire import router as coast_fire_routes
+from firefly.api.routes.export import router as export_routes
+from firefly.api.routes.geo_arbitrage import router as geo_arbitrage_routes
+from firefly.api.routes.jobs import JOB_MANAGER
+from firefly.api.routes.jobs import router as job_routes
+from firefly.api.routes.milestones import router as milestone_routes
+from firefly.api.routes.one_more_year import router as one_more_year_routes
+from firefly.api.routes.sensitivity import router as sensitivity_routes
+from firefly.api.routes.solver import router as solver_routes
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Stop job workers with the server instead of leaving them orphaned
+    JOB_MANAGER.shutdown()
+
 
 app = FastAPI(
     title="LikeAFirefly API",
     description="The greatest tool to assist you on your path to FIRE",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -17,10 +39,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "Content-Disposition"],
 )
+# Added last so it wraps the whole stack, CORS included
+app.add_middleware(MetricsMiddleware)
 
 # Include routers
 app.include_router(calculator_routes)
+app.include_router(solver_routes)
+app.include_router(job_routes)
+app.include_router(sensitivity_routes)
+app.include_router(coast_fire_routes)
+app.include_router(export_routes)
+app.include_router(milestone_routes)
+app.include_router(one_more_year_routes)
+app.include_router(geo_arbitrage_routes)
 
 
 @app.get("/")
@@ -33,3 +66,9 @@ def root():
 def health():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Request latency and calculation size metrics in Prometheus text format."""
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
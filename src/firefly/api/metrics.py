@@ -0,0 +1,263 @@
+"""Request instrumentation: latency histograms, Server-Timing headers, /metrics."""
+
+import math
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from firefly.core.models.compound_interest import CompoundingFrequency
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+# Compounding periods per calculation: from one year annually up to 100 years daily
+PERIOD_BUCKETS = (1, 12, 60, 120, 365, 600, 1200, 3650, 7300, 10950, 18250, 36500)
+
+# Route label for requests no route matched, so 404 probes can't grow the label set
+UNMATCHED_ROUTE = "<unmatched>"
+
+# Methods recorded under their own name; clients may send any token, so the
+# rest share one label value
+HTTP_METHODS = frozenset(
+    {"GET", "HEAD", "POST", "PUT", "DELETE", "CONNECT", "OPTIONS", "TRACE", "PATCH"}
+)
+OTHER_METHOD = "other"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter, one series per combination of label values."""
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = tuple(labels[name] for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            lines.append(f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram, one series per combination of label values."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: tuple[float, ...],
+        labels: tuple[str, ...] = (),
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self.labels = labels
+        # Per series: a count per bucket (plus overflow), then sum and count
+        self._series: dict[tuple[str, ...], list[float]] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(labels[name] for name in self.labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 3)
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = sorted((key, list(series)) for key, series in self._series.items())
+
+        for key, series in snapshot:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), series, strict=False):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                labels = _format_labels(self.labels, key, le)
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{labels} {series[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together in Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: list[Counter | Histogram] = []
+
+    def register[M: (Counter, Histogram)](self, metric: M) -> M:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(line for metric in self._metrics for line in metric.render()) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_DURATION = REGISTRY.register(
+    Histogram(
+        "firefly_http_request_duration_seconds",
+        "Time from receiving a request to finishing its response.",
+        LATENCY_BUCKETS,
+        labels=("method", "route", "status"),
+    )
+)
+PHASE_DURATION = REGISTRY.register(
+    Histogram(
+        "firefly_http_request_phase_duration_seconds",
+        "Time spent per request in each phase: validate, calc, serialize.",
+        LATENCY_BUCKETS,
+        labels=("route", "phase"),
+    )
+)
+CALCULATION_PERIODS = REGISTRY.register(
+    Histogram(
+        "firefly_calculation_periods",
+        "Size of each compound interest calculation, in compounding periods (years x n).",
+        PERIOD_BUCKETS,
+        labels=("frequency",),
+    )
+)
+CALCULATED_PERIODS = REGISTRY.register(
+    Counter(
+        "firefly_calculated_periods_total",
+        "Compounding periods calculated across all requests.",
+        labels=("frequency",),
+    )
+)
+
+
+def record_calculation(frequency: CompoundingFrequency, years: float) -> None:
+    """Count one calculation covering `years` at the given compounding frequency."""
+    periods = years * frequency.value
+    label = frequency.name.lower()
+    CALCULATION_PERIODS.observe(periods, frequency=label)
+    CALCULATED_PERIODS.inc(periods, frequency=label)
+
+
+class RequestTimings:
+    """Phase durations collected while one request is handled."""
+
+    def __init__(self):
+        self.start = perf_counter()
+        self.phases: dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def server_timing(self) -> str:
+        """Server-Timing header value, durations in milliseconds."""
+        entries = [f"{phase};dur={seconds * 1000:.3f}" for phase, seconds in self.phases.items()]
+        entries.append(f"total;dur={(perf_counter() - self.start) * 1000:.3f}")
+        return ", ".join(entries)
+
+
+_current_timings: ContextVar[RequestTimings | None] = ContextVar(
+    "firefly_request_timings", default=None
+)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """
+    Attribute the enclosed block to `phase` of the current request.
+
+    The time before a request's first phase (routing, reading the body and
+    validating it) is recorded as `validate`. Outside a request this is a
+    no-op, so core code paths can be timed without caring who calls them.
+    """
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+
+    start = perf_counter()
+    if not timings.phases:
+        timings.add("validate", start - timings.start)
+    try:
+        yield
+    finally:
+        timings.add(phase, perf_counter() - start)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route latency and phase histograms.
+
+    Adds a Server-Timing header with the phases finished before the response
+    starts; for streamed responses later phases still reach the histograms.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", timings.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_timings.reset(token)
+            duration = perf_counter() - timings.start
+            # The router stores the matched route in the scope; use its path
+            # template so /items/1 and /items/2 share a series
+            route = scope.get("route")
+            path = getattr(route, "path", UNMATCHED_ROUTE)
+            method = scope["method"] if scope["method"] in HTTP_METHODS else OTHER_METHOD
+            REQUEST_DURATION.observe(duration, method=method, route=path, status=str(status))
+            for phase, seconds in timings.phases.items():
+                PHASE_DURATION.observe(seconds, route=path, phase=phase)
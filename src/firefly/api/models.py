@@ -1,6 +1,20 @@
 """API request and response models."""
 
-from pydantic import BaseModel, Field
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+# Granularity of the breakdown returned with a calculation
+Breakdown = Literal["none", "yearly", "monthly"]
+
+# File formats for exported breakdowns
+ExportFormatName = Literal["csv", "jsonl", "arrow", "parquet"]
+
+# Conditions a milestone can wait for
+MilestoneKindName = Literal["balance", "real_balance", "crossover"]
+
+# Order of the locations in a geographic arbitrage comparison
+LocationOrderName = Literal["cheapest", "most_expensive"]
 
 
 class CalculateRequest(BaseModel):
@@ -19,6 +33,61 @@ class CalculateRequest(BaseModel):
     compounding_frequency: str = Field(
         "annually", description="How often interest compounds: 'daily', 'monthly', or 'annually'"
     )
+    inflation_rate: float = Field(
+        0, description="Annual inflation as a percentage, for balances in today's dollars", gt=-100
+    )
+    tax_drag: float = Field(
+        0,
+        description="Annual return lost to taxes, in percentage points; the after-tax rate "
+        "must stay above -100%",
+        ge=0,
+    )
+
+    @model_validator(mode="after")
+    def _after_tax_rate_above_total_loss(self):
+        if self.tax_drag > 0 and self.annual_rate - self.tax_drag <= -100:
+            raise ValueError("tax_drag must leave the after-tax rate above -100%")
+        return self
+
+
+class BatchCalculateItem(CalculateRequest):
+    """One scenario of a batch calculation. Batches take no schedules, nor any other field."""
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ScheduleSegmentItem(BaseModel):
+    """Change to a plan's inputs from a given month on; omitted fields are left as they were."""
+
+    start_month: int = Field(description="Months from the start of the plan", ge=0)
+    annual_rate: float | None = Field(None, description="New annual return rate as a percentage")
+    monthly_contribution: float | None = Field(
+        None, description="New monthly contribution in dollars", ge=0
+    )
+    annual_contribution: float | None = Field(
+        None, description="New annual contribution in dollars", ge=0
+    )
+    compounding_frequency: str | None = Field(
+        None, description="New compounding: 'daily', 'monthly', or 'annually'"
+    )
+
+
+class ScheduledCalculateRequest(CalculateRequest):
+    """Calculation request whose inputs may change over time."""
+
+    schedule: list[ScheduleSegmentItem] = Field(
+        [],
+        description="Changes to the rate, contributions or compounding, each lasting "
+        "until the next one starts",
+    )
+
+
+class CalculateQuery(CalculateRequest):
+    """Query parameters for the GET form of the calculation endpoint."""
+
+    breakdown: Breakdown = Field(
+        "yearly", description="Breakdown to include: 'none', 'yearly', or 'monthly'"
+    )
 
 
 class YearlyBreakdownItem(BaseModel):
@@ -29,6 +98,18 @@ class YearlyBreakdownItem(BaseModel):
     contributions: float
     interest_earned: float
     ending_balance: float
+    real_ending_balance: float
+    after_tax_ending_balance: float
+
+
+class MonthlyBreakdownItem(BaseModel):
+    """Single month's breakdown data."""
+
+    month: int
+    starting_balance: float
+    contributions: float
+    interest_earned: float
+    ending_balance: float
 
 
 class CalculateResponse(BaseModel):
@@ -37,6 +118,337 @@ class CalculateResponse(BaseModel):
     final_amount: float = Field(description="Total portfolio value at the end")
     total_contributions: float = Field(description="Sum of all contributions made")
     total_interest: float = Field(description="Total interest earned over the period")
-    yearly_breakdown: list[YearlyBreakdownItem] = Field(
-        description="Year-by-year breakdown for graphing"
+    real_final_amount: float = Field(description="Final amount in today's dollars")
+    after_tax_final_amount: float = Field(description="Final amount after tax drag")
+    yearly_breakdown: list[YearlyBreakdownItem] | None = Field(
+        None, description="Year-by-year breakdown for graphing (breakdown=yearly)"
+    )
+    monthly_breakdown: list[MonthlyBreakdownItem] | None = Field(
+        None, description="Month-by-month breakdown for graphing (breakdown=monthly)"
+    )
+
+
+class SolveRequest(BaseModel):
+    """Request model for the FIRE formula solver."""
+
+    solve_for: str = Field(
+        description="Variable to solve for: 'savings_rate', 'return_rate', 'fi_multiplier', "
+        "or 'years'"
+    )
+    savings_rate: float | None = Field(
+        None, description="Percentage of income saved (e.g., 50 for 50%)", ge=0, lt=100
+    )
+    return_rate: float | None = Field(
+        None, description="Real annual return as a percentage (e.g., 5 for 5%)", gt=-100
+    )
+    fi_multiplier: float | None = Field(
+        None, description="FI number as a multiple of annual expenses (25 for the 4% rule)", gt=0
+    )
+    years: float | None = Field(None, description="Years until financial independence", ge=0)
+    portfolio_multiple: float = Field(
+        0, description="Current portfolio as a multiple of annual income", ge=0
+    )
+
+
+class SolveResponse(BaseModel):
+    """Response model with the solved variable."""
+
+    solve_for: str = Field(description="Variable that was solved for")
+    value: float | None = Field(description="Solved value, or null if no solution exists")
+    feasible: bool = Field(description="Whether the inputs admit a solution")
+
+
+class CalculateJobRequest(BaseModel):
+    """Job computing a compound interest calculation in the background."""
+
+    kind: Literal["calculate"]
+    params: ScheduledCalculateRequest
+    breakdown: Breakdown = Field(
+        "yearly", description="Breakdown to include: 'none', 'yearly', or 'monthly'"
+    )
+
+
+class MonteCarloJobRequest(BaseModel):
+    """Job simulating a plan under random returns."""
+
+    kind: Literal["monte_carlo"]
+    plan: CalculateRequest = Field(description="Plan to simulate; its annual_rate is ignored")
+    mean_return: float = Field(
+        description="Expected annual return as a percentage, compounded like annual_rate"
+    )
+    volatility: float = Field(description="Annual standard deviation as a percentage", ge=0)
+    distribution: str = Field(
+        "lognormal", description="Return distribution: 'normal' or 'lognormal'"
+    )
+    num_paths: int = Field(100_000, description="Number of simulated paths", gt=0, le=1_000_000)
+    seed: int | None = Field(None, description="Seed for reproducible results", ge=0)
+    target: float | None = Field(None, description="Balance to reach by the end of the plan")
+    percentiles: list[float] = Field(
+        [5, 25, 50, 75, 95], description="Percentiles to report", min_length=1
+    )
+
+
+JobRequest = Annotated[CalculateJobRequest | MonteCarloJobRequest, Field(discriminator="kind")]
+
+
+class JobResponse(BaseModel):
+    """Status of a background job."""
+
+    id: str = Field(description="Job identifier")
+    kind: str = Field(description="Kind of computation: 'calculate' or 'monte_carlo'")
+    status: str = Field(
+        description="One of 'queued', 'running', 'succeeded', 'failed', or 'cancelled'"
+    )
+    progress: float = Field(description="Share of the work completed, from 0 to 1")
+    created_at: float = Field(description="Submission time, as a Unix timestamp")
+    finished_at: float | None = Field(None, description="Completion time, as a Unix timestamp")
+    error: str | None = Field(None, description="Failure reason, for failed jobs")
+
+
+class MonteCarloResponse(BaseModel):
+    """Result of a Monte Carlo job."""
+
+    percentiles: list[float]
+    yearly_percentiles: list[list[float]] = Field(
+        description="yearly_percentiles[p][y]: percentiles[p] of the balance after year y + 1"
+    )
+    final_amount_percentiles: list[float]
+    mean_final_amount: float
+    success_probability: float | None = Field(
+        description="Share of paths ending at or above target, if a target was given"
+    )
+    num_paths: int
+
+
+class SensitivityRequest(CalculateRequest):
+    """Request model for sensitivity analysis of a calculation."""
+
+    target: float | None = Field(
+        None, description="Balance whose time to reach is also analysed", gt=0
+    )
+    relative_steps: list[float] = Field(
+        [-0.10, -0.05, 0.05, 0.10],
+        description="Fractional changes applied to principal, time and contributions",
+    )
+    rate_steps: list[float] = Field(
+        [-2.0, -1.0, 1.0, 2.0], description="Changes to annual_rate in percentage points"
+    )
+
+
+class TornadoBarItem(BaseModel):
+    """Range of outcomes over one input's perturbations."""
+
+    field: str
+    low_value: float
+    high_value: float
+    low_final_amount: float
+    high_final_amount: float
+    swing: float
+
+
+class PerturbationGridItem(BaseModel):
+    """Outcomes with one input varied, the others held fixed."""
+
+    field: str
+    values: list[float]
+    final_amount: list[float]
+    time_to_target: list[float | None] | None = Field(
+        description="Years to reach target per value; null entries never reach it"
+    )
+
+
+class SensitivityResponse(BaseModel):
+    """Response model with gradients and tornado chart data."""
+
+    final_amount: float
+    time_to_target: float | None = Field(description="Years to reach target, if given")
+    final_amount_gradient: dict[str, float | None] = Field(
+        description="d(final_amount)/d(field), per unit of each input; null if undefined"
+    )
+    time_to_target_gradient: dict[str, float | None] | None = Field(
+        description="d(time_to_target)/d(field) in years, if a target was given"
+    )
+    tornado: list[TornadoBarItem] = Field(description="Bars ordered by swing, widest first")
+    grid: list[PerturbationGridItem]
+
+
+class CoastFireRequest(BaseModel):
+    """Request model for a Coast FIRE curve."""
+
+    current_age: float = Field(description="Age today", ge=0, le=120)
+    current_portfolio: float = Field(description="Portfolio value today in dollars", ge=0)
+    fi_target: float = Field(description="Portfolio needed for financial independence", gt=0)
+    annual_rate: float = Field(description="Annual return rate as a percentage (e.g., 7 for 7%)")
+    target_ages: list[float] | None = Field(
+        None, description="Ages to evaluate; defaults to every age up to max_age", max_length=1000
+    )
+    max_age: int = Field(100, description="Last age of the default age range", le=120)
+    compounding_frequency: str = Field(
+        "annually", description="How often interest compounds: 'daily', 'monthly', or 'annually'"
+    )
+
+
+class CoastFireResponse(BaseModel):
+    """Response model with the Coast FIRE curve, one entry per age in each list."""
+
+    ages: list[float]
+    required_now: list[float] = Field(
+        description="Portfolio needed today to coast to fi_target by each age"
+    )
+    projected_balance: list[float] = Field(
+        description="Current portfolio grown without contributions to each age"
+    )
+    coast_gap: list[float] = Field(description="Shortfall of today's portfolio, zero if on track")
+    fi_age: float | None = Field(
+        description="End of the first period by which the current portfolio alone reaches "
+        "fi_target, as an age; null if never"
+    )
+
+
+class MilestoneItem(BaseModel):
+    """A balance, or a crossover point, to locate on a plan."""
+
+    amount: float = Field(
+        description="Balance to reach, or annual expenses (today's dollars) for a crossover"
+    )
+    kind: MilestoneKindName = Field(
+        "balance",
+        description="'balance', 'real_balance' (in today's dollars), or 'crossover' "
+        "(a year's returns cover the expenses)",
+    )
+
+
+class MilestonesRequest(ScheduledCalculateRequest):
+    """Request model for locating milestones on a plan."""
+
+    milestones: list[MilestoneItem] = Field(
+        description="Milestones to locate", min_length=1, max_length=1000
+    )
+
+
+class MilestoneResultItem(BaseModel):
+    """When one milestone is first reached."""
+
+    amount: float
+    kind: str
+    reached: bool = Field(description="Whether the milestone is reached within the plan")
+    years: float | None = Field(description="Years from the start; null if never reached")
+    month: int | None = Field(description="Month of the plan it is reached in (0: already)")
+    balance: float | None = Field(description="Nominal balance at that point")
+
+
+class MilestonesResponse(BaseModel):
+    """Response model with one entry per requested milestone, in request order."""
+
+    milestones: list[MilestoneResultItem]
+
+
+class OneMoreYearRequest(BaseModel):
+    """Request model for the One More Year calculator."""
+
+    current_portfolio: float = Field(description="Portfolio value today in dollars", ge=0)
+    monthly_expenses: float = Field(description="Monthly expenses in today's dollars", gt=0)
+    savings_rate: float = Field(
+        description="Percentage of income saved while working (e.g., 50 for 50%)", ge=0, lt=100
     )
+    annual_rate: float = Field(description="Real annual return as a percentage (e.g., 5 for 5%)")
+    withdrawal_rate: float = Field(
+        4.0, description="Safe withdrawal rate as a percentage", gt=0, le=100
+    )
+    max_years: int = Field(10, description="Additional working years to tabulate", ge=0, le=100)
+    compounding_frequency: str = Field(
+        "monthly", description="How often interest compounds: 'daily', 'monthly', or 'annually'"
+    )
+
+
+class OneMoreYearRow(BaseModel):
+    """Retiring after a given number of additional working years."""
+
+    year: int = Field(description="Additional working years (0: retire now)")
+    months_worked: int = Field(description="Months of freedom given up")
+    portfolio: float
+    sustainable_withdrawal: float = Field(description="Annual withdrawal the portfolio supports")
+    percent_of_fi: float = Field(description="Sustainable withdrawal as a percentage of expenses")
+    withdrawal_increase: float | None = Field(
+        description="Gain in sustainable withdrawal over the previous year; null for year 0"
+    )
+    percent_of_fi_increase: float | None = Field(
+        description="Gain in percent_of_fi over the previous year, in percentage points"
+    )
+    relative_increase: float | None = Field(
+        description="withdrawal_increase as a percentage of the previous year's withdrawal; "
+        "shrinking values are the diminishing returns"
+    )
+
+
+class OneMoreYearResponse(BaseModel):
+    """Response model with the marginal value of each additional working year."""
+
+    fi_number: float = Field(description="Portfolio whose sustainable withdrawal covers expenses")
+    fi_years: float | None = Field(
+        description="Years of work until the FI number (may exceed max_years); null if never"
+    )
+    table: list[OneMoreYearRow]
+
+
+class GeoArbitrageRequest(BaseModel):
+    """Request model for a geographic arbitrage comparison."""
+
+    portfolio: float = Field(description="Portfolio value today in dollars", ge=0)
+    annual_expenses: float = Field(description="Annual expenses at home in today's dollars", gt=0)
+    home_location: str | None = Field(
+        None, description="Name of the home city in the cost-of-living table"
+    )
+    home_cost_index: float | None = Field(
+        None,
+        description="Cost index at home (US average = 100); used when home_location is not "
+        "given, and 100 if neither is",
+        gt=0,
+    )
+    annual_savings: float = Field(0.0, description="Savings added each year until FI", ge=0)
+    annual_rate: float = Field(
+        5.0, description="Real annual return as a percentage (e.g., 5 for 5%)"
+    )
+    withdrawal_rate: float = Field(
+        4.0, description="Safe withdrawal rate as a percentage", gt=0, le=100
+    )
+    compounding_frequency: str = Field(
+        "monthly", description="How often interest compounds: 'daily', 'monthly', or 'annually'"
+    )
+    countries: list[str] | None = Field(
+        None, description="Only these countries (ISO 3166 codes, e.g. 'PT')"
+    )
+    regions: list[str] | None = Field(None, description="Only these regions (e.g. 'europe')")
+    max_cost_index: float | None = Field(None, description="Only locations at most this costly")
+    fi_now: bool = Field(False, description="Only locations where the portfolio already suffices")
+    max_years_to_fi: float | None = Field(
+        None, description="Only locations reached within this many years", ge=0
+    )
+    order: LocationOrderName = Field("cheapest", description="Order of the returned locations")
+    limit: int | None = Field(None, description="Return at most this many locations", ge=1)
+
+
+class GeoArbitrageLocation(BaseModel):
+    """The plan's outcome in one location."""
+
+    name: str
+    country: str
+    region: str
+    cost_index: float = Field(description="Relative cost of living (US average = 100)")
+    annual_expenses: float = Field(description="Cost of the home lifestyle there")
+    fi_number: float = Field(description="Portfolio whose sustainable withdrawal covers it")
+    years_to_fi: float | None = Field(description="Years until FI there; null if never")
+    percent_of_fi: float = Field(
+        description="Sustainable withdrawal as a percentage of expenses there"
+    )
+    home_spending: float = Field(
+        description="Purchasing power of the sustainable withdrawal there, in home dollars"
+    )
+
+
+class GeoArbitrageResponse(BaseModel):
+    """Response model with the plan evaluated in each selected location."""
+
+    home_cost_index: float
+    total_matches: int = Field(description="Locations passing the filters, before the limit")
+    locations: list[GeoArbitrageLocation]
@@ -1,10 +1,37 @@
 """Calculator API Routes"""
 
-from fastapi import APIRouter, HTTPException
+import hashlib
+from collections.abc import Iterator
+from typing import Annotated, Any
 
-from firefly.api.models import CalculateRequest, CalculateResponse, YearlyBreakdownItem
+import numpy as np
+import orjson
+from fastapi import APIRouter, Body, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+
+from firefly.api.metrics import record_calculation, timed
+from firefly.api.models import (
+    BatchCalculateItem,
+    Breakdown,
+    CalculateQuery,
+    CalculateRequest,
+    CalculateResponse,
+    ScheduledCalculateRequest,
+    ScheduleSegmentItem,
+)
+from firefly.core.cache import ResultCache
+from firefly.core.calculators.batch import BatchCompoundInterestCalculator
 from firefly.core.calculators.compound_interest import CompoundInterestCalculator
-from firefly.core.models.compound_interest import CompoundingFrequency, CompoundInterestInput
+from firefly.core.models.batch import BatchCompoundInterestInput, BatchCompoundInterestResult
+from firefly.core.models.compound_interest import (
+    CompoundingFrequency,
+    CompoundInterestInput,
+    CompoundInterestResult,
+    Schedule,
+    ScheduleSegment,
+    YearlyBreakdownTable,
+)
 
 router = APIRouter()
 
@@ -15,21 +42,79 @@ FREQUENCY_MAP = {
     "annually": CompoundingFrequency.ANNUALLY,
 }
 
+# Results are deterministic, so clients and CDNs may reuse them for this long
+CACHE_MAX_AGE_SECONDS = 3600
+
+# Shared across requests: traffic is dominated by a handful of default scenarios
+RESULT_CACHE = ResultCache(max_size=1024, ttl=CACHE_MAX_AGE_SECONDS)
+calculator = CompoundInterestCalculator(cache=RESULT_CACHE)
+
+# Part of every ETag: bump whenever results or the response shape change, so
+# that ETags clients hold from earlier responses stop matching
+RESPONSE_VERSION = 2
+
+# Scenarios computed together before their NDJSON lines are flushed
+BATCH_CHUNK_SIZE = 256
+
+
+def _invalid_frequency_message(value: str) -> str:
+    return f"Invalid compounding_frequency: {value}. Must be 'daily', 'monthly', or 'annually'."
+
+
+def _etag(params: CompoundInterestInput, breakdown: Breakdown) -> str:
+    """Strong ETag derived from the normalized inputs and the response version."""
+    key = (RESPONSE_VERSION, params.cache_key(), breakdown)
+    digest = hashlib.sha256(repr(key).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _etag_matches(etag: str, if_none_match: str | None) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
 
 @router.post("/api/calculate", response_model=CalculateResponse)
-def calculate(request: CalculateRequest) -> CalculateResponse:
-    """Calculate compound interest based on input parameters."""
+def calculate(request: ScheduledCalculateRequest, breakdown: Breakdown = "yearly") -> Response:
+    """
+    Calculate compound interest based on input parameters.
 
-    # Convert string to enum
-    compounding_freq = FREQUENCY_MAP.get(request.compounding_frequency.lower())
+    `breakdown` selects the detail returned alongside the totals: `yearly`
+    (default), `monthly`, or `none` for clients that only need the totals.
+    An optional `schedule` changes the inputs part way through the plan.
+    Responses to POST aren't cacheable; use GET for conditional requests.
+    """
+    return _calculate(request, breakdown, cacheable=False)
+
+
+@router.get("/api/calculate", response_model=CalculateResponse)
+def calculate_get(
+    request: Annotated[CalculateQuery, Query()],
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Cacheable GET form of /api/calculate, taking the inputs as query parameters."""
+    return _calculate(request, request.breakdown, cacheable=True, if_none_match=if_none_match)
+
+
+def compounding_frequency(value: str) -> CompoundingFrequency:
+    """Convert a compounding_frequency string to the enum, rejecting unknown values."""
+    compounding_freq = FREQUENCY_MAP.get(value.lower())
     if not compounding_freq:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid compounding_frequency: {request.compounding_frequency}. Must be 'daily', 'monthly', or 'annually'.",
-        )
+        raise HTTPException(status_code=400, detail=_invalid_frequency_message(value))
+    return compounding_freq
+
+
+def compound_interest_input(request: CalculateRequest) -> CompoundInterestInput:
+    """Convert an API request to the core input model, rejecting unknown frequencies."""
+    # Convert string to enum
+    compounding_freq = compounding_frequency(request.compounding_frequency)
+    schedule = None
+    if isinstance(request, ScheduledCalculateRequest) and request.schedule:
+        schedule = schedule_input(request.schedule)
 
     # Create core model from API request
-    params = CompoundInterestInput(
+    return CompoundInterestInput(
         principal=request.principal,
         annual_rate=request.annual_rate,
         years=request.years,
@@ -37,27 +122,181 @@ def calculate(request: CalculateRequest) -> CalculateResponse:
         monthly_contribution=request.monthly_contribution,
         annual_contribution=request.annual_contribution,
         compounding_frequency=compounding_freq,
+        inflation_rate=request.inflation_rate,
+        tax_drag=request.tax_drag,
+        schedule=schedule,
+    )
+
+
+def schedule_input(items: list[ScheduleSegmentItem]) -> Schedule:
+    """Convert API schedule segments to a core schedule, rejecting unknown frequencies."""
+    return Schedule.from_segments(
+        ScheduleSegment(
+            start_month=item.start_month,
+            annual_rate=item.annual_rate,
+            monthly_contribution=item.monthly_contribution,
+            annual_contribution=item.annual_contribution,
+            compounding_frequency=(
+                compounding_frequency(item.compounding_frequency)
+                if item.compounding_frequency is not None
+                else None
+            ),
+        )
+        for item in items
     )
 
+
+def _calculate(
+    request: CalculateRequest,
+    breakdown: Breakdown,
+    cacheable: bool,
+    if_none_match: str | None = None,
+) -> Response:
+    params = compound_interest_input(request)
+
+    cache_headers = {"ETag": _etag(params, breakdown)}
+    if cacheable:
+        cache_headers["Cache-Control"] = f"public, max-age={CACHE_MAX_AGE_SECONDS}"
+        if _etag_matches(cache_headers["ETag"], if_none_match):
+            return Response(status_code=304, headers=cache_headers)
+
     # Calculate using core logic
-    calculator = CompoundInterestCalculator()
-    result = calculator.calculate(params)
-
-    # Convert core result to API response
-    yearly_breakdown = [
-        YearlyBreakdownItem(
-            year=yb.year,
-            starting_balance=yb.starting_balance,
-            contributions=yb.contributions,
-            interest_earned=yb.interest_earned,
-            ending_balance=yb.ending_balance,
+    with timed("calc"):
+        result = calculator.calculate(params)
+    record_calculation(params.compounding_frequency, params.total_periods)
+
+    # Serialize the core result directly: the payload is built from plain
+    # floats, so validating it again through response_model would only cost time
+    with timed("serialize"):
+        content = orjson.dumps(response_payload(result, breakdown))
+    return Response(content=content, media_type="application/json", headers=cache_headers)
+
+
+def response_payload(result: CompoundInterestResult, breakdown: Breakdown) -> dict:
+    """Build a CalculateResponse-shaped dict from a core result."""
+    payload = {
+        "final_amount": result.final_amount,
+        "total_contributions": result.total_contributions,
+        "total_interest": result.total_interest,
+        "real_final_amount": result.real_final_amount,
+        "after_tax_final_amount": result.after_tax_final_amount,
+        "yearly_breakdown": None,
+        "monthly_breakdown": None,
+    }
+
+    if breakdown == "yearly":
+        payload["yearly_breakdown"] = result.yearly_breakdown.to_rows()
+    elif breakdown == "monthly":
+        columns = calculator.timeline(result.input_params).interval_columns()
+        names = ["month", *columns]
+        values = [range(1, len(columns["ending_balance"]) + 1)]
+        values += [column.tolist() for column in columns.values()]
+        payload["monthly_breakdown"] = [
+            dict(zip(names, row, strict=True)) for row in zip(*values, strict=True)
+        ]
+
+    return payload
+
+
+@router.post("/api/calculate/batch")
+def calculate_batch(
+    requests: Annotated[list[Any], Body(description="Scenarios shaped like BatchCalculateItem")],
+) -> StreamingResponse:
+    """
+    Calculate many scenarios in one call, streamed back as NDJSON.
+
+    Each output line is `{"index": i, "result": {...}}` with the same shape
+    as /api/calculate, or `{"index": i, "error": "..."}` for a scenario that
+    could not be calculated. Scenarios are validated one by one, so an
+    invalid one never rejects the rest. Lines are emitted in request order.
+    """
+    return StreamingResponse(_stream_batch(requests), media_type="application/x-ndjson")
+
+
+def _stream_batch(items: list[Any]) -> Iterator[bytes]:
+    calculator = BatchCompoundInterestCalculator()
+
+    for offset in range(0, len(items), BATCH_CHUNK_SIZE):
+        parsed = [_parse_batch_item(item) for item in items[offset : offset + BATCH_CHUNK_SIZE]]
+        valid = [scenario for scenario in parsed if not isinstance(scenario, str)]
+
+        result = None
+        if valid:
+            requests = [req for req, _ in valid]
+            frequencies = [freq for _, freq in valid]
+            batch = batch_input(requests, frequencies)
+            with timed("calc"):
+                result = calculator.calculate(batch)
+            for req, freq in valid:
+                record_calculation(freq, req.years + req.months / 12)
+
+        with timed("serialize"):
+            lines = []
+            row = 0
+            for index, scenario in enumerate(parsed, start=offset):
+                if isinstance(scenario, str):
+                    line = {"index": index, "error": scenario}
+                else:
+                    line = {"index": index, "result": _batch_row_response(result, row)}
+                    row += 1
+                lines.append(orjson.dumps(line) + b"\n")
+        yield from lines
+
+
+def _parse_batch_item(item: Any) -> tuple[BatchCalculateItem, CompoundingFrequency] | str:
+    """Validate one batch scenario: the request and its frequency, or an error message."""
+    try:
+        request = BatchCalculateItem.model_validate(item)
+    except ValidationError as e:
+        return "; ".join(
+            f"{'.'.join(map(str, error['loc']))}: {error['msg']}" if error["loc"] else error["msg"]
+            for error in e.errors()
         )
-        for yb in result.yearly_breakdown
-    ]
-
-    return CalculateResponse(
-        final_amount=result.final_amount,
-        total_contributions=result.total_contributions,
-        total_interest=result.total_interest,
-        yearly_breakdown=yearly_breakdown,
+    frequency = FREQUENCY_MAP.get(request.compounding_frequency.lower())
+    if frequency is None:
+        return _invalid_frequency_message(request.compounding_frequency)
+    return request, frequency
+
+
+def batch_input(
+    requests: list[CalculateRequest], frequencies: list[CompoundingFrequency]
+) -> BatchCompoundInterestInput:
+    """Convert API requests, with their parsed frequencies, to a batch input."""
+    return BatchCompoundInterestInput(
+        principal=[req.principal for req in requests],
+        annual_rate=[req.annual_rate for req in requests],
+        years=[req.years for req in requests],
+        months=[req.months for req in requests],
+        monthly_contribution=[req.monthly_contribution for req in requests],
+        annual_contribution=[req.annual_contribution for req in requests],
+        compounding_frequency=frequencies,
+        inflation_rate=[req.inflation_rate for req in requests],
+        tax_drag=[req.tax_drag for req in requests],
+    )
+
+
+def _batch_row_response(result: BatchCompoundInterestResult, row: int) -> dict:
+    """Build a CalculateResponse-shaped dict for one scenario of a batch result."""
+    num_years = int(result.num_years[row])
+    ending = result.yearly_balances[row, :num_years]
+    contributions = result.yearly_contributions[row, :num_years]
+    starting = np.concatenate(([result.input_params.principal[row]], ending[:-1]))
+
+    table = YearlyBreakdownTable(
+        year=np.arange(1, num_years + 1),
+        starting_balance=starting,
+        contributions=contributions,
+        interest_earned=ending - starting - contributions,
+        ending_balance=ending,
+        real_ending_balance=result.real_yearly_balances[row, :num_years],
+        after_tax_ending_balance=result.after_tax_yearly_balances[row, :num_years],
     )
+
+    return {
+        "final_amount": float(result.final_amount[row]),
+        "total_contributions": float(result.total_contributions[row]),
+        "total_interest": float(result.total_interest[row]),
+        "real_final_amount": float(result.real_final_amount[row]),
+        "after_tax_final_amount": float(result.after_tax_final_amount[row]),
+        "yearly_breakdown": table.to_rows(),
+    }
@@ -0,0 +1,46 @@
+"""Coast FIRE API Routes"""
+
+import orjson
+from fastapi import APIRouter, Response
+
+from firefly.api.metrics import timed
+from firefly.api.models import CoastFireRequest, CoastFireResponse
+from firefly.api.routes.calculator import compounding_frequency
+from firefly.core.calculators.coast_fire import CoastFireCalculator
+from firefly.core.models.coast_fire import CoastFireInput
+
+router = APIRouter()
+
+calculator = CoastFireCalculator()
+
+
+@router.post("/api/coast-fire", response_model=CoastFireResponse)
+def coast_fire(request: CoastFireRequest) -> Response:
+    """
+    Coast FIRE curve: how much is needed now to coast to FI by each age, and
+    the age at which the current portfolio gets there with no contributions.
+    """
+    params = CoastFireInput(
+        current_age=request.current_age,
+        current_portfolio=request.current_portfolio,
+        fi_target=request.fi_target,
+        annual_rate=request.annual_rate,
+        target_ages=request.target_ages,
+        max_age=request.max_age,
+        compounding_frequency=compounding_frequency(request.compounding_frequency),
+    )
+
+    with timed("calc"):
+        result = calculator.calculate(params)
+
+    with timed("serialize"):
+        content = orjson.dumps(
+            {
+                "ages": result.ages.tolist(),
+                "required_now": result.required_now.tolist(),
+                "projected_balance": result.projected_balance.tolist(),
+                "coast_gap": result.coast_gap.tolist(),
+                "fi_age": result.fi_age,
+            }
+        )
+    return Response(content=content, media_type="application/json")
@@ -0,0 +1,68 @@
+"""Export API Routes"""
+
+from collections.abc import Iterator
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from firefly.api.metrics import record_calculation, timed
+from firefly.api.models import CalculateRequest, ExportFormatName
+from firefly.api.routes.calculator import BATCH_CHUNK_SIZE, batch_input, compounding_frequency
+from firefly.core.calculators.batch import BatchCompoundInterestCalculator
+from firefly.core.export import ExportFormat, Records, batch_records, write_stream
+from firefly.core.models.compound_interest import CompoundingFrequency
+
+router = APIRouter()
+
+
+@router.post(
+    "/api/calculate/export",
+    response_class=StreamingResponse,
+    responses={200: {"description": "Yearly breakdown of every scenario, as a file"}},
+)
+def export_scenarios(
+    requests: list[CalculateRequest], format: ExportFormatName = "csv"
+) -> StreamingResponse:
+    """
+    Calculate many scenarios and download their yearly breakdowns as a file.
+
+    The file has one record per scenario and year, with `scenario` holding the
+    scenario's index in the request. It is streamed as scenarios are
+    calculated, so its size doesn't bound the memory the server needs.
+    `arrow` (an Arrow IPC stream) and `parquet` need the `export` extra.
+    """
+    export_format = ExportFormat(format)
+    frequencies = []
+    for index, req in enumerate(requests):
+        try:
+            frequencies.append(compounding_frequency(req.compounding_frequency))
+        except HTTPException as e:
+            # The file can't carry per-scenario errors, so reject it up front
+            raise HTTPException(status_code=400, detail=f"Scenario {index}: {e.detail}") from e
+
+    try:
+        content = write_stream(_records(requests, frequencies), export_format)
+    except ImportError as e:
+        raise HTTPException(status_code=501, detail=str(e)) from e
+
+    return StreamingResponse(
+        content,
+        media_type=export_format.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="firefly-scenarios.{export_format.value}"'
+        },
+    )
+
+
+def _records(
+    requests: list[CalculateRequest], frequencies: list[CompoundingFrequency]
+) -> Iterator[Records]:
+    calculator = BatchCompoundInterestCalculator()
+    for offset in range(0, len(requests), BATCH_CHUNK_SIZE):
+        chunk = requests[offset : offset + BATCH_CHUNK_SIZE]
+        chunk_frequencies = frequencies[offset : offset + BATCH_CHUNK_SIZE]
+        with timed("calc"):
+            result = calculator.calculate(batch_input(chunk, chunk_frequencies))
+        for req, freq in zip(chunk, chunk_frequencies, strict=True):
+            record_calculation(freq, req.years + req.months / 12)
+        yield batch_records(result, first_scenario=offset)
@@ -0,0 +1,97 @@
+"""Geographic Arbitrage API Routes"""
+
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+
+from firefly.api.metrics import timed
+from firefly.api.models import GeoArbitrageRequest, GeoArbitrageResponse
+from firefly.api.routes.calculator import compounding_frequency
+from firefly.core.calculators.geo_arbitrage import GeoArbitrageCalculator
+from firefly.core.models.geo_arbitrage import GeoArbitrageInput, LocationOrder, LocationQuery
+
+router = APIRouter()
+
+calculator = GeoArbitrageCalculator()
+
+
+@router.post("/api/geo-arbitrage", response_model=GeoArbitrageResponse)
+def geo_arbitrage(request: GeoArbitrageRequest) -> Response:
+    """
+    FI number, years to FI and sustainable lifestyle of one plan in every
+    location of the bundled cost-of-living table that matches the filters.
+    Cost indices are approximate and indicative only.
+    """
+    home_cost_index = request.home_cost_index or 100.0
+    if request.home_location is not None:
+        home_cost_index = calculator.table.cost_index_of(request.home_location)
+        if home_cost_index is None:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown home_location: {request.home_location!r}"
+            )
+
+    params = GeoArbitrageInput(
+        portfolio=request.portfolio,
+        annual_expenses=request.annual_expenses,
+        home_cost_index=home_cost_index,
+        annual_savings=request.annual_savings,
+        annual_rate=request.annual_rate,
+        withdrawal_rate=request.withdrawal_rate,
+        compounding_frequency=compounding_frequency(request.compounding_frequency),
+    )
+    query = LocationQuery(
+        countries=request.countries,
+        regions=request.regions,
+        max_cost_index=request.max_cost_index,
+        fi_now=request.fi_now,
+        max_years_to_fi=request.max_years_to_fi,
+        order=LocationOrder(request.order),
+        limit=request.limit,
+    )
+
+    with timed("calc"):
+        result = calculator.compare(params, query)
+
+    # orjson writes the infinite years_to_fi of locations never reached as null
+    with timed("serialize"):
+        content = orjson.dumps(
+            {
+                "home_cost_index": home_cost_index,
+                "total_matches": result.total_matches,
+                "locations": [
+                    {
+                        "name": name,
+                        "country": country,
+                        "region": region,
+                        "cost_index": cost_index,
+                        "annual_expenses": expenses,
+                        "fi_number": fi_number,
+                        "years_to_fi": years_to_fi,
+                        "percent_of_fi": percent_of_fi,
+                        "home_spending": home_spending,
+                    }
+                    for (
+                        name,
+                        country,
+                        region,
+                        cost_index,
+                        expenses,
+                        fi_number,
+                        years_to_fi,
+                        percent_of_fi,
+                        home_spending,
+                    ) in zip(
+                        result.name.tolist(),
+                        result.country.tolist(),
+                        result.region.tolist(),
+                        result.cost_index.tolist(),
+                        result.annual_expenses.tolist(),
+                        result.fi_number.tolist(),
+                        result.years_to_fi.tolist(),
+                        result.percent_of_fi.tolist(),
+                        result.home_spending.tolist(),
+                        strict=True,
+                    )
+                ],
+            }
+        )
+    return Response(content=content, media_type="application/json")
@@ -0,0 +1,178 @@
+"""Background Job API Routes"""
+
+from collections.abc import Callable
+from concurrent.futures import BrokenExecutor
+
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+
+from firefly.api.jobs import Job, JobManager, JobQueueFull, JobStatus, Task
+from firefly.api.models import (
+    CalculateJobRequest,
+    CalculateResponse,
+    JobRequest,
+    JobResponse,
+    MonteCarloJobRequest,
+    MonteCarloResponse,
+)
+from firefly.api.routes.calculator import compound_interest_input, response_payload
+from firefly.core.calculators.compound_interest import CompoundInterestCalculator
+from firefly.core.calculators.monte_carlo import MonteCarloSimulator, summarize_chunk
+from firefly.core.models.monte_carlo import (
+    DistributionType,
+    MonteCarloInput,
+    MonteCarloResult,
+    ReturnDistribution,
+)
+
+router = APIRouter()
+
+# Map string values to DistributionType enum
+DISTRIBUTION_MAP = {member.value: member for member in DistributionType}
+
+# Suggested wait before resubmitting when the queue is full
+RETRY_AFTER_SECONDS = 5
+
+JOB_MANAGER = JobManager()
+
+
+@router.post("/api/jobs", status_code=202, response_model=JobResponse)
+def submit_job(request: JobRequest, response: Response) -> JobResponse:
+    """
+    Submit a long-running computation to run in a worker process.
+
+    Poll `GET /api/jobs/{id}` for progress and fetch the outcome from
+    `GET /api/jobs/{id}/result`. Returns 429 when too many jobs are pending.
+    """
+    if isinstance(request, CalculateJobRequest):
+        tasks, combine = _calculate_job(request)
+    else:
+        tasks, combine = _monte_carlo_job(request)
+
+    try:
+        job = JOB_MANAGER.submit(request.kind, tasks, combine)
+    except JobQueueFull as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+        ) from e
+    except BrokenExecutor as e:
+        raise HTTPException(status_code=503, detail="Job workers unavailable") from e
+
+    response.headers["Location"] = f"/api/jobs/{job.id}"
+    return _job_response(job)
+
+
+@router.get("/api/jobs/{job_id}", response_model=JobResponse)
+def get_job(job_id: str) -> JobResponse:
+    """Status and progress of a job."""
+    return _job_response(_get_job(job_id))
+
+
+@router.get(
+    "/api/jobs/{job_id}/result",
+    response_model=CalculateResponse | MonteCarloResponse,
+    responses={202: {"model": JobResponse, "description": "Job not finished yet"}},
+)
+def get_job_result(job_id: str) -> Response:
+    """
+    Result of a finished job, shaped like the synchronous endpoint's response.
+
+    Returns 202 with the job status while it is still running, and 409 for a
+    job that failed or was cancelled.
+    """
+    job = _get_job(job_id)
+    if not job.status.finished:
+        return Response(
+            content=_job_response(job).model_dump_json(),
+            status_code=202,
+            media_type="application/json",
+        )
+    if job.status is not JobStatus.SUCCEEDED:
+        detail = f"Job {job.id} {job.status.value}"
+        if job.error:
+            detail += f": {job.error}"
+        raise HTTPException(status_code=409, detail=detail)
+
+    return Response(content=orjson.dumps(job.result), media_type="application/json")
+
+
+@router.delete("/api/jobs/{job_id}", response_model=JobResponse)
+def cancel_job(job_id: str) -> JobResponse:
+    """Cancel a job; finished jobs are left unchanged."""
+    job = JOB_MANAGER.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return _job_response(job)
+
+
+def _get_job(job_id: str) -> Job:
+    job = JOB_MANAGER.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found or expired: {job_id}")
+    return job
+
+
+def _job_response(job: Job) -> JobResponse:
+    return JobResponse(
+        id=job.id,
+        kind=job.kind,
+        status=job.status.value,
+        progress=job.progress,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+        error=job.error,
+    )
+
+
+def _calculate_job(request: CalculateJobRequest) -> tuple[list[Task], Callable[[list], dict]]:
+    params = compound_interest_input(request.params)
+    # A fresh, uncached calculator: it is pickled to the worker with the task
+    tasks = [(CompoundInterestCalculator().calculate, (params,))]
+    return tasks, lambda results: response_payload(results[0], request.breakdown)
+
+
+def _monte_carlo_job(request: MonteCarloJobRequest) -> tuple[list[Task], Callable[[list], dict]]:
+    kind = DISTRIBUTION_MAP.get(request.distribution.lower())
+    if not kind:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid distribution: {request.distribution}. "
+            f"Must be one of {', '.join(repr(name) for name in DISTRIBUTION_MAP)}.",
+        )
+    if any(not 0 <= p <= 100 for p in request.percentiles):
+        raise HTTPException(status_code=400, detail="Percentiles must be between 0 and 100.")
+
+    params = MonteCarloInput(
+        plan=compound_interest_input(request.plan),
+        distribution=ReturnDistribution(
+            mean=request.mean_return, volatility=request.volatility, kind=kind
+        ),
+        num_paths=request.num_paths,
+        seed=request.seed,
+        target=request.target,
+        percentiles=tuple(request.percentiles),
+    )
+    # One task per chunk of paths, so progress advances chunk by chunk. Workers
+    # reduce their chunk to a summary: paths never cross back into this process,
+    # and the combine step here only merges small quantile sketches
+    tasks = [
+        (summarize_chunk, (*args, params.target))
+        for args in MonteCarloSimulator.chunk_tasks(params)
+    ]
+    return tasks, lambda summaries: _monte_carlo_payload(
+        MonteCarloSimulator.summarize(params, summaries)
+    )
+
+
+def _monte_carlo_payload(result: MonteCarloResult) -> dict:
+    """Build a MonteCarloResponse-shaped dict from a core result."""
+    return {
+        "percentiles": list(result.percentiles),
+        "yearly_percentiles": result.yearly_percentiles.tolist(),
+        "final_amount_percentiles": result.final_amount_percentiles.tolist(),
+        "mean_final_amount": result.mean_final_amount,
+        "success_probability": result.success_probability,
+        "num_paths": result.num_paths,
+    }
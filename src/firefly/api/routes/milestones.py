@@ -0,0 +1,60 @@
+"""Milestone API Routes"""
+
+import orjson
+from fastapi import APIRouter, Response
+
+from firefly.api.metrics import timed
+from firefly.api.models import MilestonesRequest, MilestonesResponse
+from firefly.api.routes.calculator import compound_interest_input
+from firefly.core.calculators.milestones import MilestoneFinder
+from firefly.core.models.milestones import Milestone, MilestoneInput, MilestoneKind
+
+router = APIRouter()
+
+finder = MilestoneFinder()
+
+
+@router.post("/api/milestones", response_model=MilestonesResponse)
+def milestones(request: MilestonesRequest) -> Response:
+    """
+    When the plan first reaches each milestone: "you'll hit $X in month Y",
+    and the crossover point where a year's returns cover expenses.
+
+    All milestones are located together from the closed form, without
+    generating the plan's breakdown.
+    """
+    params = MilestoneInput(
+        plan=compound_interest_input(request),
+        milestones=[
+            Milestone(item.amount, MilestoneKind(item.kind)) for item in request.milestones
+        ],
+    )
+
+    with timed("calc"):
+        result = finder.find(params)
+
+    with timed("serialize"):
+        reached = result.reached.tolist()
+        content = orjson.dumps(
+            {
+                "milestones": [
+                    {
+                        "amount": milestone.amount,
+                        "kind": milestone.kind.value,
+                        "reached": hit,
+                        "years": years if hit else None,
+                        "month": month if hit else None,
+                        "balance": balance if hit else None,
+                    }
+                    for milestone, hit, years, month, balance in zip(
+                        result.milestones,
+                        reached,
+                        result.years.tolist(),
+                        result.month.tolist(),
+                        result.balance.tolist(),
+                        strict=True,
+                    )
+                ]
+            }
+        )
+    return Response(content=content, media_type="application/json")
@@ -0,0 +1,76 @@
+"""One More Year API Routes"""
+
+import orjson
+from fastapi import APIRouter, Response
+
+from firefly.api.metrics import timed
+from firefly.api.models import OneMoreYearRequest, OneMoreYearResponse
+from firefly.api.routes.calculator import compounding_frequency
+from firefly.core.calculators.one_more_year import OneMoreYearCalculator
+from firefly.core.models.one_more_year import OneMoreYearInput
+
+router = APIRouter()
+
+calculator = OneMoreYearCalculator()
+
+
+@router.post("/api/one-more-year", response_model=OneMoreYearResponse)
+def one_more_year(request: OneMoreYearRequest) -> Response:
+    """
+    What each additional working year buys: "Year 1: +$X safety, -12 months
+    freedom", for every year up to max_years, from a single accumulation pass.
+    """
+    params = OneMoreYearInput(
+        current_portfolio=request.current_portfolio,
+        monthly_expenses=request.monthly_expenses,
+        savings_rate=request.savings_rate,
+        annual_rate=request.annual_rate,
+        withdrawal_rate=request.withdrawal_rate,
+        max_years=request.max_years,
+        compounding_frequency=compounding_frequency(request.compounding_frequency),
+    )
+
+    with timed("calc"):
+        result = calculator.calculate(params)
+
+    # orjson writes the NaN deltas of year 0 as null
+    with timed("serialize"):
+        content = orjson.dumps(
+            {
+                "fi_number": params.fi_number,
+                "fi_years": result.fi_years,
+                "table": [
+                    {
+                        "year": year,
+                        "months_worked": months_worked,
+                        "portfolio": portfolio,
+                        "sustainable_withdrawal": withdrawal,
+                        "percent_of_fi": percent_of_fi,
+                        "withdrawal_increase": withdrawal_increase,
+                        "percent_of_fi_increase": percent_of_fi_increase,
+                        "relative_increase": relative_increase,
+                    }
+                    for (
+                        year,
+                        months_worked,
+                        portfolio,
+                        withdrawal,
+                        percent_of_fi,
+                        withdrawal_increase,
+                        percent_of_fi_increase,
+                        relative_increase,
+                    ) in zip(
+                        result.years.tolist(),
+                        result.months_worked.tolist(),
+                        result.portfolio.tolist(),
+                        result.sustainable_withdrawal.tolist(),
+                        result.percent_of_fi.tolist(),
+                        result.withdrawal_increase.tolist(),
+                        result.percent_of_fi_increase.tolist(),
+                        result.relative_increase.tolist(),
+                        strict=True,
+                    )
+                ],
+            }
+        )
+    return Response(content=content, media_type="application/json")
@@ -0,0 +1,70 @@
+"""Sensitivity Analysis API Routes"""
+
+import orjson
+from fastapi import APIRouter, Response
+
+from firefly.api.metrics import timed
+from firefly.api.models import SensitivityRequest, SensitivityResponse
+from firefly.api.routes.calculator import compound_interest_input
+from firefly.core.calculators.sensitivity import SensitivityAnalyzer
+from firefly.core.models.sensitivity import SensitivityInput, SensitivityResult
+
+router = APIRouter()
+
+analyzer = SensitivityAnalyzer()
+
+
+@router.post("/api/sensitivity", response_model=SensitivityResponse)
+def sensitivity(request: SensitivityRequest) -> Response:
+    """
+    How much each input moves the final amount (and time to target).
+
+    Returns exact partial derivatives for every numeric input, plus a
+    perturbation grid and tornado chart data, all from one closed-form pass.
+    """
+    params = SensitivityInput(
+        plan=compound_interest_input(request),
+        target=request.target,
+        relative_steps=tuple(request.relative_steps),
+        rate_steps=tuple(request.rate_steps),
+    )
+
+    with timed("calc"):
+        result = analyzer.analyze(params)
+
+    # orjson writes NaN and inf (undefined slopes, unreachable targets) as null
+    with timed("serialize"):
+        content = orjson.dumps(_response_payload(result))
+    return Response(content=content, media_type="application/json")
+
+
+def _response_payload(result: SensitivityResult) -> dict:
+    """Build a SensitivityResponse-shaped dict from a core result."""
+    return {
+        "final_amount": result.final_amount,
+        "time_to_target": result.time_to_target,
+        "final_amount_gradient": result.final_amount_gradient,
+        "time_to_target_gradient": result.time_to_target_gradient,
+        "tornado": [
+            {
+                "field": bar.field,
+                "low_value": bar.low_value,
+                "high_value": bar.high_value,
+                "low_final_amount": bar.low_final_amount,
+                "high_final_amount": bar.high_final_amount,
+                "swing": bar.swing,
+            }
+            for bar in result.tornado()
+        ],
+        "grid": [
+            {
+                "field": grid.field,
+                "values": grid.values.tolist(),
+                "final_amount": grid.final_amount.tolist(),
+                "time_to_target": (
+                    None if grid.time_to_target is None else grid.time_to_target.tolist()
+                ),
+            }
+            for grid in result.grids
+        ],
+    }
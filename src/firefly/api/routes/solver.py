@@ -0,0 +1,48 @@
+"""Formula Solver API Routes"""
+
+from fastapi import APIRouter, HTTPException
+
+from firefly.api.metrics import timed
+from firefly.api.models import SolveRequest, SolveResponse
+from firefly.core.calculators.solver import FormulaSolver
+from firefly.core.models.solver import FormulaSolverInput, SolveFor
+
+router = APIRouter()
+
+# Map string values to SolveFor enum
+SOLVE_FOR_MAP = {member.value: member for member in SolveFor}
+
+
+@router.post("/api/solve", response_model=SolveResponse)
+def solve(request: SolveRequest) -> SolveResponse:
+    """Solve for one of savings rate, return rate, FI multiplier, or years."""
+
+    solve_for = SOLVE_FOR_MAP.get(request.solve_for.lower())
+    if not solve_for:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid solve_for: {request.solve_for}. "
+            f"Must be one of {', '.join(repr(name) for name in SOLVE_FOR_MAP)}.",
+        )
+
+    params = FormulaSolverInput(
+        solve_for=solve_for,
+        savings_rate=request.savings_rate,
+        return_rate=request.return_rate,
+        fi_multiplier=request.fi_multiplier,
+        years=request.years,
+        portfolio_multiple=request.portfolio_multiple,
+    )
+
+    try:
+        with timed("calc"):
+            result = FormulaSolver().solve(params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    feasible = bool(result.feasible)
+    return SolveResponse(
+        solve_for=solve_for.value,
+        value=float(result.value) if feasible else None,
+        feasible=feasible,
+    )
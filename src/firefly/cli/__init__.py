@@ -1,5 +1,24 @@
 """Firefly CLI interface."""
 
-from firefly.cli.compound_interest_cli import main
+import argparse
+
+from firefly import __version__
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point for the firefly command."""
+    parser = argparse.ArgumentParser(
+        prog="firefly",
+        description="Interactive compound interest calculator for FIRE planning.",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    parser.parse_args(argv)
+
+    # questionary, rich and plotext dominate startup, so they are only
+    # imported once we know the interactive session will run
+    from firefly.cli.compound_interest_cli import main as run_interactive
+
+    run_interactive()
+
 
 __all__ = ["main"]
@@ -1,6 +1,6 @@
 """Main entry point for firefly CLI."""
 
-from firefly.cli.compound_interest_cli import main
+from firefly.cli import main
 
 if __name__ == "__main__":
     main()
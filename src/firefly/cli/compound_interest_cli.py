@@ -7,8 +7,8 @@ from rich.panel import Panel
 from rich.table import Table
 
 from firefly.cli.visualizer import CompoundInterestVisualizer
-from firefly.core.calculators.compound_interest import CompoundInterestCalculator
 from firefly.core.models.compound_interest import CompoundingFrequency, CompoundInterestInput
+from firefly.core.session import CalculationSession
 
 custom_style = Style(
     [
@@ -29,7 +29,8 @@ class CompoundInterestCLI:
     """Interactive CLI for compound interest calculations."""
 
     def __init__(self):
-        self.calculator = CompoundInterestCalculator()
+        # Edits between runs only recompute the years they change
+        self.session = CalculationSession()
         self.visualizer = CompoundInterestVisualizer()
         self.console = Console()
         # In-memory cache for last used parameters
@@ -51,7 +52,7 @@ class CompoundInterestCLI:
             # Cache the parameters
             self.last_input = params
 
-            result = self.calculator.calculate(params)
+            result = self.session.calculate(params)
 
             # Ask about yearly breakdown
             show_yearly = questionary.confirm(
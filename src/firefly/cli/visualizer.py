@@ -1,17 +1,22 @@
 """Visualization tools for compound interest results."""
 
-import plotext as plt
 from rich.console import Console
 from rich.table import Table
 
+from firefly.core.calculators.compound_interest import CompoundInterestCalculator
+from firefly.core.downsample import lttb
 from firefly.core.models.compound_interest import CompoundInterestResult
 
+GRAPH_WIDTH = 100
+GRAPH_HEIGHT = 30
+
 
 class CompoundInterestVisualizer:
     """Visualizer for compound interest calculations."""
 
     def __init__(self):
         self.console = Console()
+        self.calculator = CompoundInterestCalculator()
 
     def display_summary(self, result: CompoundInterestResult) -> None:
         """Display summary of results."""
@@ -71,15 +76,19 @@ class CompoundInterestVisualizer:
         """Display ASCII graph of portfolio growth."""
         params = result.input_params
 
-        # Generate monthly data points for smoother graphs
-        monthly_data = self._generate_monthly_data(result)
+        # Braille markers draw two points per terminal column
+        width = min(GRAPH_WIDTH, self.console.width)
+        monthly_data = self._generate_monthly_data(result, max_points=2 * width)
 
         months = monthly_data["months"]
         balances = monthly_data["balances"]
         contributions_cumulative = monthly_data["contributions"]
 
+        # Deferred: plotext is slow to import and only needed to draw
+        import plotext as plt
+
         plt.clear_figure()
-        plt.plot_size(100, 30)
+        plt.plot_size(width, GRAPH_HEIGHT)
 
         # Plot ending balance
         plt.plot(months, balances, label="Total Balance", marker="braille")
@@ -99,64 +108,32 @@ class CompoundInterestVisualizer:
 
         plt.show()
 
-    def _generate_monthly_data(self, result: CompoundInterestResult) -> dict:
-        """Generate monthly data points for smoother visualization."""
-        params = result.input_params
-
-        months = []
-        balances = []
-        contributions = []
+    def _generate_monthly_data(
+        self, result: CompoundInterestResult, max_points: int | None = None
+    ) -> dict:
+        """
+        Generate monthly data points for smoother visualization.
 
-        balance = params.principal
-        cumulative_contrib = params.principal
+        Points come from the calculator's timeline, so they match the
+        yearly breakdown. With `max_points`, the series is downsampled
+        with LTTB to what the terminal can actually show.
+        """
+        params = result.input_params
+        timeline = self.calculator.timeline(params)
 
-        n = params.compounding_frequency.value
-        r = params.rate_decimal
+        # Convert to years for display if period > 3 years
+        time = timeline.time if params.total_periods > 3 else timeline.time * 12
 
-        # Determine contribution per month
-        monthly_contribution = (
-            params.monthly_contribution
-            if params.monthly_contribution > 0
-            else params.annual_contribution / 12
-        )
+        if max_points is not None:
+            keep = lttb(time, timeline.balance, max_points)
+        else:
+            keep = slice(None)
 
-        # Calculate total months
-        total_months = int(params.total_periods * 12)
-
-        # Add initial point
-        months.append(0)
-        balances.append(balance)
-        contributions.append(cumulative_contrib)
-
-        # Calculate monthly snapshots
-        for month in range(1, total_months + 1):
-            # Calculate interest for this month based on compounding frequency
-            if n == 12:  # Monthly compounding
-                month_interest = balance * (r / 12)
-                balance += month_interest
-                balance += monthly_contribution
-                cumulative_contrib += monthly_contribution
-            elif n == 365:  # Daily compounding
-                # Compound daily for ~30 days
-                for _ in range(30):
-                    balance += balance * (r / 365)
-                    balance += monthly_contribution / 30
-                    cumulative_contrib += monthly_contribution / 30
-            else:  # Annual compounding
-                # Apply monthly contribution, but compound interest yearly
-                if month % 12 == 0:
-                    balance += balance * r
-                balance += monthly_contribution
-                cumulative_contrib += monthly_contribution
-
-            # Convert to years for display if period > 3 years
-            time_value = month / 12 if params.total_periods > 3 else month
-
-            months.append(time_value)
-            balances.append(balance)
-            contributions.append(cumulative_contrib)
-
-        return {"months": months, "balances": balances, "contributions": contributions}
+        return {
+            "months": time[keep].tolist(),
+            "balances": timeline.balance[keep].tolist(),
+            "contributions": timeline.invested[keep].tolist(),
+        }
 
     def display_all(self, result: CompoundInterestResult, show_yearly: bool = False) -> None:
         """Display all visualizations."""
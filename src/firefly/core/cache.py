@@ -0,0 +1,106 @@
+"""Bounded LRU cache for calculation results."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0  # entries dropped for size
+    expirations: int = 0  # entries dropped for age
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache with a size bound and an optional time-to-live.
+
+    Keys must be hashable; for calculation inputs use `cache_key()` on the
+    input model so equivalent inputs share an entry. Cached values are
+    shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+        self._stats = CacheStats()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for `key`, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[0]):
+                del self._entries[key]
+                self._stats.expirations += 1
+                entry = None
+
+            if entry is None:
+                self._stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store `value`, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for `key`, computing and storing it on a miss."""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Snapshot of the hit/miss/eviction counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                size=len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and self._clock() - stored_at > self.ttl
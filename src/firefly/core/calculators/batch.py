@@ -0,0 +1,120 @@
+"""Vectorized compound interest calculator for many scenarios at once."""
+
+import numpy as np
+
+from firefly.core.calculators.cents import cents_breakdown
+from firefly.core.calculators.compound_interest import (
+    growth_factors_array,
+    inflation_per_period,
+    period_contributions,
+)
+from firefly.core.models.batch import BatchCompoundInterestInput, BatchCompoundInterestResult
+from firefly.core.models.compound_interest import RoundingPolicy
+
+
+def contribution_per_period_array(batch: BatchCompoundInterestInput) -> np.ndarray:
+    """Contribution added every compounding period, for each scenario of `batch`."""
+    return period_contributions(
+        batch.monthly_contribution, batch.annual_contribution, batch.compounding_frequency
+    )
+
+
+class BatchCompoundInterestCalculator:
+    """
+    Calculator that evaluates thousands of scenarios with array operations.
+
+    With a `rounding` policy, money is kept in whole cents as in
+    CompoundInterestCalculator's exact-cents engine, still one array
+    operation across all scenarios at a time.
+    """
+
+    def __init__(self, rounding: RoundingPolicy | None = None):
+        self.rounding = rounding
+
+    def calculate(self, batch: BatchCompoundInterestInput) -> BatchCompoundInterestResult:
+        """
+        Calculate every scenario in `batch` at once.
+
+        Uses the same closed form as CompoundInterestCalculator, evaluated on
+        a (scenarios x years) grid of cumulative period counts:
+
+        B(k) = P(1 + r/n)^k + PMT × [((1 + r/n)^k - 1) / (r/n)]
+
+        Nominal, after-tax and inflation rates are stacked along a leading
+        axis so all three are evaluated in the same pass.
+        """
+        n = batch.compounding_frequency
+        # (nominal, after-tax, inflation) rate per period, one column per scenario
+        rates = np.stack(
+            [
+                batch.rate_decimal / n,
+                (batch.annual_rate - batch.tax_drag) / 100 / n,
+                inflation_per_period(batch.inflation_rate / 100, n),
+            ]
+        )
+        contribution_per_period = contribution_per_period_array(batch)
+
+        # Each scenario has `years` full years plus one trailing partial year if months > 0
+        partial_periods = batch.months * n // 12
+        num_years = batch.years + (batch.months > 0)
+        total_periods = batch.years * n + partial_periods
+        max_years = int(num_years.max()) if len(batch) else 0
+
+        # Cumulative periods elapsed at the end of each breakdown year
+        year_index = np.arange(1, max_years + 1)
+        periods = np.minimum(year_index[None, :] * n[:, None], total_periods[:, None])
+
+        growth, annuity = growth_factors_array(rates[:, :, None], periods)
+        final_growth, final_annuity = growth_factors_array(rates, total_periods)
+        cents = None
+        if self.rounding is not None:
+            cents = cents_breakdown(
+                batch.principal,
+                rates[:2],
+                contribution_per_period,
+                np.diff(periods, prepend=0),
+                self.rounding,
+            )
+            yearly_balances = cents.ending_balance / 100
+            after_tax_yearly_balances = cents.after_tax_ending_balance / 100
+            yearly_contributions = cents.contributions / 100
+            final_amount = cents.final_amount / 100
+            after_tax_final_amount = cents.after_tax_final_amount / 100
+            total_contributions = cents.total_contributions / 100
+            total_interest = cents.total_interest / 100
+        else:
+            yearly_balances, after_tax_yearly_balances = (
+                batch.principal[:, None] * growth[:2]
+                + contribution_per_period[:, None] * annuity[:2]
+            )
+            yearly_contributions = contribution_per_period[:, None] * np.diff(periods, prepend=0)
+            final_amount, after_tax_final_amount = (
+                batch.principal * final_growth[:2] + contribution_per_period * final_annuity[:2]
+            )
+            total_contributions = contribution_per_period * total_periods
+            total_interest = final_amount - batch.principal - total_contributions
+        real_yearly_balances = yearly_balances / growth[2]
+
+        padding = year_index[None, :] > num_years[:, None]
+        for yearly in (
+            yearly_balances,
+            real_yearly_balances,
+            after_tax_yearly_balances,
+            yearly_contributions,
+        ):
+            yearly[padding] = np.nan
+
+        return BatchCompoundInterestResult(
+            final_amount=final_amount,
+            total_contributions=total_contributions,
+            total_interest=total_interest,
+            real_final_amount=final_amount / final_growth[2],
+            after_tax_final_amount=after_tax_final_amount,
+            yearly_balances=yearly_balances,
+            real_yearly_balances=real_yearly_balances,
+            after_tax_yearly_balances=after_tax_yearly_balances,
+            yearly_contributions=yearly_contributions,
+            num_years=num_years,
+            input_params=batch,
+            cents=cents,
+        )
@@ -0,0 +1,162 @@
+"""Exact-cents evaluation of compound interest, for ledgers that must reconcile to the cent."""
+
+import numpy as np
+
+from firefly.core.calculators.compound_interest import (
+    contribution_per_period,
+    growth_factors_array,
+    inflation_per_period,
+    periods_per_year,
+)
+from firefly.core.models.compound_interest import (
+    CentsBreakdown,
+    CompoundInterestInput,
+    CompoundInterestResult,
+    RoundingPolicy,
+    YearlyBreakdownTable,
+)
+
+# Up to this many scenarios the per-period loop steps Python floats:
+# numpy's per-call overhead outweighs vectorizing over so few balances
+SCALAR_MAX_SCENARIOS = 4
+
+
+def to_cents(amount) -> np.ndarray:
+    """Dollar amounts as whole cents, rounded half to even."""
+    return np.rint(np.asarray(amount, dtype=np.float64) * 100).astype(np.int64)
+
+
+def cents_breakdown(
+    principal, rates, contribution, periods, rounding: RoundingPolicy
+) -> CentsBreakdown:
+    """
+    Yearly breakdown of every scenario in whole cents.
+
+    `principal` and `contribution` (per period) are dollars, one entry per
+    scenario; `rates` holds the nominal and after-tax rates per period as two
+    rows; `periods[s, y]` is the number of compounding periods of scenario
+    `s` in year `y + 1`. Balances stay whole cents throughout: while stepping
+    they are float64, which represents them exactly below 2**53 cents, and
+    the ledger itself is int64.
+    """
+    principal = to_cents(principal)
+    rates = np.asarray(rates, dtype=np.float64)
+    periods = np.asarray(periods, dtype=np.int64)
+    contribution = np.asarray(contribution, dtype=np.float64) * 100
+
+    if rounding is RoundingPolicy.PER_PERIOD:
+        contribution = np.rint(contribution)
+        contributions = contribution[:, None] * periods
+        ending = _per_period_balances(principal, rates, contribution, periods)
+    else:
+        contributions = np.rint(contribution[:, None] * periods)
+        ending = _per_year_balances(principal, rates, contribution, periods)
+
+    ending = ending.astype(np.int64)
+    contributions = contributions.astype(np.int64)
+    starting = np.concatenate((principal[:, None], ending[0]), axis=1)[:, :-1]
+    return CentsBreakdown(
+        principal=principal,
+        starting_balance=starting,
+        contributions=contributions,
+        interest_earned=ending[0] - starting - contributions,
+        ending_balance=ending[0],
+        after_tax_ending_balance=ending[1],
+    )
+
+
+def _per_year_balances(principal, rates, contribution, periods) -> np.ndarray:
+    """Year-end balances, each year compounded in closed form and rounded once."""
+    growth, annuity = growth_factors_array(rates[:, :, None], periods)
+    added = contribution[:, None] * annuity
+    balances = np.broadcast_to(principal, rates.shape).astype(np.float64)
+    ending = np.empty(growth.shape)
+    for year in range(periods.shape[1]):
+        balances = np.rint(balances * growth[:, :, year] + added[:, :, year])
+        ending[:, :, year] = balances
+    return ending
+
+
+def _per_period_balances(principal, rates, contribution, periods) -> np.ndarray:
+    """Year-end balances, with each period's interest rounded to the cent as it is credited."""
+    num_scenarios, num_years = periods.shape
+    if num_scenarios <= SCALAR_MAX_SCENARIOS:
+        return _per_period_balances_scalar(principal, rates, contribution, periods)
+
+    balances = np.broadcast_to(principal, rates.shape).astype(np.float64)
+    ending = np.empty((*rates.shape, num_years))
+    for year in range(num_years):
+        # Longest-running first, so the scenarios still compounding are a prefix
+        order = np.argsort(-periods[:, year], kind="stable")
+        year_periods = periods[order, year]
+        active = np.searchsorted(-year_periods, -np.arange(year_periods.max()), side="left")
+
+        # Contiguous copies: each step below is then a plain sweep over memory
+        balance = np.ascontiguousarray(balances[:, order])
+        rate = np.ascontiguousarray(rates[:, order])
+        added = contribution[order]
+        interest = np.empty_like(balance)
+        for count in active.tolist():
+            b, step = balance[:, :count], interest[:, :count]
+            np.multiply(b, rate[:, :count], out=step)
+            np.rint(step, out=step)
+            step += added[:count]
+            b += step
+        balances[:, order] = balance
+        ending[:, :, year] = balances
+    return ending
+
+
+def _per_period_balances_scalar(principal, rates, contribution, periods) -> np.ndarray:
+    """_per_period_balances for a few scenarios; round() also rounds half to even."""
+    ending = np.empty((*rates.shape, periods.shape[1]))
+    for row, row_rates in enumerate(rates.tolist()):
+        for scenario, rate in enumerate(row_rates):
+            balance = float(principal[scenario])
+            added = float(contribution[scenario])
+            for year, count in enumerate(periods[scenario].tolist()):
+                for _ in range(count):
+                    balance += round(balance * rate) + added
+                ending[row, scenario, year] = balance
+    return ending
+
+
+def calculate_cents(
+    params: CompoundInterestInput, rounding: RoundingPolicy
+) -> CompoundInterestResult:
+    """CompoundInterestCalculator.calculate in whole cents, rounded by `rounding`."""
+    if params.schedule:
+        raise ValueError("The exact-cents engine does not support plans with a schedule")
+
+    n = params.compounding_frequency.value
+    periods = np.array([periods_per_year(params)], dtype=np.int64).reshape(1, -1)
+    rates = [[params.rate_decimal / n], [(params.annual_rate - params.tax_drag) / 100 / n]]
+    cents = cents_breakdown(
+        [params.principal], rates, [contribution_per_period(params)], periods, rounding
+    ).scenario(0)
+    price_level, _ = growth_factors_array(
+        inflation_per_period(params.inflation_rate / 100, n), np.cumsum(periods[0])
+    )
+
+    ending_balance = cents.ending_balance / 100
+    yearly_breakdown = YearlyBreakdownTable(
+        year=np.arange(1, periods.shape[1] + 1),
+        starting_balance=cents.starting_balance / 100,
+        contributions=cents.contributions / 100,
+        interest_earned=cents.interest_earned / 100,
+        ending_balance=ending_balance,
+        real_ending_balance=ending_balance / price_level,
+        after_tax_ending_balance=cents.after_tax_ending_balance / 100,
+    )
+    final_amount = int(cents.final_amount) / 100
+    final_price_level = float(price_level[-1]) if len(price_level) else 1.0
+    return CompoundInterestResult(
+        final_amount=final_amount,
+        total_contributions=int(cents.total_contributions) / 100,
+        total_interest=int(cents.total_interest) / 100,
+        real_final_amount=final_amount / final_price_level,
+        after_tax_final_amount=int(cents.after_tax_final_amount) / 100,
+        yearly_breakdown=yearly_breakdown,
+        input_params=params,
+        cents=cents,
+    )
@@ -0,0 +1,67 @@
+"""Coast FIRE calculator: how much is enough to stop contributing."""
+
+import math
+
+import numpy as np
+
+from firefly.core.calculators.compound_interest import growth_factors_array
+from firefly.core.models.coast_fire import CoastFireInput, CoastFireResult
+
+# Guards floor() and ceil() against values landing a hair off a period boundary
+PERIOD_EPSILON = 1e-9
+
+
+class CoastFireCalculator:
+    """
+    Calculator for Coast FIRE across a whole range of target ages at once.
+
+    With no contributions the portfolio after k periods at rate i per period
+    is P(1 + i)^k, the same growth factor CompoundInterestCalculator uses.
+    Both questions invert it in closed form:
+
+    - needed now to reach target T by age a: T / (1 + i)^k(a)
+    - age the current portfolio reaches T: now + ⌈ln(T / P) / ln(1 + i)⌉ / n
+    """
+
+    def calculate(self, params: CoastFireInput) -> CoastFireResult:
+        """Compute the Coast FIRE curve for every target age in one pass."""
+        ages = self._target_ages(params)
+        n = params.compounding_frequency.value
+        i = params.rate_decimal / n
+
+        years = np.maximum(ages - params.current_age, 0.0)
+        periods = np.floor(years * n + PERIOD_EPSILON)
+        growth, _ = growth_factors_array(i, periods)
+
+        with np.errstate(divide="ignore", over="ignore"):
+            required_now = params.fi_target / growth
+        projected_balance = params.current_portfolio * growth
+
+        return CoastFireResult(
+            ages=ages,
+            required_now=required_now,
+            projected_balance=projected_balance,
+            coast_gap=np.maximum(required_now - params.current_portfolio, 0.0),
+            fi_age=self._fi_age(params),
+            input_params=params,
+        )
+
+    @staticmethod
+    def _target_ages(params: CoastFireInput) -> np.ndarray:
+        if params.target_ages is not None:
+            return np.asarray(params.target_ages, dtype=np.float64)
+        first = math.floor(params.current_age) + 1
+        return np.arange(first, max(params.max_age, first - 1) + 1, dtype=np.float64)
+
+    @staticmethod
+    def _fi_age(params: CoastFireInput) -> float | None:
+        """Age at the end of the first whole period the current portfolio reaches the target by."""
+        if params.current_portfolio >= params.fi_target:
+            return float(params.current_age)
+        n = params.compounding_frequency.value
+        i = params.rate_decimal / n
+        if params.current_portfolio <= 0 or i <= 0:
+            return None
+        periods = math.log(params.fi_target / params.current_portfolio) / math.log1p(i)
+        # Growth is credited per whole period, as on the curve
+        return params.current_age + math.ceil(periods - PERIOD_EPSILON) / n
@@ -1,14 +1,345 @@
 """Compound interest calculator implementation."""
 
+import math
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from firefly.core.cache import ResultCache
 from firefly.core.models.compound_interest import (
+    CalculationEngine,
     CompoundInterestInput,
     CompoundInterestResult,
+    RoundingPolicy,
+    Timeline,
     YearlyBreakdown,
+    YearlyBreakdownTable,
 )
 
 
+def growth_factors_array(rate_per_period, periods) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Element-wise (growth, annuity) factors, broadcasting rates against periods.
+
+    growth  = (1 + i)^k
+    annuity = ((1 + i)^k - 1) / i   (k when i == 0)
+
+    Uses log1p/expm1 so small rates don't lose precision to cancellation.
+    Rates of -100% or less per period have no logarithm; there the factors
+    come from np.power, matching the period-by-period loop.
+    """
+    i = np.asarray(rate_per_period, dtype=np.float64)
+    k = np.asarray(periods, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        exponent = k * np.log1p(i)
+        total_loss = i <= -1
+        power = np.power(1 + i, k) if total_loss.any() else exponent
+        growth = np.where(k == 0, 1.0, np.where(total_loss, power, np.exp(exponent)))
+        annuity = np.where(i == 0, k, np.where(total_loss, power - 1, np.expm1(exponent)) / i)
+    annuity = np.where(k == 0, 0.0, annuity)
+    return growth, annuity
+
+
+def contribution_per_period(params: CompoundInterestInput) -> float:
+    """Convert the contribution inputs into an amount added every compounding period."""
+    if params.monthly_contribution > 0:
+        # Monthly contributions
+        if params.compounding_frequency.value == 12:  # Monthly compounding
+            return params.monthly_contribution
+        elif params.compounding_frequency.value == 365:  # Daily compounding
+            return params.monthly_contribution / 30.417  # avg days per month
+        else:  # Annual compounding
+            return params.monthly_contribution * 12
+    else:
+        # Annual contributions
+        if params.compounding_frequency.value == 12:  # Monthly compounding
+            return params.annual_contribution / 12
+        elif params.compounding_frequency.value == 365:  # Daily compounding
+            return params.annual_contribution / 365
+        else:  # Annual compounding
+            return params.annual_contribution
+
+
+def period_contributions(monthly, annual, frequency) -> np.ndarray:
+    """
+    Vectorized contribution_per_period over arrays of contributions and
+    frequencies; schedules and batch calculations both go through it.
+    """
+    monthly = np.asarray(monthly, dtype=np.float64)
+    annual = np.asarray(annual, dtype=np.float64)
+    n = np.asarray(frequency)
+    # Annual contributions are spread over the n periods; monthly ones as above
+    from_monthly = np.where(n == 365, monthly / 30.417, monthly * np.where(n == 1, 12, 1))
+    return np.where(monthly > 0, from_monthly, annual / n)
+
+
+def inflation_per_period(annual_inflation, periods_per_year):
+    """Per-period inflation that compounds to `annual_inflation` (a decimal) over a year."""
+    return np.expm1(np.log1p(annual_inflation) / periods_per_year)
+
+
+def periods_per_year(params: CompoundInterestInput, first_year: int = 1) -> list[int]:
+    """
+    Number of compounding periods in each breakdown year, from `first_year` on.
+
+    Full years get `n` periods; a trailing partial year from `months`
+    gets the whole periods that fit into it (months * n / 12, floored).
+    """
+    n = params.compounding_frequency.value
+    periods = [n] * max(0, params.years - first_year + 1)
+    if params.months > 0 and first_year <= params.years + 1:
+        periods.append(params.months * n // 12)
+    return periods
+
+
+@dataclass
+class ScheduleIntervals:
+    """
+    A scheduled plan split into intervals with constant inputs.
+
+    Interval `j` runs from tick `start[j]` to `end[j]` (ticks are fractions
+    of a year) and holds `periods[j]` compounding periods at `frequency[j]`
+    per year, `annual_rate[j]` percent and `contribution[j]` per period.
+    """
+
+    start: np.ndarray
+    end: np.ndarray
+    periods: np.ndarray
+    frequency: np.ndarray
+    annual_rate: np.ndarray
+    contribution: np.ndarray
+
+
+def schedule_intervals(
+    params: CompoundInterestInput, sample_ticks, ticks_per_year: int = 12, start_tick: int = 0
+) -> ScheduleIntervals:
+    """
+    Split the plan from `start_tick` to the last of `sample_ticks` at every
+    sample and every schedule change, so each interval has constant inputs.
+
+    `ticks_per_year` must be a multiple of 12 so that changes, which start
+    on month boundaries, fall on ticks. Periods are counted as whole periods
+    elapsed since the start of the plan, floor(tick * n / ticks_per_year),
+    so splitting an interval never changes the periods it holds.
+    """
+    # One row per change, the plan's own inputs first; NaN (or frequency 0) leaves a field as is
+    schedule = params.schedule
+    rows = np.empty((len(schedule) + 1, 5))
+    rows[0] = (
+        0,
+        params.annual_rate,
+        params.monthly_contribution,
+        params.annual_contribution,
+        params.compounding_frequency.value,
+    )
+    rows[1:, 0] = schedule.start_month
+    rows[1:, 1] = schedule.annual_rate
+    rows[1:, 2] = schedule.monthly_contribution
+    rows[1:, 3] = schedule.annual_contribution
+    changed_frequency = schedule.compounding_frequency
+    rows[1:, 4] = np.where(changed_frequency > 0, changed_frequency, np.nan)
+    rows = rows[np.argsort(rows[:, 0], kind="stable")]
+
+    # Each field keeps its last set value: forward-fill the gaps
+    set_at = np.where(np.isnan(rows), 0, np.arange(len(rows))[:, None])
+    rows = np.take_along_axis(rows, np.maximum.accumulate(set_at, axis=0), axis=0)
+
+    change_ticks = rows[:, 0].astype(np.int64) * (ticks_per_year // 12)
+    annual_rate = rows[:, 1]
+    frequency = rows[:, 4].astype(np.int64)
+    contribution = period_contributions(rows[:, 2], rows[:, 3], frequency)
+
+    sample_ticks = np.asarray(sample_ticks, dtype=np.int64)
+    end_tick = sample_ticks[-1] if len(sample_ticks) else start_tick
+    inside = (change_ticks > start_tick) & (change_ticks < end_tick)
+    end = np.sort(np.concatenate((change_ticks[inside], sample_ticks)))
+    end = end[np.diff(end, prepend=start_tick) > 0]
+    start = np.concatenate(([start_tick], end[:-1]))
+
+    # Of segments starting on the same tick, the last one listed is in force
+    segment = np.searchsorted(change_ticks, start, side="right") - 1
+    n = frequency[segment]
+    return ScheduleIntervals(
+        start=start,
+        end=end,
+        periods=end * n // ticks_per_year - start * n // ticks_per_year,
+        frequency=n,
+        annual_rate=annual_rate[segment],
+        contribution=contribution[segment],
+    )
+
+
+def schedule_balances(
+    params: CompoundInterestInput, intervals: ScheduleIntervals, start=None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Chain the closed form across intervals.
+
+    Returns the (nominal, after-tax, price level) rows at the end of every
+    interval, starting from `start` (the principal twice and a price level
+    of 1 by default), and the cumulative contributions. Interval j maps a
+    balance B to g_j·B + h_j, so with G_j = g_1···g_j the balances are
+    B_j = G_j·(B_0 + Σ h_l / G_l), all intervals at once.
+    """
+    if start is None:
+        start = (params.principal, params.principal, 1.0)
+    n = intervals.frequency
+    rates = np.stack(
+        [
+            intervals.annual_rate / 100 / n,
+            (intervals.annual_rate - params.tax_drag) / 100 / n,
+            inflation_per_period(params.inflation_rate / 100, n),
+        ]
+    )
+    growth, annuity = growth_factors_array(rates, intervals.periods)
+    added = intervals.contribution * annuity
+    added[2] = 0.0  # prices grow without contributions
+
+    cumulative_growth = np.cumprod(growth, axis=1)
+    balances = cumulative_growth * (
+        np.asarray(start, dtype=np.float64)[:, None] + np.cumsum(added / cumulative_growth, axis=1)
+    )
+    return balances, np.cumsum(intervals.contribution * intervals.periods)
+
+
+def yearly_breakdown_from(
+    params: CompoundInterestInput,
+    first_year: int = 1,
+    balance: float | None = None,
+    after_tax_balance: float | None = None,
+) -> YearlyBreakdownTable:
+    """
+    Closed-form breakdown for years `first_year` onward, all years at once.
+
+    Continues from the nominal and after-tax balances at the end of the
+    year before `first_year` (the principal when starting at year 1). The
+    nominal rate, the after-tax rate and the inflation rate are evaluated
+    as rows of one array, so the real and after-tax columns share a single
+    pass with the nominal balances.
+    """
+    if balance is None:
+        balance = params.principal
+    if after_tax_balance is None:
+        after_tax_balance = balance
+    if params.schedule and first_year <= params.years + (params.months > 0):
+        return _scheduled_breakdown_from(params, first_year, balance, after_tax_balance)
+
+    n = params.compounding_frequency.value
+    period_contribution = contribution_per_period(params)
+
+    # Years before `first_year` are full years (a partial year is always the last)
+    elapsed = n * (first_year - 1)
+    periods = np.array(periods_per_year(params, first_year), dtype=np.int64)
+    rates = np.array(
+        [
+            params.rate_decimal / n,
+            (params.annual_rate - params.tax_drag) / 100 / n,
+            inflation_per_period(params.inflation_rate / 100, n),
+        ]
+    )
+    # Balances grow from the start of `first_year`; prices from the start of the plan
+    cumulative = np.cumsum(periods) + np.array([0, 0, elapsed])[:, None]
+    growth, annuity = growth_factors_array(rates[:, None], cumulative)
+
+    start = np.array([balance, after_tax_balance])[:, None]
+    balances = start * growth[:2] + period_contribution * annuity[:2]
+    ending_balance, after_tax_ending_balance = balances
+    starting_balance = np.concatenate(([balance], ending_balance))[: len(periods)]
+    contributions = period_contribution * periods
+
+    return YearlyBreakdownTable(
+        year=np.arange(first_year, first_year + len(periods)),
+        starting_balance=starting_balance,
+        contributions=contributions,
+        interest_earned=ending_balance - starting_balance - contributions,
+        ending_balance=ending_balance,
+        real_ending_balance=ending_balance / growth[2],
+        after_tax_ending_balance=after_tax_ending_balance,
+    )
+
+
+def year_end_ticks(params: CompoundInterestInput, first_year: int = 1) -> np.ndarray:
+    """Month count at the end of each breakdown year, from `first_year` on."""
+    ends = 12 * np.arange(first_year, params.years + 1)
+    if params.months > 0:
+        ends = np.append(ends, 12 * params.years + params.months)
+    return ends
+
+
+def _scheduled_breakdown_from(
+    params: CompoundInterestInput, first_year: int, balance: float, after_tax_balance: float
+) -> YearlyBreakdownTable:
+    """yearly_breakdown_from for a plan with a schedule, chained across its intervals."""
+    start_tick = 12 * (first_year - 1)
+    price_level = 1.0
+    if first_year > 1:
+        # Prices compound from the start of the plan, not of `first_year`
+        prefix = schedule_intervals(params, [start_tick])
+        price_level = float(schedule_balances(params, prefix)[0][2, -1])
+
+    year_ends = year_end_ticks(params, first_year)
+    intervals = schedule_intervals(params, year_ends, start_tick=start_tick)
+    balances, contributed = schedule_balances(
+        params, intervals, start=(balance, after_tax_balance, price_level)
+    )
+    at_year_end = np.searchsorted(intervals.end, year_ends)
+    ending_balance, after_tax_ending_balance, prices = balances[:, at_year_end]
+    starting_balance = np.concatenate(([balance], ending_balance))[: len(year_ends)]
+    contributions = np.diff(contributed[at_year_end], prepend=0.0)
+
+    return YearlyBreakdownTable(
+        year=np.arange(first_year, first_year + len(year_ends)),
+        starting_balance=starting_balance,
+        contributions=contributions,
+        interest_earned=ending_balance - starting_balance - contributions,
+        ending_balance=ending_balance,
+        real_ending_balance=ending_balance / prices,
+        after_tax_ending_balance=after_tax_ending_balance,
+    )
+
+
+def build_result(
+    params: CompoundInterestInput, yearly_breakdown: YearlyBreakdownTable
+) -> CompoundInterestResult:
+    """Derive the totals of a result from its yearly breakdown."""
+    if yearly_breakdown:
+        final_amount = float(yearly_breakdown.ending_balance[-1])
+        real_final_amount = float(yearly_breakdown.real_ending_balance[-1])
+        after_tax_final_amount = float(yearly_breakdown.after_tax_ending_balance[-1])
+    else:
+        final_amount = real_final_amount = after_tax_final_amount = params.principal
+    total_contributions = float(yearly_breakdown.contributions.sum())
+    total_interest = final_amount - params.principal - total_contributions
+
+    return CompoundInterestResult(
+        final_amount=final_amount,
+        total_contributions=total_contributions,
+        total_interest=total_interest,
+        real_final_amount=real_final_amount,
+        after_tax_final_amount=after_tax_final_amount,
+        yearly_breakdown=yearly_breakdown,
+        input_params=params,
+    )
+
+
 class CompoundInterestCalculator:
-    """Calculator for compound interest with regular contributions."""
+    """
+    Calculator for compound interest with regular contributions.
+
+    With a `rounding` policy, money is kept in whole cents instead of float
+    dollars (the exact-cents engine, which replaces `engine`), so the yearly
+    breakdown sums exactly to the totals.
+    """
+
+    def __init__(
+        self,
+        engine: CalculationEngine = CalculationEngine.ANALYTIC,
+        cache: ResultCache | None = None,
+        rounding: RoundingPolicy | None = None,
+    ):
+        self.engine = engine
+        self.cache = cache
+        self.rounding = rounding
 
     def calculate(self, params: CompoundInterestInput) -> CompoundInterestResult:
         """
@@ -24,72 +355,130 @@ class CompoundInterestCalculator:
         - t = time in years
         - PMT = periodic contribution
         """
-        yearly_breakdown = self._calculate_yearly_breakdown(params)
-
-        final_amount = yearly_breakdown[-1].ending_balance if yearly_breakdown else params.principal
-        total_contributions = sum(yb.contributions for yb in yearly_breakdown)
-        total_interest = final_amount - params.principal - total_contributions
-
-        return CompoundInterestResult(
-            final_amount=final_amount,
-            total_contributions=total_contributions,
-            total_interest=total_interest,
-            yearly_breakdown=yearly_breakdown,
-            input_params=params,
-        )
+        if self.cache is None:
+            return self._calculate(params)
 
-    def _calculate_yearly_breakdown(self, params: CompoundInterestInput) -> list[YearlyBreakdown]:
-        """Calculate year-by-year breakdown."""
-        breakdown = []
-        balance = params.principal
+        key = (self.engine.value, self.rounding and self.rounding.value, params.cache_key())
+        cached = self.cache.get(key)
+        if cached is None:
+            # Store a private copy of the inputs: callers may mutate theirs
+            private = replace(params, schedule=params.schedule and params.schedule.ordered())
+            cached = replace(self._calculate(params), input_params=private)
+            self.cache.put(key, cached)
+        return replace(cached, input_params=params)
+
+    def timeline(self, params: CompoundInterestInput, points_per_year: int = 12) -> Timeline:
+        """
+        Sample the balance `points_per_year` times a year, in closed form.
 
-        # Calculate total periods (considering months)
-        total_years = params.total_periods
+        Each point holds the balance after the compounding periods elapsed by
+        then, so with annual compounding the balance steps once a year.
+        """
+        if params.schedule:
+            return self._scheduled_timeline(params, points_per_year)
 
-        # Determine contribution per compounding period
         n = params.compounding_frequency.value
-        r = params.rate_decimal
-
-        # Convert contributions to per-period amounts
-        if params.monthly_contribution > 0:
-            # Monthly contributions
-            if params.compounding_frequency.value == 12:  # Monthly compounding
-                contribution_per_period = params.monthly_contribution
-            elif params.compounding_frequency.value == 365:  # Daily compounding
-                contribution_per_period = params.monthly_contribution / 30.417  # avg days per month
-            else:  # Annual compounding
-                contribution_per_period = params.monthly_contribution * 12
+        i = params.rate_decimal / n
+        period_contribution = contribution_per_period(params)
+        total_periods = sum(periods_per_year(params))
+
+        points = np.arange(
+            params.years * points_per_year + params.months * points_per_year // 12 + 1
+        )
+        time = points / points_per_year
+        periods = (points // points_per_year) * n + (
+            points % points_per_year
+        ) * n // points_per_year
+        periods = np.minimum(periods, total_periods)
+        if periods[-1] != total_periods:
+            time = np.append(time, params.total_periods)
+            periods = np.append(periods, total_periods)
+
+        growth, annuity = growth_factors_array(i, periods)
+        return Timeline(
+            time=time,
+            balance=params.principal * growth + period_contribution * annuity,
+            invested=params.principal + period_contribution * periods,
+        )
+
+    @staticmethod
+    def _scheduled_timeline(params: CompoundInterestInput, points_per_year: int) -> Timeline:
+        # Ticks fine enough for both the sample points and the months schedules change on
+        ticks_per_year = math.lcm(12, points_per_year)
+        ticks_per_point = ticks_per_year // points_per_year
+        end_tick = params.years * ticks_per_year + params.months * ticks_per_year // 12
+
+        points = np.arange(end_tick // ticks_per_point + 1)
+        time = points / points_per_year
+        ticks = points * ticks_per_point
+        if ticks[-1] != end_tick:
+            time = np.append(time, params.total_periods)
+            ticks = np.append(ticks, end_tick)
+        if end_tick == 0:  # nothing to chain: just the starting point
+            principal = np.full(1, float(params.principal))
+            return Timeline(time=time, balance=principal, invested=principal.copy())
+
+        intervals = schedule_intervals(params, ticks[1:], ticks_per_year)
+        balances, contributed = schedule_balances(params, intervals)
+        at_point = np.searchsorted(intervals.end, ticks[1:])
+        return Timeline(
+            time=time,
+            balance=np.concatenate(([params.principal], balances[0, at_point])),
+            invested=params.principal + np.concatenate(([0.0], contributed[at_point])),
+        )
+
+    def _calculate(self, params: CompoundInterestInput) -> CompoundInterestResult:
+        """Run the configured engine without consulting the cache."""
+        if self.rounding is not None:
+            # Imported here: the exact-cents engine builds on this module
+            from firefly.core.calculators.cents import calculate_cents
+
+            return calculate_cents(params, self.rounding)
+        if self.engine is CalculationEngine.ITERATIVE:
+            yearly_breakdown = self._calculate_yearly_breakdown(params)
         else:
-            # Annual contributions
-            if params.compounding_frequency.value == 12:  # Monthly compounding
-                contribution_per_period = params.annual_contribution / 12
-            elif params.compounding_frequency.value == 365:  # Daily compounding
-                contribution_per_period = params.annual_contribution / 365
-            else:  # Annual compounding
-                contribution_per_period = params.annual_contribution
+            yearly_breakdown = self._calculate_yearly_breakdown_analytic(params)
+        return build_result(params, yearly_breakdown)
+
+    def _calculate_yearly_breakdown_analytic(
+        self, params: CompoundInterestInput
+    ) -> YearlyBreakdownTable:
+        """Calculate year-by-year breakdown in closed form, all years at once."""
+        return yearly_breakdown_from(params)
+
+    def _calculate_yearly_breakdown(self, params: CompoundInterestInput) -> YearlyBreakdownTable:
+        """Calculate year-by-year breakdown period by period (reference implementation)."""
+        breakdown = []
+        balance = params.principal
+        after_tax_balance = params.principal
+        price_level = 1.0
 
         # Calculate for each year
-        for year in range(1, int(total_years) + 2):
+        for year, runs in enumerate(self._yearly_runs(params), start=1):
             starting_balance = balance
             year_contributions = 0
             year_interest = 0
 
-            # Determine how many periods to calculate for this year
-            if year <= total_years:
-                periods_this_year = n if year < total_years else int((total_years - (year - 1)) * n)
-            else:
-                break
+            # Each run has constant inputs; a year has several if its schedule changes
+            for periods, n, annual_rate, period_contribution in runs:
+                r = annual_rate / 100
+                after_tax_r = (annual_rate - params.tax_drag) / 100
+                inflation = float(inflation_per_period(params.inflation_rate / 100, n))
+
+                # Calculate each period within the run
+                for _ in range(periods):
+                    # Add interest
+                    period_interest = balance * (r / n)
+                    balance += period_interest
+                    year_interest += period_interest
 
-            # Calculate each period within the year
-            for _ in range(periods_this_year):
-                # Add interest
-                period_interest = balance * (r / n)
-                balance += period_interest
-                year_interest += period_interest
+                    # Add contribution
+                    balance += period_contribution
+                    year_contributions += period_contribution
 
-                # Add contribution
-                balance += contribution_per_period
-                year_contributions += contribution_per_period
+                    # Same period with the tax drag applied, and the price level after it
+                    after_tax_balance += after_tax_balance * (after_tax_r / n) + period_contribution
+                    price_level *= 1 + inflation
 
             ending_balance = balance
 
@@ -100,7 +489,31 @@ class CompoundInterestCalculator:
                     contributions=year_contributions,
                     interest_earned=year_interest,
                     ending_balance=ending_balance,
+                    real_ending_balance=ending_balance / price_level,
+                    after_tax_ending_balance=after_tax_balance,
                 )
             )
 
-        return breakdown
+        return YearlyBreakdownTable.from_rows(breakdown)
+
+    @staticmethod
+    def _yearly_runs(params: CompoundInterestInput) -> list[list[tuple]]:
+        """Per breakdown year, its (periods, n, annual rate %, contribution) runs."""
+        year_ends = year_end_ticks(params)
+        if not params.schedule or not len(year_ends):
+            n = params.compounding_frequency.value
+            run = (n, params.annual_rate, contribution_per_period(params))
+            return [[(periods, *run)] for periods in periods_per_year(params)]
+
+        intervals = schedule_intervals(params, year_ends)
+        runs = [[] for _ in year_ends]
+        for year, *run in zip(
+            np.searchsorted(year_ends, intervals.end).tolist(),
+            intervals.periods.tolist(),
+            intervals.frequency.tolist(),
+            intervals.annual_rate.tolist(),
+            intervals.contribution.tolist(),
+            strict=True,
+        ):
+            runs[year].append(tuple(run))
+        return runs
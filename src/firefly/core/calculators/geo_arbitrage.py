@@ -0,0 +1,205 @@
+"""Geographic arbitrage: one plan against the cost of living in many locations."""
+
+import math
+from collections.abc import Iterable
+from functools import cache
+
+import numpy as np
+
+from firefly.core.calculators.compound_interest import (
+    contribution_per_period,
+    growth_factors_array,
+)
+from firefly.core.calculators.sensitivity import periods_to_reach
+from firefly.core.data.cost_of_living import load_locations
+from firefly.core.models.compound_interest import CompoundInterestInput
+from firefly.core.models.geo_arbitrage import (
+    GeoArbitrageInput,
+    GeoArbitrageResult,
+    LocationOrder,
+    LocationQuery,
+)
+
+# Guards floor() and ceil() against values a hair off a period boundary
+PERIOD_EPSILON = 1e-9
+
+# Relative error allowed for in the cost ceiling of a query
+CEILING_TOLERANCE = 1e-6
+
+
+def _text(column: np.ndarray) -> np.ndarray:
+    return np.char.decode(column, "utf-8") if column.dtype.kind == "S" else column.astype(str)
+
+
+def _group_rows(values: np.ndarray) -> dict[str, np.ndarray]:
+    """Rows holding each distinct value, in table order."""
+    keys, inverse = np.unique(values, return_inverse=True)
+    rows = np.argsort(inverse, kind="stable")
+    bounds = np.cumsum(np.bincount(inverse, minlength=len(keys)))[:-1]
+    return dict(zip(keys.tolist(), np.split(rows, bounds), strict=True))
+
+
+class LocationTable:
+    """
+    A cost-of-living table and its index.
+
+    Rows are kept cheapest first, and the rows of every country and region
+    are listed up front, so a query selects its candidates without scanning
+    the table and resolves cost thresholds by binary search.
+    """
+
+    def __init__(self, table: np.ndarray):
+        """`table` is a structured array with the columns of load_locations()."""
+        table = table[np.argsort(table["cost_index"], kind="stable")]
+        self.name = _text(table["name"])
+        self.country = _text(table["country"])
+        self.region = _text(table["region"])
+        self.cost_index = np.array(table["cost_index"], dtype=np.float64)
+        self._countries = _group_rows(self.country)
+        self._regions = _group_rows(self.region)
+        self._by_name = {name: row for row, name in reversed(list(enumerate(self.name.tolist())))}
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+    def rows(
+        self, countries: Iterable[str] | None = None, regions: Iterable[str] | None = None
+    ) -> np.ndarray:
+        """Rows in any of `countries` and any of `regions`, cheapest first."""
+        selected = None
+        for values, groups in ((countries, self._countries), (regions, self._regions)):
+            if values is None:
+                continue
+            parts = [groups[value] for value in set(values) if value in groups]
+            rows = np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.intp)
+            selected = rows if selected is None else np.intersect1d(selected, rows, True)
+        return np.arange(len(self)) if selected is None else selected
+
+    def cost_index_of(self, name: str) -> float | None:
+        """Cost index of the first location called `name`, or None if there is none."""
+        row = self._by_name.get(name)
+        return None if row is None else float(self.cost_index[row])
+
+
+@cache
+def default_table() -> LocationTable:
+    """The bundled cost-of-living table, indexed once per process."""
+    return LocationTable(load_locations())
+
+
+def _accumulation_plan(params: GeoArbitrageInput) -> CompoundInterestInput:
+    """The portfolio kept working, saving every year, from today."""
+    return CompoundInterestInput(
+        principal=params.portfolio,
+        annual_rate=params.annual_rate,
+        years=0,
+        annual_contribution=params.annual_savings,
+        compounding_frequency=params.compounding_frequency,
+    )
+
+
+def _outcomes(params: GeoArbitrageInput, cost_index: np.ndarray) -> dict[str, np.ndarray]:
+    """Expenses, FI number, years to FI and share of FI in locations costing `cost_index`."""
+    plan = _accumulation_plan(params)
+    n = plan.compounding_frequency.value
+    expenses = params.annual_expenses * cost_index / params.home_cost_index
+    fi_number = expenses * 100 / params.withdrawal_rate
+    periods = periods_to_reach(
+        params.portfolio, plan.rate_decimal / n, contribution_per_period(plan), fi_number
+    )
+    return {
+        "annual_expenses": expenses,
+        "fi_number": fi_number,
+        "years_to_fi": np.maximum(np.ceil(periods - PERIOD_EPSILON), 0.0) / n,
+        "percent_of_fi": 100 * params.sustainable_withdrawal / expenses,
+    }
+
+
+def _passes(params: GeoArbitrageInput, query: LocationQuery, cost_index: np.ndarray) -> np.ndarray:
+    """Which locations costing `cost_index` pass the thresholds, judged by their outcomes."""
+    passes = np.ones(len(cost_index), dtype=bool)
+    if query.max_cost_index is not None:
+        passes &= cost_index <= query.max_cost_index
+    if query.fi_now or query.max_years_to_fi is not None:
+        outcomes = _outcomes(params, cost_index)
+        if query.fi_now:
+            passes &= outcomes["percent_of_fi"] >= 100
+        if query.max_years_to_fi is not None:
+            passes &= outcomes["years_to_fi"] <= max(query.max_years_to_fi, 0)
+    return passes
+
+
+class GeoArbitrageCalculator:
+    """
+    Calculator for one plan's FI number, time to FI and sustainable
+    lifestyle in every location of a cost-of-living table.
+
+    Expenses scale with a location's cost index, and every outcome is
+    monotonic in expenses, so each threshold in a query (FI today, FI
+    within so many years, a cost cap) is one ceiling on the cost index.
+    With the table sorted by cost, the matches are a prefix of the
+    candidate rows found by binary search, and only the rows returned are
+    evaluated, in one vectorized pass.
+    """
+
+    def __init__(self, table: LocationTable | None = None):
+        self._table = table
+
+    @property
+    def table(self) -> LocationTable:
+        # The bundled table is loaded on first use
+        return self._table if self._table is not None else default_table()
+
+    def compare(
+        self, params: GeoArbitrageInput, query: LocationQuery | None = None
+    ) -> GeoArbitrageResult:
+        """Evaluate `params` in every location matching `query` (all by default)."""
+        query = query or LocationQuery()
+        table = self.table
+        rows = table.rows(query.countries, query.regions)
+        costs = table.cost_index[rows]
+        # The ceiling carries rounding error and cost indices often tie with it,
+        # so rows within a tolerance of it are settled by evaluating them
+        ceiling = self._cost_ceiling(params, query)
+        tolerance = abs(ceiling) * CEILING_TOLERANCE
+        start = np.searchsorted(costs, ceiling - tolerance, "left")
+        end = np.searchsorted(costs, ceiling + tolerance, "right")
+        # Every threshold is monotonic in cost, so the rows passing are a prefix
+        end = start + np.count_nonzero(_passes(params, query, costs[start:end]))
+        matches = rows[:end]
+        if query.order is LocationOrder.MOST_EXPENSIVE:
+            matches = matches[::-1]
+        selected = matches[: query.limit]
+
+        cost_index = table.cost_index[selected]
+        outcomes = _outcomes(params, cost_index)
+        return GeoArbitrageResult(
+            name=table.name[selected],
+            country=table.country[selected],
+            region=table.region[selected],
+            cost_index=cost_index,
+            **outcomes,
+            home_spending=params.sustainable_withdrawal * params.home_cost_index / cost_index,
+            total_matches=len(matches),
+            input_params=params,
+            query=query,
+        )
+
+    @staticmethod
+    def _cost_ceiling(params: GeoArbitrageInput, query: LocationQuery) -> float:
+        """Highest cost index passing the query's thresholds."""
+        ceiling = math.inf if query.max_cost_index is None else query.max_cost_index
+        # A location is FI once the withdrawal covers expenses × index / home index
+        per_dollar = params.withdrawal_rate / 100 * params.home_cost_index / params.annual_expenses
+
+        if query.fi_now:
+            ceiling = min(ceiling, params.portfolio * per_dollar)
+        if query.max_years_to_fi is not None:
+            # The balance moves monotonically, so its best within the horizon is at an end
+            plan = _accumulation_plan(params)
+            n = plan.compounding_frequency.value
+            periods = math.floor(max(query.max_years_to_fi, 0) * n + PERIOD_EPSILON)
+            growth, annuity = growth_factors_array(plan.rate_decimal / n, periods)
+            balance = params.portfolio * growth + contribution_per_period(plan) * annuity
+            ceiling = min(ceiling, max(params.portfolio, float(balance)) * per_dollar)
+        return ceiling
@@ -0,0 +1,262 @@
+"""Milestone finder: when a plan first reaches given balances or its crossover point."""
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from firefly.core.calculators.batch import contribution_per_period_array
+from firefly.core.calculators.compound_interest import (
+    ScheduleIntervals,
+    contribution_per_period,
+    growth_factors_array,
+    inflation_per_period,
+    periods_per_year,
+    schedule_balances,
+    schedule_intervals,
+    year_end_ticks,
+)
+from firefly.core.calculators.sensitivity import periods_to_reach
+from firefly.core.models.batch import BatchCompoundInterestInput
+from firefly.core.models.compound_interest import CompoundInterestInput
+from firefly.core.models.milestones import (
+    BatchMilestoneResult,
+    Milestone,
+    MilestoneInput,
+    MilestoneKind,
+    MilestoneResult,
+)
+
+# Codes for the kinds, so milestones of every kind are evaluated as one array
+KIND_CODES = {kind: code for code, kind in enumerate(MilestoneKind)}
+
+
+@dataclass
+class _Intervals:
+    """
+    Scenarios (rows) cut into intervals with constant inputs (columns).
+
+    `balance`, `price_level` and `annual_rate` have one more column than
+    the others: their values at the start of the plan, then at the end of
+    each interval (with the rate that was in force during it).
+    """
+
+    start: np.ndarray  # years
+    base: np.ndarray  # periods elapsed before the interval, at its frequency
+    periods: np.ndarray
+    frequency: np.ndarray
+    contribution: np.ndarray  # per period
+    inflation: np.ndarray  # per period
+    balance: np.ndarray
+    price_level: np.ndarray
+    annual_rate: np.ndarray
+
+
+def _plan_intervals(plan: CompoundInterestInput) -> _Intervals:
+    """One interval per breakdown year, split further wherever the schedule changes."""
+    year_ends = year_end_ticks(plan)
+    if plan.schedule and len(year_ends):
+        intervals = schedule_intervals(plan, year_ends)
+    else:
+        count = len(year_ends)
+        intervals = ScheduleIntervals(
+            start=year_ends - np.diff(year_ends, prepend=0),
+            end=year_ends,
+            periods=np.array(periods_per_year(plan), dtype=np.int64),
+            frequency=np.full(count, plan.compounding_frequency.value),
+            annual_rate=np.full(count, float(plan.annual_rate)),
+            contribution=np.full(count, contribution_per_period(plan)),
+        )
+    balances, _ = schedule_balances(plan, intervals)
+    n = intervals.frequency
+    first_rate = intervals.annual_rate[0] if len(n) else plan.annual_rate
+
+    return _Intervals(
+        start=(intervals.start / 12)[None],
+        base=(intervals.start * n // 12)[None],
+        periods=intervals.periods[None],
+        frequency=n[None],
+        contribution=intervals.contribution[None],
+        inflation=inflation_per_period(plan.inflation_rate / 100, n)[None],
+        balance=np.concatenate(([plan.principal], balances[0]))[None],
+        price_level=np.concatenate(([1.0], balances[2]))[None],
+        annual_rate=np.concatenate(([first_rate], intervals.annual_rate))[None],
+    )
+
+
+def _batch_intervals(batch: BatchCompoundInterestInput) -> _Intervals:
+    """One interval per breakdown year; shorter scenarios end in empty intervals."""
+    n = batch.compounding_frequency[:, None]
+    total_periods = batch.years * batch.compounding_frequency + (
+        batch.months * batch.compounding_frequency // 12
+    )
+    num_years = batch.years + (batch.months > 0)
+    max_years = int(num_years.max()) if len(batch) else 0
+    elapsed = np.minimum(np.arange(1, max_years + 1) * n, total_periods[:, None])
+    periods = np.diff(elapsed, prepend=0, axis=1)
+
+    inflation = inflation_per_period(batch.inflation_rate / 100, batch.compounding_frequency)
+    growth, annuity = growth_factors_array(
+        np.stack([batch.rate_decimal[:, None] / n, inflation[:, None]]), elapsed
+    )
+    contribution = contribution_per_period_array(batch)[:, None]
+    balance = batch.principal[:, None] * growth[0] + contribution * annuity[0]
+
+    return _Intervals(
+        start=np.broadcast_to(np.arange(max_years, dtype=np.float64), periods.shape),
+        base=elapsed - periods,
+        periods=periods,
+        frequency=np.broadcast_to(n, periods.shape),
+        contribution=np.broadcast_to(contribution, periods.shape),
+        inflation=np.broadcast_to(inflation[:, None], periods.shape),
+        balance=np.concatenate((batch.principal[:, None], balance), axis=1),
+        price_level=np.concatenate((np.ones((len(batch), 1)), growth[1]), axis=1),
+        annual_rate=np.broadcast_to(batch.annual_rate[:, None], (len(batch), max_years + 1)),
+    )
+
+
+def _condition_values(kind, balance, price_level, annual_rate) -> np.ndarray:
+    """The quantity each milestone compares with its amount."""
+    real = balance / price_level
+    return np.where(
+        kind == KIND_CODES[MilestoneKind.BALANCE],
+        balance,
+        np.where(kind == KIND_CODES[MilestoneKind.REAL_BALANCE], real, real * annual_rate / 100),
+    )
+
+
+class MilestoneFinder:
+    """
+    Finder for the compounding period in which each milestone is first met.
+
+    The plan is cut into intervals with constant inputs, at most a year
+    long, and the closed form gives every quantity at their ends in one
+    pass. A running maximum over those values is sorted, so a single
+    binary search per milestone finds the first interval by whose end it
+    is met. Within it, the closed form is inverted for the period, with
+    bisection on it as the fallback.
+    All milestones (and, for batches, all scenarios) are located together,
+    so dozens of milestones cost about as much as one calculation.
+
+    Conditions are checked at interval ends, so one that holds only
+    briefly inside an interval is missed. The nominal balance moves
+    monotonically within an interval, so balance milestones are exact.
+    """
+
+    def find(self, params: MilestoneInput) -> MilestoneResult:
+        """Locate every milestone of `params` on its plan."""
+        years, balance = self._locate(_plan_intervals(params.plan), params.milestones)
+        return MilestoneResult(
+            milestones=list(params.milestones),
+            years=years[0],
+            balance=balance[0],
+            input_params=params,
+        )
+
+    def find_batch(
+        self, batch: BatchCompoundInterestInput, milestones: Sequence[Milestone]
+    ) -> BatchMilestoneResult:
+        """Locate every milestone in every scenario of `batch` at once."""
+        years, balance = self._locate(_batch_intervals(batch), milestones)
+        return BatchMilestoneResult(milestones=list(milestones), years=years, balance=balance)
+
+    @staticmethod
+    def _locate(
+        intervals: _Intervals, milestones: Sequence[Milestone]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Years until each milestone is met (inf if never) and the balance then."""
+        num_scenarios, num_columns = intervals.balance.shape
+        kind = np.array([KIND_CODES[milestone.kind] for milestone in milestones], dtype=np.int64)
+        amount = np.array([milestone.amount for milestone in milestones], dtype=np.float64)
+
+        # Column at which each milestone is first met: 0 at the start, num_columns if never
+        column = np.empty((num_scenarios, len(milestones)), dtype=np.int64)
+        for code in sorted(set(kind.tolist())):
+            selected = np.flatnonzero(kind == code)
+            values = np.maximum.accumulate(
+                _condition_values(
+                    code, intervals.balance, intervals.price_level, intervals.annual_rate
+                ),
+                axis=1,
+            )
+            if num_scenarios == 1:
+                column[:, selected] = np.searchsorted(values[0], amount[selected])
+            else:
+                column[:, selected] = (values[:, None, :] < amount[selected, None]).sum(axis=2)
+
+        years = np.where(column == 0, 0.0, np.inf)
+        balance = np.where(column == 0, intervals.balance[:, :1], np.nan)
+        scenario, index = np.nonzero((column > 0) & (column < num_columns))
+        if not len(scenario):
+            return years, balance
+
+        # From here on, one entry per milestone met inside an interval
+        interval = column[scenario, index] - 1
+        kind, amount = kind[index], amount[index]
+        n = intervals.frequency[scenario, interval]
+        annual_rate = intervals.annual_rate[scenario, interval + 1]
+        rates = np.stack([annual_rate / 100 / n, intervals.inflation[scenario, interval]])
+        start_balance = intervals.balance[scenario, interval]
+        start_price = intervals.price_level[scenario, interval]
+        contribution = intervals.contribution[scenario, interval]
+
+        def state(periods, at=slice(None)):
+            growth, annuity = growth_factors_array(rates[:, at], periods)
+            return (
+                start_balance[at] * growth[0] + contribution[at] * annuity[0],
+                start_price[at] * growth[1],
+            )
+
+        def met(periods, at=slice(None)):
+            values = _condition_values(kind[at], *state(periods, at), annual_rate[at])
+            return values >= amount[at]
+
+        # Invert the closed form for the period. A milestone needs a nominal balance of
+        # `needed` times the price level (for amounts in today's dollars), which barely
+        # moves within an interval: two fixed-point steps on it, extrapolated with
+        # Aitken's method, land within rounding. Checking the periods either side of
+        # the estimate settles that.
+        high = intervals.periods[scenario, interval]
+        indexed = kind != KIND_CODES[MilestoneKind.BALANCE]
+        with np.errstate(divide="ignore"):
+            needed = amount * np.where(
+                kind == KIND_CODES[MilestoneKind.CROSSOVER], 100 / annual_rate, 1.0
+            )
+
+        def step(periods):
+            price = np.where(indexed, start_price * np.exp(periods * np.log1p(rates[1])), 1.0)
+            periods = periods_to_reach(start_balance, rates[0], contribution, needed * price)
+            return np.minimum(periods, high)
+
+        first = high.astype(np.float64)
+        second = step(first)
+        guess = step(second)
+        if indexed.any():
+            with np.errstate(divide="ignore", invalid="ignore"):
+                change = guess - second
+                accelerated = guess - change**2 / (change - (second - first))
+            guess = np.where(np.isfinite(accelerated), accelerated, guess)
+        guess = np.clip(np.ceil(guess), 1, np.maximum(high, 1)).astype(np.int64)
+        settled = met(guess) & ~met(guess - 1)
+        high = np.where(settled, guess, high)
+
+        # The rest bisect on the interval's periods: unmet at its start, met by its end
+        pending = np.flatnonzero(~settled)
+        if len(pending):
+            low, top = np.zeros(len(pending), dtype=np.int64), high[pending]
+            for _ in range(math.ceil(math.log2(int(top.max()) + 1))):
+                middle = (low + top) // 2
+                open_ = top - low > 1
+                is_met = met(middle, pending)
+                top = np.where(open_ & is_met, middle, top)
+                low = np.where(open_ & ~is_met, middle, low)
+            high[pending] = top
+
+        # An interval without periods (a mid-year change under annual compounding)
+        # meets a crossover as its new rate starts
+        years[scenario, index] = np.maximum(
+            (intervals.base[scenario, interval] + high) / n, intervals.start[scenario, interval]
+        )
+        balance[scenario, index] = state(high)[0]
+        return years, balance
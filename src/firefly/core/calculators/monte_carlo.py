@@ -0,0 +1,308 @@
+"""Monte Carlo simulation of portfolio growth under variable returns."""
+
+import math
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+
+import numpy as np
+
+from firefly.core.calculators.compound_interest import contribution_per_period
+from firefly.core.models.compound_interest import CompoundInterestInput
+from firefly.core.models.monte_carlo import (
+    DistributionType,
+    MonteCarloInput,
+    MonteCarloResult,
+    ReturnDistribution,
+)
+
+# Returns are drawn at most monthly; daily draws add noise, not information
+MAX_STEPS_PER_YEAR = 12
+
+# Points per year a quantile sketch keeps. Studies of up to this many paths get
+# exact percentiles; larger ones are accurate to about 1 / SKETCH_SIZE in rank
+SKETCH_SIZE = 2048
+
+# Sketches merged at a time when folding chunk summaries
+MERGE_FAN_IN = 8
+
+
+def _steps_per_year(plan: CompoundInterestInput) -> int:
+    return min(plan.compounding_frequency.value, MAX_STEPS_PER_YEAR)
+
+
+def _year_end_steps(plan: CompoundInterestInput) -> np.ndarray:
+    """Cumulative step index at the end of each breakdown year."""
+    steps = _steps_per_year(plan)
+    per_year = [steps] * plan.years
+    if plan.months > 0:
+        per_year.append(plan.months * steps // 12)
+    return np.cumsum(per_year, dtype=np.int64)
+
+
+def draw_growth(
+    rng: np.random.Generator, distribution: ReturnDistribution, steps_per_year: int, shape
+) -> np.ndarray:
+    """
+    Draw per-step growth factors (1 + return) for a paths x steps grid.
+
+    Both distributions give each step's return an arithmetic mean of
+    mean / steps_per_year and a standard deviation of volatility /
+    sqrt(steps_per_year), so they differ only in shape.
+    """
+    step_mean = distribution.mean / 100 / steps_per_year
+    step_volatility = distribution.volatility / 100 / math.sqrt(steps_per_year)
+
+    if distribution.kind is DistributionType.NORMAL:
+        return 1 + rng.normal(step_mean, step_volatility, size=shape)
+
+    # Lognormal: pick log-return parameters so the step's growth factor has
+    # arithmetic mean 1 + step_mean and standard deviation step_volatility
+    log_variance = math.log1p((step_volatility / (1 + step_mean)) ** 2)
+    log_mean = math.log1p(step_mean) - log_variance / 2
+    return np.exp(rng.normal(log_mean, math.sqrt(log_variance), size=shape))
+
+
+def simulate_chunk(
+    plan: CompoundInterestInput,
+    distribution: ReturnDistribution,
+    num_paths: int,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    """Simulate one chunk of paths; returns a paths x years matrix of year-end balances."""
+    rng = np.random.default_rng(seed)
+    steps_per_year = _steps_per_year(plan)
+    year_ends = _year_end_steps(plan)
+    total_steps = int(year_ends[-1]) if len(year_ends) else 0
+
+    growth = draw_growth(rng, distribution, steps_per_year, (num_paths, total_steps))
+    step_contribution = (
+        contribution_per_period(plan) * plan.compounding_frequency.value / steps_per_year
+    )
+
+    balances = np.full(num_paths, plan.principal, dtype=np.float64)
+    yearly = np.empty((num_paths, len(year_ends)), dtype=np.float64)
+
+    year = 0
+    for step in range(total_steps):
+        balances *= growth[:, step]
+        balances += step_contribution
+        while year < len(year_ends) and year_ends[year] == step + 1:
+            yearly[:, year] = balances
+            year += 1
+    # Zero-length trailing years (e.g. months with annual steps) end where they started
+    while year < len(year_ends):
+        yearly[:, year] = balances
+        year += 1
+
+    return yearly
+
+
+@dataclass(eq=False)
+class QuantileSketch:
+    """
+    The distribution of balances in every year, in bounded memory.
+
+    Each row holds one year's points in sorted order; a point stands for
+    its weight in consecutive paths, at the value of the middle one.
+    Sketches of disjoint paths merge into one of at most SKETCH_SIZE points
+    per year.
+    """
+
+    values: np.ndarray  # years x points
+    count: int  # paths summarized
+    weights: np.ndarray | None = None  # years x points; None: count / points each
+
+    @classmethod
+    def from_balances(cls, yearly: np.ndarray) -> "QuantileSketch":
+        """Sketch a paths x years matrix of balances."""
+        # Years as contiguous rows: sorting along a strided axis is several times slower
+        values = np.ascontiguousarray(yearly.T)
+        values.sort(axis=1)
+        return cls(values, len(yearly)).compressed()
+
+    @classmethod
+    def merge(cls, sketches: list["QuantileSketch"]) -> "QuantileSketch":
+        """One sketch of all the paths the given sketches summarize."""
+        values = np.concatenate([sketch.values for sketch in sketches], axis=1)
+        count = sum(sketch.count for sketch in sketches)
+        if len({sketch._point_weight for sketch in sketches}) == 1:
+            # Points of equal weight (e.g. full chunks) stay equal: no weights to carry
+            values.sort(axis=1)
+            return cls(values, count).compressed()
+        weights = np.concatenate([sketch._weights() for sketch in sketches], axis=1)
+        order = np.argsort(values, axis=1)
+        return cls(
+            np.take_along_axis(values, order, axis=1),
+            count,
+            np.take_along_axis(weights, order, axis=1),
+        ).compressed()
+
+    def compressed(self, size: int = SKETCH_SIZE) -> "QuantileSketch":
+        """Resample to `size` points of equal weight if there are more."""
+        if self.values.shape[1] <= size:
+            return self
+        block = self.count / size
+        return QuantileSketch(self._at_ranks(block * np.arange(size) + (block - 1) / 2), self.count)
+
+    def quantiles(self, percentiles) -> np.ndarray:
+        """
+        Percentiles x years, as np.percentile's default (linear) method
+        gives them, exactly while no points have been merged together.
+        """
+        ranks = (self.count - 1) * np.asarray(percentiles, dtype=np.float64) / 100
+        return self._at_ranks(ranks).T
+
+    @property
+    def _point_weight(self) -> float | None:
+        """Paths per point if all points stand for as many, else None."""
+        return None if self.weights is not None else self.count / self.values.shape[1]
+
+    def _weights(self) -> np.ndarray:
+        if self.weights is not None:
+            return self.weights
+        return np.full(self.values.shape, self._point_weight)
+
+    def _at_ranks(self, ranks: np.ndarray) -> np.ndarray:
+        """Years x ranks: values at 0-based `ranks` of each year's sorted balances."""
+        points = self.values.shape[1]
+        per_point = self._point_weight
+        if per_point is not None:
+            # Evenly spaced points: interpolate between neighbours for all years at once
+            index = np.clip((ranks - (per_point - 1) / 2) / per_point, 0, points - 1)
+            low = np.floor(index).astype(np.intp)
+            high = np.minimum(low + 1, points - 1)
+            fraction = index - low
+            return self.values[:, low] * (1 - fraction) + self.values[:, high] * fraction
+
+        # Middle rank of the paths each point stands for
+        positions = np.cumsum(self.weights, axis=1) - (self.weights + 1) / 2
+        values = np.empty((len(self.values), len(ranks)))
+        for year, row in enumerate(self.values):
+            values[year] = np.interp(ranks, positions[year], row)
+        return values
+
+
+@dataclass(eq=False)
+class ChunkSummary:
+    """What a chunk of paths contributes to a MonteCarloResult."""
+
+    sketch: QuantileSketch
+    final_sum: float  # sum of final balances
+    target_hits: int  # paths ending at or above the target
+
+    @classmethod
+    def from_balances(cls, yearly: np.ndarray, target: float | None = None) -> "ChunkSummary":
+        """Summarize a paths x years matrix of balances from `simulate_chunk`."""
+        final = yearly[:, -1] if yearly.shape[1] else np.empty(0)
+        return cls(
+            sketch=QuantileSketch.from_balances(yearly),
+            final_sum=float(final.sum()),
+            target_hits=int((final >= target).sum()) if target is not None else 0,
+        )
+
+
+def summarize_chunk(
+    plan: CompoundInterestInput,
+    distribution: ReturnDistribution,
+    num_paths: int,
+    seed: np.random.SeedSequence,
+    target: float | None = None,
+) -> ChunkSummary:
+    """Simulate one chunk of paths and reduce it where it ran, keeping only its summary."""
+    return ChunkSummary.from_balances(simulate_chunk(plan, distribution, num_paths, seed), target)
+
+
+class MonteCarloSimulator:
+    """
+    Simulator for portfolio outcomes under random returns.
+
+    Paths are split into fixed-size chunks, each with its own child of the
+    seed's SeedSequence, so results depend on `seed` and `chunk_size` only,
+    never on `workers`. Peak memory per chunk is chunk_size x periods.
+    Each chunk is reduced to a quantile sketch of SKETCH_SIZE points per
+    year where it ran, and sketches are merged as they arrive, so a
+    study's memory grows with the logarithm of its paths, not with them.
+    Percentiles are exact up to SKETCH_SIZE paths.
+    """
+
+    def __init__(self, workers: int = 1):
+        self.workers = workers
+
+    def simulate(self, params: MonteCarloInput) -> MonteCarloResult:
+        """Run the simulation and summarise it as percentile bands."""
+        tasks = self.chunk_tasks(params)
+
+        if self.workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                summaries = executor.map(
+                    summarize_chunk, *zip(*tasks, strict=True), repeat(params.target)
+                )
+                return self.summarize(params, summaries)
+        summaries = (summarize_chunk(*task, params.target) for task in tasks)
+        return self.summarize(params, summaries)
+
+    @staticmethod
+    def chunk_tasks(params: MonteCarloInput) -> list[tuple]:
+        """Argument tuples for `simulate_chunk`, one per chunk of paths."""
+        chunk_sizes = [params.chunk_size] * (params.num_paths // params.chunk_size)
+        if params.num_paths % params.chunk_size:
+            chunk_sizes.append(params.num_paths % params.chunk_size)
+        seeds = np.random.SeedSequence(params.seed).spawn(len(chunk_sizes))
+
+        return [
+            (params.plan, params.distribution, size, seed)
+            for size, seed in zip(chunk_sizes, seeds, strict=True)
+        ]
+
+    @staticmethod
+    def summarize(params: MonteCarloInput, summaries: Iterable[ChunkSummary]) -> MonteCarloResult:
+        """
+        Combine chunk summaries, in task order, into percentile bands.
+
+        Sketches are merged MERGE_FAN_IN at a time as they arrive, like the
+        digits of a counter, so at most MERGE_FAN_IN per level are held.
+        """
+        levels: list[list[QuantileSketch]] = []
+        final_sum, target_hits = 0.0, 0
+        for summary in summaries:
+            final_sum += summary.final_sum
+            target_hits += summary.target_hits
+            carry = summary.sketch
+            for level in levels:
+                level.append(carry)
+                if len(level) < MERGE_FAN_IN:
+                    break
+                carry = QuantileSketch.merge(level)
+                level.clear()
+            else:
+                levels.append([carry])
+        sketch = QuantileSketch.merge([sketch for level in levels for sketch in level])
+
+        percentiles = tuple(params.percentiles)
+        yearly_percentiles = sketch.quantiles(percentiles)
+        if yearly_percentiles.shape[1]:
+            final_percentiles = yearly_percentiles[:, -1]
+            mean_final = final_sum / params.num_paths
+            success_share = target_hits / params.num_paths
+        else:
+            # No years: every path ends where it started
+            principal = float(params.plan.principal)
+            final_percentiles = np.full(len(percentiles), principal)
+            mean_final = principal
+            success_share = float(params.target is not None and principal >= params.target)
+
+        success_probability = None
+        if params.target is not None:
+            success_probability = success_share
+
+        return MonteCarloResult(
+            percentiles=percentiles,
+            yearly_percentiles=yearly_percentiles,
+            final_amount_percentiles=final_percentiles,
+            mean_final_amount=mean_final,
+            success_probability=success_probability,
+            num_paths=params.num_paths,
+            input_params=params,
+        )
@@ -0,0 +1,80 @@
+"""One More Year calculator: what each additional working year buys."""
+
+import math
+
+import numpy as np
+
+from firefly.core.calculators.compound_interest import (
+    contribution_per_period,
+    yearly_breakdown_from,
+)
+from firefly.core.calculators.sensitivity import periods_to_reach
+from firefly.core.models.compound_interest import CompoundInterestInput
+from firefly.core.models.one_more_year import OneMoreYearInput, OneMoreYearResult
+
+# Guards ceil() against a crossing computed a hair past a period boundary
+PERIOD_EPSILON = 1e-9
+
+
+def accumulation_plan(params: OneMoreYearInput) -> CompoundInterestInput:
+    """The portfolio kept working for `max_years`, saving every year."""
+    return CompoundInterestInput(
+        principal=params.current_portfolio,
+        annual_rate=params.annual_rate,
+        years=params.max_years,
+        annual_contribution=params.annual_savings,
+        compounding_frequency=params.compounding_frequency,
+    )
+
+
+class OneMoreYearCalculator:
+    """
+    Calculator for the marginal value of working one more year.
+
+    Retiring after y more years means retiring with the year-y balance of a
+    single accumulation plan, so the whole table comes from that plan's
+    closed-form yearly breakdown, and each row's deltas from its neighbour:
+    O(horizon) instead of one full calculation per candidate year.
+    """
+
+    def calculate(self, params: OneMoreYearInput) -> OneMoreYearResult:
+        """Tabulate retiring now and after each of the next `max_years` years."""
+        plan = accumulation_plan(params)
+        breakdown = yearly_breakdown_from(plan)
+        portfolio = np.concatenate(([float(params.current_portfolio)], breakdown.ending_balance))
+
+        withdrawal = portfolio * params.withdrawal_rate / 100
+        percent_of_fi = 100 * withdrawal / params.annual_expenses
+        with np.errstate(divide="ignore", invalid="ignore"):
+            withdrawal_increase = np.diff(withdrawal, prepend=np.nan)
+            relative_increase = (
+                100 * withdrawal_increase / np.concatenate(([np.nan], withdrawal[:-1]))
+            )
+
+        return OneMoreYearResult(
+            years=np.arange(len(portfolio)),
+            portfolio=portfolio,
+            sustainable_withdrawal=withdrawal,
+            percent_of_fi=percent_of_fi,
+            withdrawal_increase=withdrawal_increase,
+            percent_of_fi_increase=np.diff(percent_of_fi, prepend=np.nan),
+            relative_increase=relative_increase,
+            fi_years=self._fi_years(params, plan),
+            input_params=params,
+        )
+
+    @staticmethod
+    def _fi_years(params: OneMoreYearInput, plan: CompoundInterestInput) -> float | None:
+        """Years of work until the FI number, to the period; may be beyond max_years."""
+        n = plan.compounding_frequency.value
+        periods = float(
+            periods_to_reach(
+                plan.principal,
+                plan.rate_decimal / n,
+                contribution_per_period(plan),
+                params.fi_number,
+            )
+        )
+        if not math.isfinite(periods):
+            return None
+        return math.ceil(periods - PERIOD_EPSILON) / n
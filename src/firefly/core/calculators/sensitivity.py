@@ -0,0 +1,266 @@
+"""Sensitivity of a compound interest plan to each of its inputs."""
+
+from dataclasses import replace
+
+import numpy as np
+
+from firefly.core.calculators.compound_interest import (
+    contribution_per_period,
+    growth_factors_array,
+    periods_per_year,
+)
+from firefly.core.models.compound_interest import CompoundingFrequency, CompoundInterestInput
+from firefly.core.models.sensitivity import PerturbationGrid, SensitivityInput, SensitivityResult
+
+# Numeric CompoundInterestInput fields, in gradient order
+GRADIENT_FIELDS = (
+    "principal",
+    "annual_rate",
+    "years",
+    "months",
+    "monthly_contribution",
+    "annual_contribution",
+)
+
+# Below this rate per period the annuity derivative uses its series limit
+SMALL_RATE = 1e-8
+
+
+def _final_amount(principal, rate_per_period, contribution, periods) -> np.ndarray:
+    growth, annuity = growth_factors_array(rate_per_period, periods)
+    return principal * growth + contribution * annuity
+
+
+def _slopes(principal, rate_per_period, contribution, periods) -> dict[str, np.ndarray]:
+    """Derivatives of the final amount with respect to P, i, PMT and the period count k."""
+    i = np.asarray(rate_per_period, dtype=np.float64)
+    k = np.asarray(periods, dtype=np.float64)
+    growth, annuity = growth_factors_array(i, k)
+    log_growth = np.log1p(i)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth_by_rate = k * growth / (1 + i)
+        annuity_by_rate = np.where(
+            np.abs(i) < SMALL_RATE,
+            k * (k - 1) / 2,
+            (growth_by_rate * i - (growth - 1)) / i**2,
+        )
+        annuity_by_periods = np.where(i == 0, 1.0, growth * log_growth / i)
+
+    return {
+        "principal": growth,
+        "contribution": annuity,
+        "rate": principal * growth_by_rate + contribution * annuity_by_rate,
+        "periods": principal * growth * log_growth + contribution * annuity_by_periods,
+    }
+
+
+def periods_to_reach(principal, rate_per_period, contribution, target) -> np.ndarray:
+    """
+    Continuous number of periods until the balance reaches `target`:
+    k = ln[(Ti + PMT) / (Pi + PMT)] / ln(1 + i), or (T - P) / PMT at i = 0.
+    Zero if already reached, inf if never.
+    """
+    i = np.asarray(rate_per_period, dtype=np.float64)
+    contribution = np.asarray(contribution, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = (target * i + contribution) / (principal * i + contribution)
+        periods = np.where(i == 0, (target - principal) / contribution, np.log(ratio) / np.log1p(i))
+    periods = np.where(principal >= target, 0.0, periods)
+    return np.where(periods >= 0, periods, np.inf)
+
+
+class SensitivityAnalyzer:
+    """
+    Sensitivity analysis from the closed form, without re-running the calculator.
+
+    With k periods at rate i per period, the final amount is
+    FV = P(1 + i)^k + PMT × [((1 + i)^k - 1) / i], which is differentiated
+    exactly with respect to every input. Time to a target T inverts it
+    for k, and its derivatives follow from the implicit function theorem:
+    dt/dθ = -(∂FV/∂θ) / (∂FV/∂t) at the crossing. The perturbation grid for
+    all fields is evaluated as one array expression.
+    """
+
+    def analyze(self, params: SensitivityInput) -> SensitivityResult:
+        """Compute gradients and perturbation grids for `params.plan`."""
+        plan = params.plan
+        n = plan.compounding_frequency.value
+        i = plan.rate_decimal / n
+        contribution = contribution_per_period(plan)
+        periods = sum(periods_per_year(plan))
+
+        # Per-period contribution per dollar of each contribution field
+        unit_monthly = contribution_per_period(
+            replace(plan, monthly_contribution=1, annual_contribution=0)
+        )
+        unit_annual = contribution_per_period(
+            replace(plan, monthly_contribution=0, annual_contribution=1)
+        )
+
+        final_amount = float(_final_amount(plan.principal, i, contribution, periods))
+        final_amount_gradient = self._gradient(
+            plan, _slopes(plan.principal, i, contribution, periods), unit_monthly, unit_annual
+        )
+
+        time_to_target = None
+        time_to_target_gradient = None
+        if params.target is not None:
+            periods_to_target = float(
+                periods_to_reach(plan.principal, i, contribution, params.target)
+            )
+            time_to_target = periods_to_target / n
+            time_to_target_gradient = self._time_to_target_gradient(
+                plan, periods_to_target, unit_monthly, unit_annual
+            )
+
+        return SensitivityResult(
+            final_amount=final_amount,
+            time_to_target=time_to_target,
+            final_amount_gradient=final_amount_gradient,
+            time_to_target_gradient=time_to_target_gradient,
+            grids=self._grids(params, unit_monthly, unit_annual),
+            input_params=params,
+        )
+
+    @staticmethod
+    def _gradient(
+        plan: CompoundInterestInput,
+        slopes: dict[str, np.ndarray],
+        unit_monthly: float,
+        unit_annual: float,
+    ) -> dict[str, float]:
+        """Map slopes in (P, i, PMT, k) onto the input fields by the chain rule."""
+        n = plan.compounding_frequency.value
+        monthly_active = plan.monthly_contribution > 0
+        # Raising monthly from zero replaces an annual contribution: a jump, not a slope
+        monthly_slope = (
+            np.nan if not monthly_active and plan.annual_contribution > 0 else unit_monthly
+        )
+        annual_slope = 0.0 if monthly_active else unit_annual
+
+        return {
+            "principal": float(slopes["principal"]),
+            "annual_rate": float(slopes["rate"]) / (100 * n),
+            "years": float(slopes["periods"]) * n,
+            "months": float(slopes["periods"]) * n / 12,
+            "monthly_contribution": float(slopes["contribution"]) * monthly_slope,
+            "annual_contribution": float(slopes["contribution"]) * annual_slope,
+        }
+
+    def _time_to_target_gradient(
+        self,
+        plan: CompoundInterestInput,
+        periods_to_target: float,
+        unit_monthly: float,
+        unit_annual: float,
+    ) -> dict[str, float]:
+        if periods_to_target == 0 or not np.isfinite(periods_to_target):
+            # Already there, or never: small changes don't move the answer
+            value = 0.0 if periods_to_target == 0 else np.nan
+            return dict.fromkeys(GRADIENT_FIELDS, value)
+
+        n = plan.compounding_frequency.value
+        i = plan.rate_decimal / n
+        contribution = contribution_per_period(plan)
+        slopes = _slopes(plan.principal, i, contribution, periods_to_target)
+        gradient = self._gradient(plan, slopes, unit_monthly, unit_annual)
+        balance_per_year = float(slopes["periods"]) * n
+        return {
+            # The plan's horizon doesn't move the crossing
+            name: 0.0 if name in ("years", "months") else -value / balance_per_year
+            for name, value in gradient.items()
+        }
+
+    @staticmethod
+    def _grids(
+        params: SensitivityInput, unit_monthly: float, unit_annual: float
+    ) -> list[PerturbationGrid]:
+        """Evaluate every field's perturbations in one vectorized pass."""
+        plan = params.plan
+        n = plan.compounding_frequency.value
+        rate = plan.annual_rate
+        contribution = contribution_per_period(plan)
+        periods = sum(periods_per_year(plan))
+        relative = 1 + np.array([0.0, *params.relative_steps])
+        rate_steps = np.array([0.0, *params.rate_steps])
+
+        # Per field: perturbed values and the (P, rate %, PMT, k, n) of each scenario
+        scenarios = {}
+
+        def add(
+            field,
+            values,
+            principal=plan.principal,
+            annual_rate=rate,
+            period_contribution=contribution,
+            total_periods=periods,
+            frequency=n,
+        ):
+            values = np.asarray(values, dtype=np.float64)
+            columns = np.broadcast_arrays(
+                values, principal, annual_rate, period_contribution, total_periods, frequency
+            )
+            scenarios[field] = [np.array(column, dtype=np.float64) for column in columns]
+
+        principal = plan.principal * relative
+        add("principal", principal, principal=principal)
+
+        annual_rate = rate + rate_steps
+        add("annual_rate", annual_rate, annual_rate=annual_rate)
+
+        years = plan.years * relative
+        add("years", years, total_periods=periods + n * (years - plan.years))
+
+        months = plan.months * relative
+        add("months", months, total_periods=periods + n * (months - plan.months) / 12)
+
+        monthly = plan.monthly_contribution * relative
+        monthly_contribution = np.where(
+            monthly > 0, monthly * unit_monthly, plan.annual_contribution * unit_annual
+        )
+        add("monthly_contribution", monthly, period_contribution=monthly_contribution)
+
+        annual = plan.annual_contribution * relative
+        annual_contribution = (
+            np.full_like(annual, contribution)
+            if plan.monthly_contribution > 0
+            else annual * unit_annual
+        )
+        add("annual_contribution", annual, period_contribution=annual_contribution)
+
+        alternatives = [replace(plan, compounding_frequency=f) for f in CompoundingFrequency]
+        add(
+            "compounding_frequency",
+            [alt.compounding_frequency.value for alt in alternatives],
+            period_contribution=[contribution_per_period(alt) for alt in alternatives],
+            total_periods=[sum(periods_per_year(alt)) for alt in alternatives],
+            frequency=[alt.compounding_frequency.value for alt in alternatives],
+        )
+
+        columns = [np.concatenate(column) for column in zip(*scenarios.values(), strict=True)]
+        _, all_principal, all_rate, all_contribution, all_periods, all_n = columns
+        rate_per_period = all_rate / 100 / all_n
+
+        final_amount = _final_amount(all_principal, rate_per_period, all_contribution, all_periods)
+        time_to_target = None
+        if params.target is not None:
+            time_to_target = (
+                periods_to_reach(all_principal, rate_per_period, all_contribution, params.target)
+                / all_n
+            )
+
+        grids = []
+        offset = 0
+        for field, (values, *_) in scenarios.items():
+            rows = slice(offset, offset + len(values))
+            offset += len(values)
+            grids.append(
+                PerturbationGrid(
+                    field=field,
+                    values=values,
+                    final_amount=final_amount[rows],
+                    time_to_target=None if time_to_target is None else time_to_target[rows],
+                )
+            )
+        return grids
@@ -0,0 +1,127 @@
+"""FIRE formula solver: given three of x, r, N and t, solve for the fourth."""
+
+import numpy as np
+
+from firefly.core.calculators.compound_interest import growth_factors_array
+from firefly.core.models.solver import FormulaSolverInput, FormulaSolverResult, SolveFor
+
+# Search bracket for the return rate (decimal): -99% to +100% real per year
+RETURN_RATE_BRACKET = (-0.99, 1.0)
+MAX_ITERATIONS = 60
+TOLERANCE = 1e-12
+
+
+class FormulaSolver:
+    """
+    Solver for the savings-rate model of time to FI.
+
+    Someone saving a fraction x of their income each year (at year end), with
+    a current portfolio worth p years of income, earning a real return r,
+    reaches FI after t years once the portfolio covers N years of expenses:
+
+    p(1 + r)^t + x × [((1 + r)^t - 1) / r] = N(1 - x)
+
+    Income cancels out. Savings rate, FI multiplier and years have closed-form
+    inversions; the return rate is found with safeguarded Newton iteration.
+    All inputs may be arrays, so many scenarios are solved per call.
+    """
+
+    def solve(self, params: FormulaSolverInput) -> FormulaSolverResult:
+        """Solve for `params.solve_for` from the other three variables."""
+        names = ["savings_rate", "return_rate", "fi_multiplier", "years"]
+        names.remove(params.solve_for.value)
+        missing = [name for name in names if getattr(params, name) is None]
+        if missing:
+            raise ValueError(f"Solving for {params.solve_for.value} requires {', '.join(missing)}")
+
+        known = {name: np.asarray(getattr(params, name), dtype=np.float64) for name in names}
+        known["portfolio_multiple"] = np.asarray(params.portfolio_multiple, dtype=np.float64)
+        shape = np.broadcast_shapes(*(value.shape for value in known.values()))
+        known = {name: np.broadcast_to(value, shape) for name, value in known.items()}
+
+        x = known.get("savings_rate", np.zeros(shape)) / 100
+        r = known.get("return_rate", np.zeros(shape)) / 100
+        multiplier = known.get("fi_multiplier", np.zeros(shape))
+        t = known.get("years", np.zeros(shape))
+        p = known["portfolio_multiple"]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if params.solve_for is SolveFor.YEARS:
+                value = self._solve_years(x, r, multiplier, p)
+            elif params.solve_for is SolveFor.SAVINGS_RATE:
+                value = self._solve_savings_rate(r, multiplier, t, p) * 100
+            elif params.solve_for is SolveFor.FI_MULTIPLIER:
+                value = self._solve_fi_multiplier(x, r, t, p)
+            else:
+                value = self._solve_return_rate(x, multiplier, t, p) * 100
+
+        feasible = np.isfinite(value)
+        return FormulaSolverResult(
+            solve_for=params.solve_for,
+            value=np.where(feasible, value, np.nan),
+            feasible=feasible,
+        )
+
+    @staticmethod
+    def _solve_years(x, r, multiplier, p) -> np.ndarray:
+        """t = ln[(N(1 - x)r + x) / (pr + x)] / ln(1 + r), or (N(1 - x) - p) / x at r = 0."""
+        target = multiplier * (1 - x)
+        ratio = (target * r + x) / (p * r + x)
+        years = np.where(r == 0, (target - p) / x, np.log(ratio) / np.log1p(r))
+        years = np.where(p >= target, 0.0, years)
+        return np.where(years >= 0, years, np.inf)
+
+    @staticmethod
+    def _solve_savings_rate(r, multiplier, t, p) -> np.ndarray:
+        """x = (N - p(1 + r)^t) / (annuity + N), floored at zero when already FI."""
+        growth, annuity = growth_factors_array(r, t)
+        x = (multiplier - p * growth) / (annuity + multiplier)
+        return np.where((x >= 0) & (x < 1), x, np.where(x < 0, 0.0, np.inf))
+
+    @staticmethod
+    def _solve_fi_multiplier(x, r, t, p) -> np.ndarray:
+        """N = (p(1 + r)^t + x × annuity) / (1 - x)."""
+        growth, annuity = growth_factors_array(r, t)
+        return np.where(x < 1, (p * growth + x * annuity) / (1 - x), np.inf)
+
+    @staticmethod
+    def _solve_return_rate(x, multiplier, t, p) -> np.ndarray:
+        """Newton iteration on the log balance equation, falling back to bisection."""
+        target = multiplier * (1 - x)
+
+        # Work on log(balance / target): far better conditioned than the raw
+        # difference when (1 + r)^t is large, so Newton converges in a few steps
+        def excess(rate):
+            growth, annuity = growth_factors_array(rate, t)
+            slope_growth = t * growth / (1 + rate)
+            slope_annuity = np.where(
+                np.abs(rate) < 1e-6,
+                t * (t - 1) / 2,
+                (slope_growth * rate - (growth - 1)) / rate**2,
+            )
+            balance = p * growth + x * annuity
+            slope = p * slope_growth + x * slope_annuity
+            return np.log(balance / target), slope / balance
+
+        lo = np.full(target.shape, RETURN_RATE_BRACKET[0])
+        hi = np.full(target.shape, RETURN_RATE_BRACKET[1])
+        # Balance grows with r, so a root exists only if the bracket straddles it
+        bracketed = (excess(lo)[0] <= 0) & (excess(hi)[0] >= 0) & (t > 0)
+
+        rate = np.full(target.shape, 0.05)
+        done = ~bracketed
+        for _ in range(MAX_ITERATIONS):
+            f, slope = excess(rate)
+            lo = np.where(f < 0, rate, lo)
+            hi = np.where(f > 0, rate, hi)
+
+            step = rate - f / slope
+            outside = ~np.isfinite(step) | (step < lo) | (step > hi)
+            new_rate = np.where(outside, (lo + hi) / 2, step)
+
+            done |= (np.abs(new_rate - rate) <= TOLERANCE) | (f == 0)
+            rate = np.where(done, rate, new_rate)
+            if np.all(done):
+                break
+
+        return np.where(bracketed, rate, np.inf)
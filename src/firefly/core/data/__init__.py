@@ -0,0 +1 @@
+"""Bundled datasets for Firefly."""
@@ -0,0 +1,50 @@
+"""Cost-of-living levels by location."""
+
+import csv
+from functools import cache
+from pathlib import Path
+
+import numpy as np
+
+DATA_DIR = Path(__file__).parent
+
+# Columns of a location table: name, ISO 3166 country code, region, cost index. Text
+# is stored as UTF-8 bytes, each column as wide as its longest value
+LOCATION_COLUMNS = ("name", "country", "region", "cost_index")
+
+# Approximate relative cost of everyday living, rent included, for major cities
+# (US average = 100), rounded to the nearest point. Indicative only: for planning
+# comparisons, not a survey. Build a table from your own data with build_locations_file.
+COST_OF_LIVING = "cost_of_living"
+
+
+def build_locations_file(csv_path: Path, npy_path: Path) -> None:
+    """
+    Convert a `name,country,region,cost_index` CSV into the binary .npy format.
+
+    Records are stored cheapest first: the order is the table's index, so
+    questions about cost thresholds become binary searches.
+    """
+    with open(csv_path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    columns = [np.array([row[name].encode() for row in rows]) for name in LOCATION_COLUMNS[:3]]
+    columns.append(np.array([float(row["cost_index"]) for row in rows]))
+    table = np.empty(
+        len(rows),
+        dtype=[
+            (name, column.dtype) for name, column in zip(LOCATION_COLUMNS, columns, strict=True)
+        ],
+    )
+    for name, column in zip(LOCATION_COLUMNS, columns, strict=True):
+        table[name] = column
+    table = table[np.argsort(table["cost_index"], kind="stable")]
+    np.save(npy_path, table, allow_pickle=False)
+
+
+@cache
+def load_locations(name: str = COST_OF_LIVING) -> np.ndarray:
+    """
+    Load a bundled location table as a read-only memory-mapped structured array,
+    sorted by cost index. Cached per process after first use.
+    """
+    return np.load(DATA_DIR / f"{name}.npy", mmap_mode="r", allow_pickle=False)
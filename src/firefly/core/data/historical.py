@@ -0,0 +1,37 @@
+"""Historical market return and inflation series."""
+
+import csv
+from functools import cache
+from pathlib import Path
+
+import numpy as np
+
+DATA_DIR = Path(__file__).parent
+
+# year, total stock return (%), inflation (%) — one record per period
+SERIES_DTYPE = np.dtype([("year", "<i2"), ("stock_return", "<f8"), ("inflation", "<f8")])
+
+# S&P 500 total returns (Damodaran, NYU Stern) and US CPI-U December-over-December
+# inflation (BLS), 1928 onwards, in percent
+US_ANNUAL_RETURNS = "us_annual_returns"
+
+
+def build_series_file(csv_path: Path, npy_path: Path) -> None:
+    """Convert a `year,stock_return,inflation` CSV into the binary .npy format."""
+    with open(csv_path, newline="") as f:
+        rows = [
+            (int(row["year"]), float(row["stock_return"]), float(row["inflation"]))
+            for row in csv.DictReader(f)
+        ]
+    np.save(npy_path, np.array(rows, dtype=SERIES_DTYPE), allow_pickle=False)
+
+
+@cache
+def load_series(name: str = US_ANNUAL_RETURNS) -> np.ndarray:
+    """
+    Load a bundled series as a read-only memory-mapped structured array.
+
+    The file is mapped, not read, so every worker process on a host shares
+    the same pages from the OS cache. Cached per process after first use.
+    """
+    return np.load(DATA_DIR / f"{name}.npy", mmap_mode="r", allow_pickle=False)
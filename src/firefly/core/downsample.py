@@ -0,0 +1,95 @@
+"""Downsampling of dense series for display."""
+
+import numpy as np
+
+# Buckets at most this wide are resolved all at once; wider ones one at a time,
+# where each bucket's work already outweighs the cost of a Python loop
+MAX_VECTORIZED_BUCKET = 16
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points and, from each of `threshold - 2` equal
+    buckets in between, the point forming the largest triangle with the
+    previously kept point and the next bucket's average. Peaks and turns
+    survive, so the shape of the line is preserved at a fraction of the points.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # threshold < n keeps the bucket edges strictly increasing
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+    sizes = ends - starts
+
+    # Each bucket's triangles close at the next bucket's average; the last one's at the last point
+    avg_x = np.append(np.add.reduceat(x[: n - 1], starts)[1:] / sizes[1:], x[-1])
+    avg_y = np.append(np.add.reduceat(y[: n - 1], starts)[1:] / sizes[1:], y[-1])
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    if sizes.max() <= MAX_VECTORIZED_BUCKET:
+        selected[1:-1] = _select_narrow(x, y, starts, sizes, avg_x, avg_y)
+    else:
+        selected[1:-1] = _select_wide(x, y, starts, ends, avg_x, avg_y)
+    return selected
+
+
+def _select_narrow(
+    x: np.ndarray,
+    y: np.ndarray,
+    starts: np.ndarray,
+    sizes: np.ndarray,
+    avg_x: np.ndarray,
+    avg_y: np.ndarray,
+) -> np.ndarray:
+    """
+    Pick every bucket's point from a table of its best point for each point
+    the previous bucket may have kept, computed for all buckets at once.
+    Following the table from the first point is then a walk over integers.
+    """
+    # Buckets padded to one width by repeating their last point, which argmax never prefers
+    columns = np.arange(sizes.max())
+    candidates = starts[:, None] + np.minimum(columns, sizes[:, None] - 1)
+    anchors = np.vstack([np.zeros_like(columns), candidates[:-1]])
+
+    # Areas (doubled) of every anchor x candidate pair, bucket by bucket
+    ax, ay = x[anchors][:, :, None], y[anchors][:, :, None]
+    cx, cy = x[candidates][:, None, :], y[candidates][:, None, :]
+    vx, vy = avg_x[:, None, None], avg_y[:, None, None]
+    area = np.abs((ax - vx) * (cy - ay) - (ax - cx) * (vy - ay))
+    best = np.argmax(area, axis=2).tolist()
+
+    picks = []
+    column = 0
+    for bucket_best in best:
+        column = bucket_best[column]
+        picks.append(column)
+    return candidates[np.arange(len(candidates)), picks]
+
+
+def _select_wide(
+    x: np.ndarray,
+    y: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    avg_x: np.ndarray,
+    avg_y: np.ndarray,
+) -> np.ndarray:
+    """Pick every bucket's point in turn, anchored on the point kept before it."""
+    picks = np.empty(len(starts), dtype=np.int64)
+    anchor = 0
+    for bucket, (start, end) in enumerate(zip(starts.tolist(), ends.tolist(), strict=True)):
+        area = np.abs(
+            (x[anchor] - avg_x[bucket]) * (y[start:end] - y[anchor])
+            - (x[anchor] - x[start:end]) * (avg_y[bucket] - y[anchor])
+        )
+        anchor = start + int(np.argmax(area))
+        picks[bucket] = anchor
+    return picks
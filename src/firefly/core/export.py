@@ -0,0 +1,263 @@
+"""Streaming export of yearly breakdowns to CSV, JSON Lines, Arrow and Parquet."""
+
+import csv
+import importlib.util
+import io
+from collections.abc import Iterable, Iterator
+from enum import Enum
+
+import numpy as np
+
+from firefly.core.models.batch import BatchCompoundInterestResult
+from firefly.core.models.compound_interest import CompoundInterestResult, YearlyBreakdownTable
+
+# One record per scenario and breakdown year
+RECORD_COLUMNS = ("scenario", *YearlyBreakdownTable.columns())
+
+# Scenarios gathered into each chunk of records
+DEFAULT_CHUNK_SIZE = 1024
+
+# A chunk of records, stored column-wise
+Records = dict[str, np.ndarray]
+
+
+class ExportFormat(Enum):
+    """Output file format."""
+
+    CSV = "csv"
+    JSONL = "jsonl"
+    ARROW = "arrow"  # Arrow IPC stream
+    PARQUET = "parquet"
+
+    @property
+    def media_type(self) -> str:
+        return {
+            ExportFormat.CSV: "text/csv",
+            ExportFormat.JSONL: "application/x-ndjson",
+            ExportFormat.ARROW: "application/vnd.apache.arrow.stream",
+            ExportFormat.PARQUET: "application/vnd.apache.parquet",
+        }[self]
+
+    @property
+    def requires_pyarrow(self) -> bool:
+        return self in (ExportFormat.ARROW, ExportFormat.PARQUET)
+
+
+def result_records(
+    results: Iterable[CompoundInterestResult],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    first_scenario: int = 0,
+) -> Iterator[Records]:
+    """
+    Records for `results`, `chunk_size` scenarios at a time.
+
+    `results` is consumed lazily, so a generator of results is exported
+    without ever holding more than one chunk.
+    """
+    tables, scenarios = [], []
+    for scenario, result in enumerate(results, start=first_scenario):
+        tables.append(result.yearly_breakdown)
+        scenarios.append(np.full(len(result.yearly_breakdown), scenario))
+        if len(tables) == chunk_size:
+            yield _table_records(tables, scenarios)
+            tables, scenarios = [], []
+    if tables:
+        yield _table_records(tables, scenarios)
+
+
+def _table_records(tables: list[YearlyBreakdownTable], scenarios: list[np.ndarray]) -> Records:
+    table = YearlyBreakdownTable.concatenate(tables)
+    return {
+        "scenario": np.concatenate(scenarios),
+        **{name: getattr(table, name) for name in table.columns()},
+    }
+
+
+def batch_records(result: BatchCompoundInterestResult, first_scenario: int = 0) -> Records:
+    """Records for every scenario of a batch result, dropping the padding past its last year."""
+    balances = result.yearly_balances
+    starting = np.concatenate((result.input_params.principal[:, None], balances[:, :-1]), axis=1)
+    contributions = result.yearly_contributions
+    # Balances that overflowed are NaN too, so padding is told apart by year count
+    valid = np.arange(balances.shape[1])[None, :] < result.num_years[:, None]
+    scenario, year_index = np.nonzero(valid)
+
+    return {
+        "scenario": scenario + first_scenario,
+        "year": year_index + 1,
+        "starting_balance": starting[valid],
+        "contributions": contributions[valid],
+        "interest_earned": (balances - starting - contributions)[valid],
+        "ending_balance": balances[valid],
+        "real_ending_balance": result.real_yearly_balances[valid],
+        "after_tax_ending_balance": result.after_tax_yearly_balances[valid],
+    }
+
+
+def write_stream(chunks: Iterable[Records], format: ExportFormat) -> Iterator[bytes]:
+    """
+    Encode chunks of records as `format`, yielding the bytes of each chunk
+    as soon as it is written. Memory use is bounded by the chunk size.
+
+    Arrow and Parquet need pyarrow (the `export` extra); without it an
+    ImportError is raised before anything is yielded. CSV and JSON Lines
+    work without it, but format numbers several times faster with it.
+    """
+    if format.requires_pyarrow:
+        _require_pyarrow()
+    fast = _pyarrow_available()
+    writer = {
+        ExportFormat.CSV: _write_csv_arrow if fast else _write_csv,
+        ExportFormat.JSONL: _write_jsonl_arrow if fast else _write_jsonl,
+        ExportFormat.ARROW: _write_arrow,
+        ExportFormat.PARQUET: _write_parquet,
+    }[format]
+    return writer(chunks)
+
+
+def _pyarrow_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _require_pyarrow() -> None:
+    if not _pyarrow_available():
+        raise ImportError("Arrow and Parquet export require pyarrow; install firefly[export]")
+
+
+def _rows(records: Records) -> Iterator[tuple]:
+    return zip(*(records[name].tolist() for name in RECORD_COLUMNS), strict=True)
+
+
+def _write_csv(chunks: Iterable[Records]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(RECORD_COLUMNS)
+    for records in chunks:
+        writer.writerows(_rows(records))
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():  # header only: nothing was exported
+        yield buffer.getvalue().encode()
+
+
+def _write_jsonl(chunks: Iterable[Records]) -> Iterator[bytes]:
+    template = "{" + ",".join(f'"{name}":%s' for name in RECORD_COLUMNS) + "}\n"
+    for records in chunks:
+        columns = [_json_values(records[name]) for name in RECORD_COLUMNS]
+        yield "".join([template % row for row in zip(*columns, strict=True)]).encode()
+
+
+def _json_values(column: np.ndarray) -> list:
+    """
+    Values whose str() is valid JSON: ints and finite floats as they are,
+    and the inf or NaN of balances that overflowed as null, as orjson does.
+    """
+    finite = np.isfinite(column)
+    if finite.all():
+        return column.tolist()
+    values = column.astype(object)
+    values[~finite] = "null"
+    return values.tolist()
+
+
+class _Drain(io.RawIOBase):
+    """Write-only sink whose contents are handed out and dropped on each drain()."""
+
+    def __init__(self):
+        self._parts: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def _arrow_schema():
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("scenario", pa.int64()),
+            ("year", pa.int64()),
+            *((name, pa.float64()) for name in RECORD_COLUMNS[2:]),
+        ]
+    )
+
+
+def _write_csv_arrow(chunks: Iterable[Records]) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.csv
+
+    schema = _arrow_schema()
+    sink = _Drain()
+    # Same unquoted header as the csv module writes
+    sink.write((",".join(RECORD_COLUMNS) + "\n").encode())
+    options = pyarrow.csv.WriteOptions(include_header=False, quoting_style="none")
+    with pyarrow.csv.CSVWriter(sink, schema, write_options=options) as writer:
+        for records in chunks:
+            writer.write_table(pa.table(records, schema=schema))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def _write_jsonl_arrow(chunks: Iterable[Records]) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    # Each line is built column-wise: key literals joined with values cast to strings
+    keys = [("{" if i == 0 else ",") + f'"{name}":' for i, name in enumerate(RECORD_COLUMNS)]
+    for records in chunks:
+        parts = []
+        for key, name in zip(keys, RECORD_COLUMNS, strict=True):
+            values = pa.array(records[name])
+            text = pc.cast(values, pa.string())
+            if pa.types.is_floating(values.type):
+                # inf and NaN aren't JSON; overflowed balances are written as null
+                text = pc.if_else(pc.is_finite(values), text, "null")
+            parts += [key, text]
+        lines = pc.binary_join_element_wise(*parts, "}\n", "")
+        if len(lines):
+            # The lines are contiguous in the data buffer; the last offset is where they end
+            _, offsets, data = lines.buffers()
+            end = int(np.frombuffer(offsets, dtype=np.int32)[lines.offset + len(lines)])
+            yield data[:end].to_pybytes()
+
+
+def _write_arrow(chunks: Iterable[Records]) -> Iterator[bytes]:
+    import pyarrow as pa
+
+    schema = _arrow_schema()
+    sink = _Drain()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for records in chunks:
+            writer.write_batch(pa.record_batch(records, schema=schema))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def _write_parquet(chunks: Iterable[Records]) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _arrow_schema()
+    sink = _Drain()
+    # One row group per chunk; the footer indexing them is written on close
+    with pq.ParquetWriter(sink, schema) as writer:
+        for records in chunks:
+            writer.write_table(pa.table(records, schema=schema))
+            yield sink.drain()
+    yield sink.drain()
@@ -0,0 +1,56 @@
+"""Data models for historical backtests."""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from firefly.core.models.compound_interest import CompoundInterestInput
+
+
+@dataclass
+class BacktestInput:
+    """
+    Input parameters for a historical backtest.
+
+    The plan supplies principal, whole years and contributions; its
+    `annual_rate` is replaced by the historical returns of each window.
+    """
+
+    plan: CompoundInterestInput
+    target: float | None = None  # real (start-year dollars) balance to reach
+
+    def __post_init__(self):
+        if self.plan.schedule:
+            raise ValueError("Backtests do not support plans with a schedule")
+        # Historical returns are annual, so a partial year has none to replay
+        if self.plan.months:
+            raise ValueError("Backtests need a plan of whole years; months must be 0")
+
+
+@dataclass
+class BacktestResult:
+    """
+    Outcome of a plan for every historical start year.
+
+    Row `s` of the matrices is the window starting in `start_years[s]`;
+    column `y` is the balance at the end of year `y + 1` of that window.
+    Real values are in dollars of the window's start year.
+    """
+
+    start_years: np.ndarray
+    yearly_balances: np.ndarray
+    real_yearly_balances: np.ndarray
+    final_amounts: np.ndarray
+    real_final_amounts: np.ndarray
+    success_rate: float | None  # share of start years whose real final amount meets target
+    input_params: BacktestInput = field(repr=False)
+
+    @property
+    def worst_start_year(self) -> int:
+        """Start year with the lowest real final amount."""
+        return int(self.start_years[np.argmin(self.real_final_amounts)])
+
+    @property
+    def best_start_year(self) -> int:
+        """Start year with the highest real final amount."""
+        return int(self.start_years[np.argmax(self.real_final_amounts)])
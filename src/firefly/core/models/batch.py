@@ -0,0 +1,123 @@
+"""Columnar data models for batch compound interest calculations."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from firefly.core.models.compound_interest import (
+    CentsBreakdown,
+    CompoundingFrequency,
+    CompoundInterestInput,
+)
+
+
+@dataclass
+class BatchCompoundInterestInput:
+    """
+    Many compound interest scenarios stored column-wise.
+
+    Every field is a 1-D array with one entry per scenario. Rates are
+    percentages (7 for 7%), matching CompoundInterestInput.
+    """
+
+    principal: np.ndarray
+    annual_rate: np.ndarray
+    years: np.ndarray
+    months: np.ndarray
+    monthly_contribution: np.ndarray
+    annual_contribution: np.ndarray
+    compounding_frequency: np.ndarray  # periods per year (CompoundingFrequency values)
+    inflation_rate: np.ndarray | None = None  # zero for every scenario when omitted
+    tax_drag: np.ndarray | None = None
+
+    def __post_init__(self):
+        self.principal = np.asarray(self.principal, dtype=np.float64)
+        self.annual_rate = np.asarray(self.annual_rate, dtype=np.float64)
+        self.years = np.asarray(self.years, dtype=np.int64)
+        self.months = np.asarray(self.months, dtype=np.int64)
+        self.monthly_contribution = np.asarray(self.monthly_contribution, dtype=np.float64)
+        self.annual_contribution = np.asarray(self.annual_contribution, dtype=np.float64)
+        frequency = self.compounding_frequency
+        if not isinstance(frequency, np.ndarray):
+            frequency = [f.value if isinstance(f, CompoundingFrequency) else f for f in frequency]
+        self.compounding_frequency = np.asarray(frequency, dtype=np.int64)
+
+        size = len(self.principal)
+        for name in ("inflation_rate", "tax_drag"):
+            value = getattr(self, name)
+            value = np.zeros(size) if value is None else np.asarray(value, dtype=np.float64)
+            setattr(self, name, value)
+        for name in (
+            "annual_rate",
+            "years",
+            "months",
+            "monthly_contribution",
+            "annual_contribution",
+            "compounding_frequency",
+            "inflation_rate",
+            "tax_drag",
+        ):
+            if getattr(self, name).shape != (size,):
+                raise ValueError(f"{name} must be a 1-D array of length {size}")
+
+    def __len__(self) -> int:
+        return len(self.principal)
+
+    @property
+    def rate_decimal(self) -> np.ndarray:
+        """Annual rates as decimals."""
+        return self.annual_rate / 100
+
+    @classmethod
+    def from_inputs(cls, inputs: Sequence[CompoundInterestInput]) -> "BatchCompoundInterestInput":
+        """
+        Build a batch from individual CompoundInterestInput objects.
+
+        Batches have no schedules, so inputs with one are rejected rather than
+        calculated as if their schedule were absent.
+        """
+        for index, params in enumerate(inputs):
+            if params.schedule:
+                raise ValueError(f"input {index} has a schedule, which batches don't support")
+        return cls(
+            principal=[p.principal for p in inputs],
+            annual_rate=[p.annual_rate for p in inputs],
+            years=[p.years for p in inputs],
+            months=[p.months for p in inputs],
+            monthly_contribution=[p.monthly_contribution for p in inputs],
+            annual_contribution=[p.annual_contribution for p in inputs],
+            compounding_frequency=[p.compounding_frequency for p in inputs],
+            inflation_rate=[p.inflation_rate for p in inputs],
+            tax_drag=[p.tax_drag for p in inputs],
+        )
+
+
+@dataclass
+class BatchCompoundInterestResult:
+    """
+    Columnar results of a batch calculation.
+
+    `yearly_balances[s, y]` is the ending balance of scenario `s` after
+    breakdown year `y + 1` (a trailing partial year counts as a year), and
+    `yearly_contributions[s, y]` the amount contributed during that year.
+    The `real_` and `after_tax_` arrays hold the same balances in today's
+    dollars and net of tax drag. Scenarios shorter than the longest one are
+    padded with NaN. `cents` is set by the exact-cents engine.
+    """
+
+    final_amount: np.ndarray
+    total_contributions: np.ndarray
+    total_interest: np.ndarray
+    real_final_amount: np.ndarray
+    after_tax_final_amount: np.ndarray
+    yearly_balances: np.ndarray
+    real_yearly_balances: np.ndarray
+    after_tax_yearly_balances: np.ndarray
+    yearly_contributions: np.ndarray
+    num_years: np.ndarray
+    input_params: BatchCompoundInterestInput
+    cents: CentsBreakdown | None = None
+
+    def __len__(self) -> int:
+        return len(self.final_amount)
@@ -0,0 +1,56 @@
+"""Data models for Coast FIRE calculations."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from firefly.core.models.compound_interest import CompoundingFrequency
+
+
+@dataclass
+class CoastFireInput:
+    """
+    Input parameters for a Coast FIRE calculation.
+
+    The portfolio grows at `annual_rate` with no further contributions.
+    Ages may be fractional (e.g. 45.5); growth is counted in whole
+    compounding periods, as CompoundInterestCalculator does.
+    """
+
+    current_age: float
+    current_portfolio: float
+    fi_target: float  # portfolio needed to be financially independent
+    annual_rate: float  # as percentage, e.g., 7 for 7%
+    target_ages: Sequence[float] | np.ndarray | None = None  # default: every age up to max_age
+    max_age: int = 100
+    compounding_frequency: CompoundingFrequency = CompoundingFrequency.ANNUALLY
+
+    @property
+    def rate_decimal(self) -> float:
+        """Annual rate as decimal."""
+        return self.annual_rate / 100
+
+
+@dataclass
+class CoastFireResult:
+    """
+    Coast FIRE curve over target ages.
+
+    For each age in `ages`: the portfolio needed today to reach the FI
+    target by then without contributing, the current portfolio's projected
+    value at that age, and the shortfall between today's portfolio and the
+    amount needed.
+    """
+
+    ages: np.ndarray
+    required_now: np.ndarray
+    projected_balance: np.ndarray
+    coast_gap: np.ndarray  # required_now - current_portfolio, floored at zero
+    fi_age: float | None  # end of the period the portfolio alone reaches fi_target; None if never
+    input_params: CoastFireInput = field(repr=False)
+
+    @property
+    def on_track(self) -> np.ndarray:
+        """Whether the current portfolio coasts to the FI target by each age."""
+        return self.coast_gap == 0
@@ -1,7 +1,11 @@
 """Data models for compound interest calculations."""
 
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, fields
 from enum import Enum
+from functools import cache
+
+import numpy as np
 
 
 class CompoundingFrequency(Enum):
@@ -19,9 +23,115 @@ class ContributionFrequency(Enum):
     ANNUALLY = 1
 
 
+class CalculationEngine(Enum):
+    """Strategy used to evaluate the compounding timeline."""
+
+    ANALYTIC = "analytic"  # closed-form per year, cost independent of frequency
+    ITERATIVE = "iterative"  # period-by-period reference loop
+
+
+class RoundingPolicy(Enum):
+    """When the exact-cents engine rounds money to whole cents (half to even)."""
+
+    PER_PERIOD = "per_period"  # interest and contributions credited in cents every period
+    PER_YEAR = "per_year"  # compounds unrounded within a year, rounded at each year end
+
+
+@dataclass
+class ScheduleSegment:
+    """
+    A change to a plan's rate, contributions or compounding from `start_month` on.
+
+    Fields left as None keep the value in force before the segment (the
+    plan's own value for the first segment). A segment lasts until the next
+    one starts; a contribution pause sets both contributions to 0.
+    """
+
+    start_month: int  # months since the start of the plan
+    annual_rate: float | None = None  # as percentage
+    monthly_contribution: float | None = None
+    annual_contribution: float | None = None
+    compounding_frequency: CompoundingFrequency | None = None
+
+
+@dataclass(eq=False)
+class Schedule:
+    """
+    ScheduleSegments stored column-wise, one entry per segment.
+
+    Unchanged fields are NaN (frequency: 0). Segments starting in the same
+    month apply in the order given.
+    """
+
+    start_month: np.ndarray
+    annual_rate: np.ndarray
+    monthly_contribution: np.ndarray
+    annual_contribution: np.ndarray
+    compounding_frequency: np.ndarray  # periods per year (CompoundingFrequency values)
+
+    def __post_init__(self):
+        self.start_month = np.asarray(self.start_month, dtype=np.int64)
+        for name in ("annual_rate", "monthly_contribution", "annual_contribution"):
+            setattr(self, name, np.asarray(getattr(self, name), dtype=np.float64))
+        self.compounding_frequency = np.asarray(self.compounding_frequency, dtype=np.int64)
+
+        size = len(self.start_month)
+        for name in SCHEDULE_COLUMNS[1:]:
+            if getattr(self, name).shape != (size,):
+                raise ValueError(f"{name} must be a 1-D array of length {size}")
+        if (self.start_month < 0).any():
+            raise ValueError("start_month must not be negative")
+
+    def __len__(self) -> int:
+        return len(self.start_month)
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[ScheduleSegment]) -> "Schedule":
+        """Build a schedule from ScheduleSegment objects."""
+        segments = list(segments)
+        return cls(
+            start_month=[s.start_month for s in segments],
+            annual_rate=[s.annual_rate for s in segments],
+            monthly_contribution=[s.monthly_contribution for s in segments],
+            annual_contribution=[s.annual_contribution for s in segments],
+            compounding_frequency=[
+                s.compounding_frequency.value if s.compounding_frequency else 0 for s in segments
+            ],
+        )
+
+    def ordered(self) -> "Schedule":
+        """A copy ordered by start month, keeping the order of same-month segments."""
+        order = np.argsort(self.start_month, kind="stable")
+        return Schedule(*(getattr(self, name)[order] for name in SCHEDULE_COLUMNS))
+
+    def cache_key(self) -> tuple:
+        """Hashable form of the schedule, for CompoundInterestInput.cache_key()."""
+        ordered = self.ordered()
+        # + 0 folds -0.0 into 0.0
+        return tuple((getattr(ordered, name) + 0).tobytes() for name in SCHEDULE_COLUMNS)
+
+
+# Schedule fields, in the order of its constructor
+SCHEDULE_COLUMNS = (
+    "start_month",
+    "annual_rate",
+    "monthly_contribution",
+    "annual_contribution",
+    "compounding_frequency",
+)
+
+
 @dataclass
 class CompoundInterestInput:
-    """Input parameters for compound interest calculation."""
+    """
+    Input parameters for compound interest calculation.
+
+    `inflation_rate` deflates balances into today's dollars; `tax_drag` is
+    the share of the annual return lost to taxes, in percentage points, so
+    after-tax balances grow at `annual_rate - tax_drag`. An optional
+    `schedule` changes the rate, contributions or compounding part way
+    through the plan; the fields above apply until its first segment.
+    """
 
     principal: float
     annual_rate: float  # as percentage, e.g., 7 for 7%
@@ -30,6 +140,16 @@ class CompoundInterestInput:
     monthly_contribution: float = 0
     annual_contribution: float = 0
     compounding_frequency: CompoundingFrequency = CompoundingFrequency.ANNUALLY
+    inflation_rate: float = 0  # as percentage per year
+    tax_drag: float = 0  # percentage points of annual return lost to taxes
+    schedule: Schedule | None = None
+
+    def __post_init__(self):
+        # Beyond these, real or after-tax balances are infinite or undefined
+        if self.inflation_rate <= -100:
+            raise ValueError("inflation_rate must be above -100")
+        if self.tax_drag > 0 and self.annual_rate - self.tax_drag <= -100:
+            raise ValueError("tax_drag must leave the after-tax rate above -100%")
 
     @property
     def total_periods(self) -> float:
@@ -41,6 +161,40 @@ class CompoundInterestInput:
         """Annual rate as decimal."""
         return self.annual_rate / 100
 
+    def uses_annual_contribution(self) -> bool:
+        """
+        Whether `annual_contribution` can affect the result. Monthly
+        contributions win while positive, but a schedule segment that sets
+        them to 0 brings the plan's annual contribution back into force.
+        """
+        if not self.monthly_contribution > 0:
+            return True
+        return self.schedule is not None and bool((self.schedule.monthly_contribution <= 0).any())
+
+    def cache_key(self) -> tuple:
+        """
+        Hashable, normalized form of the inputs; equal keys give equal results.
+
+        Annual contributions are ignored when they never apply (see
+        uses_annual_contribution), and adding 0.0 folds -0.0 into 0.0.
+        Schedule segments are ordered by start; segments starting in the
+        same month keep their order, which decides the values in force.
+        """
+        monthly = float(self.monthly_contribution) + 0.0
+        annual = float(self.annual_contribution) + 0.0 if self.uses_annual_contribution() else 0.0
+        return (
+            float(self.principal) + 0.0,
+            float(self.annual_rate) + 0.0,
+            int(self.years),
+            int(self.months),
+            monthly,
+            annual,
+            self.compounding_frequency.value,
+            float(self.inflation_rate) + 0.0,
+            float(self.tax_drag) + 0.0,
+            self.schedule.cache_key() if self.schedule else None,
+        )
+
 
 @dataclass
 class YearlyBreakdown:
@@ -51,14 +205,199 @@ class YearlyBreakdown:
     contributions: float
     interest_earned: float
     ending_balance: float
+    real_ending_balance: float  # in today's dollars
+    after_tax_ending_balance: float
+
+
+@dataclass(eq=False)
+class YearlyBreakdownTable:
+    """
+    Year-by-year breakdown stored column-wise, one typed array per field.
+
+    Behaves like a read-only sequence of YearlyBreakdown rows (len, indexing,
+    iteration), but rows are only materialized on access; serialization
+    works on whole columns.
+    """
+
+    year: np.ndarray
+    starting_balance: np.ndarray
+    contributions: np.ndarray
+    interest_earned: np.ndarray
+    ending_balance: np.ndarray
+    real_ending_balance: np.ndarray
+    after_tax_ending_balance: np.ndarray
+
+    # Packed little-endian record layout used by to_bytes/from_bytes
+    RECORD_DTYPE = np.dtype(
+        [
+            ("year", "<i4"),
+            ("starting_balance", "<f8"),
+            ("contributions", "<f8"),
+            ("interest_earned", "<f8"),
+            ("ending_balance", "<f8"),
+            ("real_ending_balance", "<f8"),
+            ("after_tax_ending_balance", "<f8"),
+        ]
+    )
+
+    def __post_init__(self):
+        self.year = np.asarray(self.year, dtype=np.int64)
+        for name in self.columns()[1:]:
+            setattr(self, name, np.asarray(getattr(self, name), dtype=np.float64))
+
+    @classmethod
+    @cache
+    def columns(cls) -> tuple[str, ...]:
+        """Column names, in row order."""
+        return tuple(f.name for f in fields(cls))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[YearlyBreakdown]) -> "YearlyBreakdownTable":
+        """Build a table from YearlyBreakdown rows."""
+        rows = list(rows)
+        return cls(**{name: [getattr(row, name) for row in rows] for name in cls.columns()})
+
+    @classmethod
+    def concatenate(cls, tables: Iterable["YearlyBreakdownTable"]) -> "YearlyBreakdownTable":
+        """Join tables end to end, e.g. a reused prefix and a recomputed suffix."""
+        tables = list(tables)
+        return cls(
+            **{name: np.concatenate([getattr(t, name) for t in tables]) for name in cls.columns()}
+        )
+
+    def __len__(self) -> int:
+        return len(self.year)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return YearlyBreakdownTable(
+                **{name: getattr(self, name)[index] for name in self.columns()}
+            )
+        return YearlyBreakdown(
+            year=int(self.year[index]),
+            starting_balance=float(self.starting_balance[index]),
+            contributions=float(self.contributions[index]),
+            interest_earned=float(self.interest_earned[index]),
+            ending_balance=float(self.ending_balance[index]),
+            real_ending_balance=float(self.real_ending_balance[index]),
+            after_tax_ending_balance=float(self.after_tax_ending_balance[index]),
+        )
+
+    def __iter__(self) -> Iterator[YearlyBreakdown]:
+        for values in zip(*(getattr(self, name).tolist() for name in self.columns()), strict=True):
+            yield YearlyBreakdown(*values)
+
+    def to_columns(self) -> dict[str, list]:
+        """Columns as plain lists, ready for a JSON encoder."""
+        return {name: getattr(self, name).tolist() for name in self.columns()}
+
+    def to_rows(self) -> list[dict]:
+        """Rows as plain dicts, ready for a JSON encoder."""
+        names = self.columns()
+        columns = [getattr(self, name).tolist() for name in names]
+        return [dict(zip(names, values, strict=True)) for values in zip(*columns, strict=True)]
+
+    def to_bytes(self) -> bytes:
+        """Pack the table into RECORD_DTYPE records."""
+        records = np.empty(len(self), dtype=self.RECORD_DTYPE)
+        for name in self.columns():
+            records[name] = getattr(self, name)
+        return records.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "YearlyBreakdownTable":
+        """Inverse of to_bytes."""
+        records = np.frombuffer(data, dtype=cls.RECORD_DTYPE)
+        return cls(**{name: records[name] for name in cls.columns()})
+
+
+@dataclass(eq=False)
+class Timeline:
+    """
+    Balances sampled at evenly spaced points through a plan.
+
+    Point 0 is the start (the principal); the last point is the end of the
+    plan. Balances come from the same closed form as the yearly breakdown,
+    so points on year boundaries match it exactly.
+    """
+
+    time: np.ndarray  # years since start
+    balance: np.ndarray
+    invested: np.ndarray  # principal plus contributions made so far
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def interval_columns(self) -> dict[str, np.ndarray]:
+        """Per-interval starting balance, contributions, interest and ending balance."""
+        contributions = np.diff(self.invested)
+        starting_balance = self.balance[:-1]
+        ending_balance = self.balance[1:]
+        return {
+            "starting_balance": starting_balance,
+            "contributions": contributions,
+            "interest_earned": ending_balance - starting_balance - contributions,
+            "ending_balance": ending_balance,
+        }
+
+
+@dataclass(eq=False)
+class CentsBreakdown:
+    """
+    Yearly breakdown in whole cents, from the exact-cents engine.
+
+    Columns are int64 with years along the last axis (batch results add a
+    leading scenario axis; years past a scenario's end add nothing). Every
+    year satisfies starting_balance + contributions + interest_earned ==
+    ending_balance exactly, so the columns sum exactly to the totals.
+    """
+
+    principal: np.ndarray
+    starting_balance: np.ndarray
+    contributions: np.ndarray
+    interest_earned: np.ndarray
+    ending_balance: np.ndarray
+    after_tax_ending_balance: np.ndarray
+
+    @property
+    def final_amount(self) -> np.ndarray:
+        if self.ending_balance.shape[-1] == 0:
+            return self.principal
+        return self.ending_balance[..., -1]
+
+    @property
+    def after_tax_final_amount(self) -> np.ndarray:
+        if self.after_tax_ending_balance.shape[-1] == 0:
+            return self.principal
+        return self.after_tax_ending_balance[..., -1]
+
+    @property
+    def total_contributions(self) -> np.ndarray:
+        return self.contributions.sum(axis=-1)
+
+    @property
+    def total_interest(self) -> np.ndarray:
+        return self.interest_earned.sum(axis=-1)
+
+    def scenario(self, index: int) -> "CentsBreakdown":
+        """The breakdown of one scenario of a batch."""
+        return CentsBreakdown(*(getattr(self, f.name)[index] for f in fields(CentsBreakdown)))
 
 
 @dataclass
 class CompoundInterestResult:
-    """Result of compound interest calculation."""
+    """
+    Result of compound interest calculation.
+
+    With the exact-cents engine, `cents` holds the breakdown in whole cents
+    and every dollar amount is the corresponding cent count divided by 100.
+    """
 
     final_amount: float
     total_contributions: float
     total_interest: float
-    yearly_breakdown: list[YearlyBreakdown]
+    real_final_amount: float  # final amount in today's dollars
+    after_tax_final_amount: float
+    yearly_breakdown: YearlyBreakdownTable
     input_params: CompoundInterestInput
+    cents: CentsBreakdown | None = None
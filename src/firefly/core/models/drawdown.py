@@ -0,0 +1,115 @@
+"""Data models for retirement drawdown simulations."""
+
+from dataclasses import dataclass, field
+from enum import Enum
+
+import numpy as np
+
+from firefly.core.models.monte_carlo import ReturnDistribution
+
+
+class WithdrawalStrategyType(Enum):
+    """Rule that sets each year's withdrawal."""
+
+    CONSTANT_DOLLAR = "constant_dollar"
+    CONSTANT_PERCENTAGE = "constant_percentage"
+    GUARDRAILS = "guardrails"
+    FLOOR_CEILING = "floor_ceiling"
+
+
+@dataclass
+class WithdrawalStrategy:
+    """
+    A withdrawal rule, with rates as percentages like annual_rate.
+
+    Every strategy starts by withdrawing `rate`% of the starting portfolio.
+    After that:
+
+    - CONSTANT_DOLLAR keeps withdrawing that amount (the 4% rule).
+    - CONSTANT_PERCENTAGE withdraws `rate`% of the current portfolio.
+    - GUARDRAILS keeps the amount until it drifts more than `guardrail`%
+      away from the initial rate, relative to the current portfolio; it is
+      then cut (or raised) by `adjustment`%.
+    - FLOOR_CEILING withdraws `rate`% of the current portfolio, but no less
+      than `floor`% and no more than `ceiling`% of the initial amount.
+    """
+
+    kind: WithdrawalStrategyType
+    rate: float = 4.0
+    guardrail: float = 20.0
+    adjustment: float = 10.0
+    floor: float = 90.0
+    ceiling: float = 110.0
+
+    def __post_init__(self):
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")
+        if self.floor > self.ceiling:
+            raise ValueError("floor must not exceed ceiling")
+
+
+def default_strategies() -> tuple[WithdrawalStrategy, ...]:
+    """One strategy of each kind, with its default parameters."""
+    return tuple(WithdrawalStrategy(kind) for kind in WithdrawalStrategyType)
+
+
+@dataclass
+class DrawdownInput:
+    """
+    Input parameters for a retirement drawdown simulation.
+
+    Amounts are in today's dollars and `distribution` describes real
+    (after-inflation) annual returns, so a constant-dollar withdrawal keeps
+    its purchasing power. Each year's withdrawal is taken at the start of
+    the year; the rest then earns that year's return.
+    """
+
+    portfolio: float
+    years: int
+    distribution: ReturnDistribution
+    strategies: tuple[WithdrawalStrategy, ...] = field(default_factory=default_strategies)
+    num_paths: int = 10_000
+    seed: int | None = None
+    percentiles: tuple[float, ...] = (5, 25, 50, 75, 95)
+
+    def __post_init__(self):
+        if self.years < 0:
+            raise ValueError("years must not be negative")
+        if self.num_paths < 1:
+            raise ValueError("num_paths must be at least 1")
+        if not self.strategies:
+            raise ValueError("strategies must not be empty")
+
+
+@dataclass
+class StrategyOutcome:
+    """
+    How one strategy fared over every path.
+
+    A path succeeds if it funds every year's withdrawal in full; a depleted
+    path ends at zero and withdraws nothing afterwards.
+    `yearly_percentiles[p, y]` is the `percentiles[p]` percentile of the
+    balance at the end of year `y + 1`.
+    """
+
+    strategy: WithdrawalStrategy
+    success_rate: float
+    terminal_wealth_percentiles: np.ndarray
+    mean_terminal_wealth: float
+    yearly_percentiles: np.ndarray
+    withdrawal_percentiles: np.ndarray  # of each path's average yearly withdrawal
+    total_withdrawn_mean: float  # mean over paths of the sum of withdrawals
+
+
+@dataclass
+class DrawdownResult:
+    """Outcomes of every strategy, evaluated on the same return paths."""
+
+    percentiles: tuple[float, ...]
+    outcomes: list[StrategyOutcome]
+    num_paths: int
+    input_params: DrawdownInput = field(repr=False)
+
+    def outcome(self, kind: WithdrawalStrategyType) -> StrategyOutcome | None:
+        """The first outcome for a strategy of `kind`, if one was simulated."""
+        return next((outcome for outcome in self.outcomes if outcome.strategy.kind is kind), None)
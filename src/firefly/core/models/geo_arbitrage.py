@@ -0,0 +1,96 @@
+"""Data models for geographic arbitrage comparisons."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+
+import numpy as np
+
+from firefly.core.models.compound_interest import CompoundingFrequency
+
+
+class LocationOrder(Enum):
+    """Order in which matching locations are returned."""
+
+    CHEAPEST = "cheapest"
+    MOST_EXPENSIVE = "most_expensive"
+
+
+@dataclass
+class GeoArbitrageInput:
+    """
+    One plan evaluated against the cost of living in many locations.
+
+    `annual_expenses` is what the lifestyle costs at home, a location with
+    cost index `home_cost_index`; elsewhere the same lifestyle costs
+    annual_expenses × cost_index / home_cost_index. Amounts are in today's
+    dollars and `annual_rate` is a real return.
+    """
+
+    portfolio: float
+    annual_expenses: float
+    home_cost_index: float = 100.0
+    annual_savings: float = 0.0  # added each year while working toward FI
+    annual_rate: float = 5.0  # real return as percentage, e.g., 5 for 5%
+    withdrawal_rate: float = 4.0  # % of the portfolio withdrawn in the first year
+    compounding_frequency: CompoundingFrequency = CompoundingFrequency.MONTHLY
+
+    def __post_init__(self):
+        if self.annual_expenses <= 0:
+            raise ValueError("annual_expenses must be positive")
+        if self.home_cost_index <= 0:
+            raise ValueError("home_cost_index must be positive")
+        if self.withdrawal_rate <= 0:
+            raise ValueError("withdrawal_rate must be positive")
+
+    @property
+    def sustainable_withdrawal(self) -> float:
+        """Annual withdrawal the portfolio supports today."""
+        return self.portfolio * self.withdrawal_rate / 100
+
+
+@dataclass
+class LocationQuery:
+    """
+    Which locations to return: those passing every filter, in `order`, at
+    most `limit` of them. None leaves a filter off.
+    """
+
+    countries: Sequence[str] | None = None  # ISO 3166 codes, e.g. "PT"
+    regions: Sequence[str] | None = None  # e.g. "europe"
+    max_cost_index: float | None = None
+    fi_now: bool = False  # only where the portfolio already covers the lifestyle
+    max_years_to_fi: float | None = None
+    order: LocationOrder = LocationOrder.CHEAPEST
+    limit: int | None = None
+
+    def __post_init__(self):
+        if self.limit is not None and self.limit < 0:
+            raise ValueError("limit must not be negative")
+
+
+@dataclass(eq=False)
+class GeoArbitrageResult:
+    """
+    The selected locations, one entry per location in every column.
+
+    `percent_of_fi` is the sustainable lifestyle: the share of a location's
+    expenses the portfolio's withdrawal covers today. `home_spending` is
+    that withdrawal's purchasing power there, in home dollars.
+    """
+
+    name: np.ndarray
+    country: np.ndarray
+    region: np.ndarray
+    cost_index: np.ndarray
+    annual_expenses: np.ndarray
+    fi_number: np.ndarray
+    years_to_fi: np.ndarray  # inf where FI is never reached
+    percent_of_fi: np.ndarray
+    home_spending: np.ndarray
+    total_matches: int  # locations passing the filters, before the limit
+    input_params: GeoArbitrageInput = field(repr=False)
+    query: LocationQuery = field(repr=False)
+
+    def __len__(self) -> int:
+        return len(self.name)
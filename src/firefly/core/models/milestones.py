@@ -0,0 +1,90 @@
+"""Data models for milestone and crossover-point finding."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+
+import numpy as np
+
+from firefly.core.models.compound_interest import CompoundInterestInput
+
+
+class MilestoneKind(Enum):
+    """Condition a milestone waits for."""
+
+    BALANCE = "balance"  # nominal balance reaches `amount`
+    REAL_BALANCE = "real_balance"  # balance in today's dollars reaches `amount`
+    CROSSOVER = "crossover"  # a year's returns cover `amount` of annual expenses
+
+
+@dataclass
+class Milestone:
+    """
+    A condition on the balance to locate in time.
+
+    For a crossover, `amount` is annual expenses in today's dollars; they
+    grow with the plan's inflation rate, and the portfolio's returns are
+    its balance times the annual rate in force.
+    """
+
+    amount: float
+    kind: MilestoneKind = MilestoneKind.BALANCE
+
+
+@dataclass
+class MilestoneInput:
+    """A plan and the milestones to find on it."""
+
+    plan: CompoundInterestInput
+    milestones: Sequence[Milestone]
+
+
+@dataclass(eq=False)
+class MilestoneResult:
+    """
+    When each milestone is first reached, in input order.
+
+    `years` is the time at the end of the compounding period in which the
+    condition first holds (0 if it holds at the start), inf if it isn't
+    met within the plan; `balance` is the nominal balance then.
+    """
+
+    milestones: list[Milestone]
+    years: np.ndarray
+    balance: np.ndarray
+    input_params: MilestoneInput = field(repr=False)
+
+    @property
+    def reached(self) -> np.ndarray:
+        return np.isfinite(self.years)
+
+    @property
+    def month(self) -> np.ndarray:
+        """Month of the plan in which each milestone is reached (0 at the start, -1 if never)."""
+        return _month(self.years)
+
+
+@dataclass(eq=False)
+class BatchMilestoneResult:
+    """
+    MilestoneResult for many scenarios: `years[s, m]` and `balance[s, m]`
+    locate milestone `m` in scenario `s`.
+    """
+
+    milestones: list[Milestone]
+    years: np.ndarray
+    balance: np.ndarray
+
+    @property
+    def reached(self) -> np.ndarray:
+        return np.isfinite(self.years)
+
+    @property
+    def month(self) -> np.ndarray:
+        return _month(self.years)
+
+
+def _month(years: np.ndarray) -> np.ndarray:
+    # Period ends land on month ends up to rounding: don't let that push them a month later
+    months = np.ceil(np.where(np.isfinite(years), years, 0) * 12 - 1e-6)
+    return np.where(np.isfinite(years), months, -1).astype(np.int64)
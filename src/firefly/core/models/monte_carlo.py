@@ -0,0 +1,75 @@
+"""Data models for Monte Carlo simulations."""
+
+from dataclasses import dataclass, field
+from enum import Enum
+
+import numpy as np
+
+from firefly.core.models.compound_interest import CompoundInterestInput
+
+
+class DistributionType(Enum):
+    """Shape of the simulated return distribution."""
+
+    NORMAL = "normal"
+    LOGNORMAL = "lognormal"
+
+
+@dataclass
+class ReturnDistribution:
+    """
+    Annual return distribution, in percentages like CompoundInterestInput.annual_rate.
+
+    `mean` is a nominal annual rate, as `annual_rate` is: each simulated step
+    (at most monthly) has an expected return of mean / steps per year, so
+    with zero volatility either kind reproduces the plan calculated at
+    `mean`. `volatility` scales with the square root of time.
+    """
+
+    mean: float  # nominal annual return, e.g. 7 for 7%
+    volatility: float  # annual standard deviation, e.g. 15 for 15%
+    kind: DistributionType = DistributionType.LOGNORMAL
+
+
+@dataclass
+class MonteCarloInput:
+    """
+    Input parameters for a Monte Carlo simulation.
+
+    The plan supplies principal, horizon, contributions and compounding;
+    its `annual_rate` is replaced by draws from `distribution`.
+    """
+
+    plan: CompoundInterestInput
+    distribution: ReturnDistribution
+    num_paths: int = 100_000
+    seed: int | None = None
+    target: float | None = None  # balance to reach by the end of the plan
+    percentiles: tuple[float, ...] = (5, 25, 50, 75, 95)
+    chunk_size: int = 10_000  # paths simulated together; bounds peak memory
+
+    def __post_init__(self):
+        if self.plan.schedule:
+            raise ValueError("Monte Carlo simulations do not support plans with a schedule")
+        if self.num_paths <= 0:
+            raise ValueError("num_paths must be positive")
+        if self.chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+
+@dataclass
+class MonteCarloResult:
+    """
+    Result of a Monte Carlo simulation.
+
+    `yearly_percentiles[p, y]` is the `percentiles[p]` percentile of the
+    balance at the end of breakdown year `y + 1`.
+    """
+
+    percentiles: tuple[float, ...]
+    yearly_percentiles: np.ndarray
+    final_amount_percentiles: np.ndarray
+    mean_final_amount: float
+    success_probability: float | None  # share of paths ending at or above target
+    num_paths: int
+    input_params: MonteCarloInput = field(repr=False)
@@ -0,0 +1,78 @@
+"""Data models for the One More Year calculator."""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from firefly.core.models.compound_interest import CompoundingFrequency
+
+
+@dataclass
+class OneMoreYearInput:
+    """
+    Input parameters for the One More Year calculator.
+
+    Amounts are in today's dollars and `annual_rate` is a real return.
+    With expenses E and a savings rate x, income is E / (1 - x), so each
+    extra year of work adds E·x / (1 - x) of savings to the portfolio.
+    """
+
+    current_portfolio: float
+    monthly_expenses: float
+    savings_rate: float  # % of income saved, e.g. 50 for 50%
+    annual_rate: float  # real return as percentage, e.g., 5 for 5%
+    withdrawal_rate: float = 4.0  # % of the portfolio withdrawn in the first year
+    max_years: int = 10  # extra working years tabulated
+    compounding_frequency: CompoundingFrequency = CompoundingFrequency.MONTHLY
+
+    def __post_init__(self):
+        if not 0 <= self.savings_rate < 100:
+            raise ValueError("savings_rate must be at least 0 and below 100")
+        if self.withdrawal_rate <= 0:
+            raise ValueError("withdrawal_rate must be positive")
+        if self.max_years < 0:
+            raise ValueError("max_years must not be negative")
+
+    @property
+    def annual_expenses(self) -> float:
+        return self.monthly_expenses * 12
+
+    @property
+    def annual_savings(self) -> float:
+        return self.annual_expenses * self.savings_rate / (100 - self.savings_rate)
+
+    @property
+    def fi_number(self) -> float:
+        """Portfolio whose sustainable withdrawal covers annual expenses."""
+        return self.annual_expenses * 100 / self.withdrawal_rate
+
+
+@dataclass(eq=False)
+class OneMoreYearResult:
+    """
+    Marginal value of each additional working year, one row per year.
+
+    Row `y` describes retiring after `y` more years (row 0: retiring now).
+    The `_increase` columns compare each row with the one before it and
+    are NaN in row 0. `relative_increase` is the diminishing return: every
+    year of work raises the sustainable withdrawal by a smaller share,
+    while each costs the same 12 months of freedom.
+    """
+
+    years: np.ndarray
+    portfolio: np.ndarray
+    sustainable_withdrawal: np.ndarray  # per year
+    percent_of_fi: np.ndarray  # sustainable withdrawal as % of expenses
+    withdrawal_increase: np.ndarray
+    percent_of_fi_increase: np.ndarray  # percentage points
+    relative_increase: np.ndarray  # withdrawal_increase as % of the previous withdrawal
+    fi_years: float | None  # years of work until the portfolio reaches the FI number
+    input_params: OneMoreYearInput = field(repr=False)
+
+    @property
+    def months_worked(self) -> np.ndarray:
+        """Months of freedom given up for each row."""
+        return self.years * 12
+
+    def __len__(self) -> int:
+        return len(self.years)
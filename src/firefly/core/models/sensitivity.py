@@ -0,0 +1,87 @@
+"""Data models for sensitivity analysis."""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from firefly.core.models.compound_interest import CompoundInterestInput
+
+
+@dataclass
+class SensitivityInput:
+    """
+    Input parameters for a sensitivity analysis of one plan.
+
+    `annual_rate` is perturbed by `rate_steps` percentage points; the other
+    numeric fields by `relative_steps` fractions of their value. Compounding
+    frequency is evaluated at every alternative frequency.
+    """
+
+    plan: CompoundInterestInput
+    target: float | None = None  # balance whose time to reach is also analysed
+    relative_steps: tuple[float, ...] = (-0.10, -0.05, 0.05, 0.10)
+    rate_steps: tuple[float, ...] = (-2.0, -1.0, 1.0, 2.0)
+
+    def __post_init__(self):
+        if self.plan.schedule:
+            raise ValueError("Sensitivity analysis does not support plans with a schedule")
+
+
+@dataclass(eq=False)
+class PerturbationGrid:
+    """Outcomes with one input field varied and every other field held at the plan's value."""
+
+    field: str
+    values: np.ndarray  # perturbed values of the field
+    final_amount: np.ndarray
+    time_to_target: np.ndarray | None  # years; inf where the target is never reached
+
+
+@dataclass
+class TornadoBar:
+    """Range of final amounts over one field's perturbations, for a tornado chart."""
+
+    field: str
+    low_value: float
+    high_value: float
+    low_final_amount: float  # at low_value
+    high_final_amount: float  # at high_value
+
+    @property
+    def swing(self) -> float:
+        return abs(self.high_final_amount - self.low_final_amount)
+
+
+@dataclass
+class SensitivityResult:
+    """
+    Partial derivatives and perturbation grids for a plan.
+
+    Gradients map each CompoundInterestInput field to the derivative of the
+    outcome with respect to it (per dollar, per percentage point of rate,
+    per year, per month). Time fields are treated as continuous; a field
+    whose change switches contribution mode has a NaN derivative.
+    """
+
+    final_amount: float
+    time_to_target: float | None  # years
+    final_amount_gradient: dict[str, float]
+    time_to_target_gradient: dict[str, float] | None
+    grids: list[PerturbationGrid]
+    input_params: SensitivityInput = field(repr=False)
+
+    def tornado(self) -> list[TornadoBar]:
+        """One bar per perturbed field, widest swing first."""
+        bars = []
+        for grid in self.grids:
+            low, high = int(np.argmin(grid.values)), int(np.argmax(grid.values))
+            bars.append(
+                TornadoBar(
+                    field=grid.field,
+                    low_value=float(grid.values[low]),
+                    high_value=float(grid.values[high]),
+                    low_final_amount=float(grid.final_amount[low]),
+                    high_final_amount=float(grid.final_amount[high]),
+                )
+            )
+        return sorted(bars, key=lambda bar: bar.swing, reverse=True)
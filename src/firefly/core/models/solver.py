@@ -0,0 +1,42 @@
+"""Data models for the FIRE formula solver."""
+
+from dataclasses import dataclass
+from enum import Enum
+
+import numpy as np
+
+
+class SolveFor(Enum):
+    """Variable the formula solver computes from the other three."""
+
+    SAVINGS_RATE = "savings_rate"
+    RETURN_RATE = "return_rate"
+    FI_MULTIPLIER = "fi_multiplier"
+    YEARS = "years"
+
+
+@dataclass
+class FormulaSolverInput:
+    """
+    Inputs for the FIRE formula solver.
+
+    Each variable is a scalar or a 1-D array (one entry per scenario); the
+    one named by `solve_for` is ignored. Rates are percentages, e.g. 50 for
+    a 50% savings rate and 5 for a 5% real return.
+    """
+
+    solve_for: SolveFor
+    savings_rate: float | np.ndarray | None = None  # x: % of income saved
+    return_rate: float | np.ndarray | None = None  # r: real annual return %
+    fi_multiplier: float | np.ndarray | None = None  # N: FI number / annual expenses
+    years: float | np.ndarray | None = None  # t: years until FI
+    portfolio_multiple: float | np.ndarray = 0  # current portfolio / annual income
+
+
+@dataclass
+class FormulaSolverResult:
+    """Solved values; infeasible scenarios are NaN with `feasible` False."""
+
+    solve_for: SolveFor
+    value: np.ndarray
+    feasible: np.ndarray
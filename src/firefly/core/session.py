@@ -0,0 +1,133 @@
+"""Incremental recalculation of a scenario as it is edited."""
+
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from firefly.core.calculators.compound_interest import build_result, yearly_breakdown_from
+from firefly.core.models.compound_interest import (
+    SCHEDULE_COLUMNS,
+    CompoundInterestInput,
+    CompoundInterestResult,
+    Schedule,
+    YearlyBreakdownTable,
+)
+
+
+@dataclass
+class RecomputeCost:
+    """Work done by session updates, in breakdown years."""
+
+    years_computed: int = 0
+    years_reused: int = 0  # taken from the previous breakdown instead
+
+    @property
+    def saved(self) -> float:
+        """Share of the breakdown years that did not need computing."""
+        total = self.years_computed + self.years_reused
+        return self.years_reused / total if total else 0.0
+
+
+class CalculationSession:
+    """
+    Keeps the last computed breakdown of a scenario and recomputes only
+    what an edit invalidates.
+
+    Years before the first one affected by an edit are reused as they are;
+    the rest continue in closed form from the balances at the end of the
+    last reused year. Extending `years` therefore costs only the added
+    years, however long the horizon already is, and editing a schedule
+    segment only the years from the segment's start on. Editing any other
+    input changes every year and recomputes the whole breakdown.
+
+    Results match CompoundInterestCalculator with the analytic engine.
+    """
+
+    def __init__(self):
+        self._params: CompoundInterestInput | None = None
+        self._key: tuple | None = None  # cache key of `_params`
+        self._breakdown: YearlyBreakdownTable | None = None
+        self.last_cost = RecomputeCost()  # of the latest calculate() call
+        self.total_cost = RecomputeCost()  # over the session's lifetime
+
+    def calculate(self, params: CompoundInterestInput) -> CompoundInterestResult:
+        """Calculate `params`, reusing as much of the previous breakdown as possible."""
+        num_years = params.years + (params.months > 0)
+        reused = min(self._reusable_years(params), num_years)
+
+        if reused == 0:
+            breakdown = yearly_breakdown_from(params)
+        elif reused == num_years:
+            breakdown = self._breakdown[:reused]
+        else:
+            prefix = self._breakdown[:reused]
+            suffix = yearly_breakdown_from(
+                params,
+                first_year=reused + 1,
+                balance=float(prefix.ending_balance[-1]),
+                after_tax_balance=float(prefix.after_tax_ending_balance[-1]),
+            )
+            breakdown = YearlyBreakdownTable.concatenate([prefix, suffix])
+
+        # Keep a private copy of the inputs: callers may mutate theirs
+        self._params = replace(params, schedule=params.schedule and params.schedule.ordered())
+        self._key = params.cache_key()
+        self._breakdown = breakdown
+        self.last_cost = RecomputeCost(years_computed=num_years - reused, years_reused=reused)
+        self.total_cost.years_computed += self.last_cost.years_computed
+        self.total_cost.years_reused += self.last_cost.years_reused
+        return build_result(params, breakdown)
+
+    def reset(self) -> None:
+        """Forget the cached breakdown; cost counters are kept."""
+        self._params = None
+        self._key = None
+        self._breakdown = None
+
+    def _reusable_years(self, params: CompoundInterestInput) -> int:
+        """Number of leading breakdown years that `params` leaves unchanged."""
+        previous = self._params
+        if previous is None:
+            return 0
+        if self._key == params.cache_key():
+            return len(self._breakdown)
+        # Only the horizon or the schedule changed: the full years both plans
+        # share before the first changed segment are identical, but a trailing
+        # partial year is not, so it is never reused
+        unscheduled = {"years": 0, "months": 0, "schedule": None}
+        if (
+            replace(previous, **unscheduled).cache_key()
+            != replace(params, **unscheduled).cache_key()
+        ):
+            return 0
+        # Without their schedules the keys may drop an annual contribution
+        # that a schedule brings back into force
+        if (
+            previous.uses_annual_contribution() or params.uses_annual_contribution()
+        ) and previous.annual_contribution != params.annual_contribution:
+            return 0
+        reusable = min(previous.years, params.years)
+        changed_month = _first_change(previous.schedule, params.schedule)
+        if changed_month is not None:
+            reusable = min(reusable, changed_month // 12)
+        return reusable
+
+
+def _first_change(previous: Schedule | None, schedule: Schedule | None) -> int | None:
+    """Start month of the first segment that differs between two schedules, None if none does."""
+    previous = _columns(previous)
+    current = _columns(schedule)
+    shared = min(previous.shape[1], current.shape[1])
+    a, b = previous[:, :shared], current[:, :shared]
+    differs = ((a != b) & ~(np.isnan(a) & np.isnan(b))).any(axis=0)
+    first = int(np.argmax(differs)) if differs.any() else shared
+    starts = [columns[0, first] for columns in (previous, current) if first < columns.shape[1]]
+    return int(min(starts)) if starts else None
+
+
+def _columns(schedule: Schedule | None) -> np.ndarray:
+    """Schedule fields as the rows of one array, ordered by start month."""
+    if not schedule:
+        return np.empty((len(SCHEDULE_COLUMNS), 0))
+    ordered = schedule.ordered()
+    return np.array([getattr(ordered, name) for name in SCHEDULE_COLUMNS], dtype=np.float64)
@@ -0,0 +1,70 @@
+"""Cache keys must tell apart inputs that calculate differently."""
+
+import pytest
+
+from firefly.core.cache import ResultCache
+from firefly.core.calculators.compound_interest import CompoundInterestCalculator
+from firefly.core.models.compound_interest import (
+    CompoundingFrequency,
+    CompoundInterestInput,
+    Schedule,
+    ScheduleSegment,
+)
+from firefly.core.session import CalculationSession
+
+
+def plan(annual_contribution: float, paused: bool = True) -> CompoundInterestInput:
+    """Monthly contributions that stop after two years, leaving the annual ones in force."""
+    segments = [ScheduleSegment(24, monthly_contribution=0)] if paused else []
+    return CompoundInterestInput(
+        principal=1000,
+        annual_rate=5,
+        years=5,
+        monthly_contribution=100,
+        annual_contribution=annual_contribution,
+        compounding_frequency=CompoundingFrequency.MONTHLY,
+        schedule=Schedule.from_segments(segments) if paused else None,
+    )
+
+
+def test_key_keeps_annual_contribution_a_schedule_brings_back():
+    assert plan(1200).cache_key() != plan(0).cache_key()
+
+
+def test_key_drops_annual_contribution_that_never_applies():
+    assert plan(1200, paused=False).cache_key() == plan(0, paused=False).cache_key()
+
+
+def test_cached_calculator():
+    calculator = CompoundInterestCalculator(cache=ResultCache())
+    assert calculator.calculate(plan(0)).final_amount == pytest.approx(4208.63, abs=0.01)
+    assert calculator.calculate(plan(1200)).final_amount == pytest.approx(8083.97, abs=0.01)
+
+
+def test_calculate_route():
+    from fastapi.testclient import TestClient
+
+    from firefly.api.main import app
+
+    client = TestClient(app)
+    body = {
+        "principal": 1000,
+        "annual_rate": 5,
+        "years": 5,
+        "monthly_contribution": 100,
+        "compounding_frequency": "monthly",
+        "schedule": [{"start_month": 24, "monthly_contribution": 0}],
+    }
+    without = client.post("/api/calculate", json={**body, "annual_contribution": 0})
+    with_annual = client.post("/api/calculate", json={**body, "annual_contribution": 1200})
+    assert without.json()["final_amount"] == pytest.approx(4208.63, abs=0.01)
+    assert with_annual.json()["final_amount"] == pytest.approx(8083.97, abs=0.01)
+    assert without.headers["ETag"] != with_annual.headers["ETag"]
+
+
+def test_session_does_not_reuse_breakdown():
+    session = CalculationSession()
+    session.calculate(plan(0))
+    result = session.calculate(plan(1200))
+    assert result.final_amount == pytest.approx(8083.97, abs=0.01)
+    assert session.last_cost.years_reused == 0
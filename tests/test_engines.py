@@ -0,0 +1,211 @@
+"""The analytic, iterative, batch and exact-cents engines must agree."""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from firefly.core.calculators.batch import BatchCompoundInterestCalculator
+from firefly.core.calculators.compound_interest import (
+    CompoundInterestCalculator,
+    contribution_per_period,
+)
+from firefly.core.models.batch import BatchCompoundInterestInput
+from firefly.core.models.compound_interest import (
+    CalculationEngine,
+    CompoundingFrequency,
+    CompoundInterestInput,
+    RoundingPolicy,
+    Schedule,
+    ScheduleSegment,
+)
+
+PLANS = [
+    CompoundInterestInput(principal=10_000, annual_rate=7, years=30),
+    CompoundInterestInput(
+        principal=10_000,
+        annual_rate=7,
+        years=30,
+        monthly_contribution=500,
+        compounding_frequency=CompoundingFrequency.MONTHLY,
+        inflation_rate=3,
+        tax_drag=1.5,
+    ),
+    CompoundInterestInput(
+        principal=2_500,
+        annual_rate=4.5,
+        years=3,
+        months=7,
+        annual_contribution=1_200,
+        compounding_frequency=CompoundingFrequency.DAILY,
+    ),
+    CompoundInterestInput(
+        principal=1_000,
+        annual_rate=5,
+        years=2,
+        months=5,
+        monthly_contribution=50,
+        annual_contribution=600,
+        compounding_frequency=CompoundingFrequency.ANNUALLY,
+    ),
+    CompoundInterestInput(principal=1_000, annual_rate=0, years=5, monthly_contribution=100),
+    CompoundInterestInput(
+        principal=50_000,
+        annual_rate=-8,
+        years=10,
+        monthly_contribution=200,
+        compounding_frequency=CompoundingFrequency.MONTHLY,
+        inflation_rate=-1,
+    ),
+    # Rates of -100% or less per period: the balance is wiped out or flips sign
+    CompoundInterestInput(principal=1_000, annual_rate=-100, years=4, annual_contribution=100),
+    CompoundInterestInput(principal=1_000, annual_rate=-150, years=5, annual_contribution=100),
+    CompoundInterestInput(principal=1_000, annual_rate=6, years=0, months=0),
+]
+
+BREAKDOWN_COLUMNS = [
+    "starting_balance",
+    "contributions",
+    "interest_earned",
+    "ending_balance",
+    "real_ending_balance",
+    "after_tax_ending_balance",
+]
+TOTALS = [
+    "final_amount",
+    "total_contributions",
+    "total_interest",
+    "real_final_amount",
+    "after_tax_final_amount",
+]
+
+
+@pytest.mark.parametrize("plan", PLANS)
+def test_analytic_matches_iterative(plan):
+    analytic = CompoundInterestCalculator(CalculationEngine.ANALYTIC).calculate(plan)
+    iterative = CompoundInterestCalculator(CalculationEngine.ITERATIVE).calculate(plan)
+
+    for name in TOTALS:
+        assert getattr(analytic, name) == pytest.approx(
+            getattr(iterative, name), rel=1e-9, abs=1e-6
+        )
+    assert len(analytic.yearly_breakdown) == len(iterative.yearly_breakdown)
+    for name in BREAKDOWN_COLUMNS:
+        np.testing.assert_allclose(
+            getattr(analytic.yearly_breakdown, name),
+            getattr(iterative.yearly_breakdown, name),
+            rtol=1e-9,
+            atol=1e-6,
+        )
+
+
+def test_batch_matches_scalar():
+    batch = BatchCompoundInterestInput.from_inputs(PLANS)
+    result = BatchCompoundInterestCalculator().calculate(batch)
+    calculator = CompoundInterestCalculator()
+
+    for row, plan in enumerate(PLANS):
+        expected = calculator.calculate(plan)
+        for name in TOTALS:
+            assert getattr(result, name)[row] == pytest.approx(
+                getattr(expected, name), rel=1e-9, abs=1e-6
+            )
+        num_years = int(result.num_years[row])
+        assert num_years == len(expected.yearly_breakdown)
+        np.testing.assert_allclose(
+            result.yearly_balances[row, :num_years],
+            expected.yearly_breakdown.ending_balance,
+            rtol=1e-9,
+            atol=1e-6,
+        )
+        np.testing.assert_allclose(
+            result.yearly_contributions[row, :num_years],
+            expected.yearly_breakdown.contributions,
+            rtol=1e-9,
+            atol=1e-6,
+        )
+        assert np.isnan(result.yearly_balances[row, num_years:]).all()
+
+
+def test_batch_rejects_schedules():
+    scheduled = replace(PLANS[0], schedule=Schedule.from_segments([ScheduleSegment(12, 3)]))
+    with pytest.raises(ValueError, match="schedule"):
+        BatchCompoundInterestInput.from_inputs([PLANS[0], scheduled])
+
+
+def ledger(plan: CompoundInterestInput) -> list[int]:
+    """Year-end balances in cents, crediting each period's rounded interest in turn."""
+    n = plan.compounding_frequency.value
+    rate = plan.rate_decimal / n
+    contribution = round(contribution_per_period(plan) * 100)
+    balance = round(plan.principal * 100)
+    periods = [n] * plan.years + ([plan.months * n // 12] if plan.months else [])
+    balances = []
+    for count in periods:
+        for _ in range(count):
+            balance += round(balance * rate) + contribution
+        balances.append(balance)
+    return balances
+
+
+CENTS_PLANS = [plan for plan in PLANS if plan.annual_rate > -100]
+CENTS_PLANS += [
+    CompoundInterestInput(
+        principal=12_345.67,
+        annual_rate=6.25,
+        years=12,
+        months=3,
+        monthly_contribution=333.33,
+        compounding_frequency=CompoundingFrequency.MONTHLY,
+        tax_drag=0.75,
+    ),
+    CompoundInterestInput(
+        principal=999.99,
+        annual_rate=3.1,
+        years=2,
+        monthly_contribution=10.01,
+        compounding_frequency=CompoundingFrequency.DAILY,
+    ),
+]
+
+
+@pytest.mark.parametrize("rounding", list(RoundingPolicy))
+@pytest.mark.parametrize("plan", CENTS_PLANS)
+def test_cents_totals_are_exact(plan, rounding):
+    result = CompoundInterestCalculator(rounding=rounding).calculate(plan)
+    cents = result.cents
+
+    assert (cents.starting_balance + cents.contributions + cents.interest_earned).tolist() == (
+        cents.ending_balance.tolist()
+    )
+    final = int(cents.principal) + int(cents.contributions.sum()) + int(cents.interest_earned.sum())
+    assert final == int(cents.final_amount)
+    assert round(result.final_amount * 100) == int(cents.final_amount)
+    assert round(result.total_contributions * 100) == int(cents.contributions.sum())
+    assert round(result.total_interest * 100) == int(cents.interest_earned.sum())
+
+
+@pytest.mark.parametrize("plan", CENTS_PLANS)
+def test_cents_per_period_matches_ledger(plan):
+    result = CompoundInterestCalculator(rounding=RoundingPolicy.PER_PERIOD).calculate(plan)
+    assert result.cents.ending_balance.tolist() == ledger(plan)
+
+
+@pytest.mark.parametrize("rounding", list(RoundingPolicy))
+def test_batch_cents_match_scalar(rounding):
+    # More scenarios than the scalar loop takes, so the vectorized path runs
+    plans = CENTS_PLANS * 2
+    batch = BatchCompoundInterestCalculator(rounding).calculate(
+        BatchCompoundInterestInput.from_inputs(plans)
+    )
+    calculator = CompoundInterestCalculator(rounding=rounding)
+    for row, plan in enumerate(plans):
+        expected = calculator.calculate(plan).cents
+        num_years = expected.ending_balance.shape[-1]
+        assert batch.cents.ending_balance[row, :num_years].tolist() == (
+            expected.ending_balance.tolist()
+        )
+        assert batch.cents.after_tax_ending_balance[row, :num_years].tolist() == (
+            expected.after_tax_ending_balance.tolist()
+        )
+        assert int(batch.cents.final_amount[row]) == int(expected.final_amount)
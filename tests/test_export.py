@@ -0,0 +1,71 @@
+"""Exported files must hold every breakdown year and parse as their format."""
+
+import csv
+import io
+import json
+
+import pytest
+
+from firefly.core import export
+from firefly.core.calculators.batch import BatchCompoundInterestCalculator
+from firefly.core.calculators.compound_interest import CompoundInterestCalculator
+from firefly.core.export import ExportFormat, batch_records, write_stream
+from firefly.core.models.batch import BatchCompoundInterestInput
+from firefly.core.models.compound_interest import CompoundingFrequency, CompoundInterestInput
+
+
+def overflowing_batch() -> BatchCompoundInterestInput:
+    """A scenario whose balance overflows to inf and then NaN, and an ordinary one."""
+    return BatchCompoundInterestInput(
+        principal=[1000, 1000],
+        annual_rate=[5000, 5],
+        years=[200, 3],
+        months=[0, 6],
+        monthly_contribution=[0, 100],
+        annual_contribution=[0, 0],
+        compounding_frequency=[12, 12],
+    )
+
+
+def export_lines(format: ExportFormat) -> list[str]:
+    result = BatchCompoundInterestCalculator().calculate(overflowing_batch())
+    content = b"".join(write_stream([batch_records(result)], format))
+    return content.decode().splitlines()
+
+
+@pytest.fixture(params=[True, False], ids=["pyarrow", "stdlib"])
+def pyarrow_available(request, monkeypatch):
+    if request.param:
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(export, "_pyarrow_available", lambda: request.param)
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_overflowed_years_are_kept(pyarrow_available):
+    rows = list(csv.DictReader(export_lines(ExportFormat.CSV)))
+    assert [sum(row["scenario"] == s for row in rows) for s in ("0", "1")] == [200, 4]
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_jsonl_writes_non_finite_values_as_null(pyarrow_available):
+    records = [json.loads(line) for line in export_lines(ExportFormat.JSONL)]
+    assert len(records) == 204
+    assert records[199]["year"] == 200
+    assert records[199]["ending_balance"] is None
+    expected = CompoundInterestCalculator().calculate(
+        CompoundInterestInput(
+            principal=1000,
+            annual_rate=5,
+            years=3,
+            months=6,
+            monthly_contribution=100,
+            compounding_frequency=CompoundingFrequency.MONTHLY,
+        )
+    )
+    assert records[-1]["ending_balance"] == pytest.approx(expected.final_amount)
+    assert all(isinstance(value, int | float) for value in records[-1].values())
+
+
+def test_csv_header_only_when_nothing_is_exported(pyarrow_available):
+    content = b"".join(write_stream([], ExportFormat.CSV)).decode()
+    assert next(csv.reader(io.StringIO(content))) == list(export.RECORD_COLUMNS)
@@ -0,0 +1,44 @@
+"""Query thresholds must select exactly the locations whose outcomes pass them."""
+
+import numpy as np
+import pytest
+
+from firefly.core.calculators.geo_arbitrage import GeoArbitrageCalculator
+from firefly.core.models.geo_arbitrage import GeoArbitrageInput, LocationQuery
+
+calculator = GeoArbitrageCalculator()
+
+
+def test_fi_now_keeps_locations_exactly_at_the_ceiling():
+    # The cost ceiling is 60, which rounds to 59.99999999999999
+    params = GeoArbitrageInput(portfolio=200_000, annual_expenses=20_000, home_cost_index=150)
+    result = calculator.compare(params, LocationQuery(fi_now=True))
+    assert result.cost_index.max() == 60
+    assert (result.percent_of_fi >= 100).all()
+    assert result.total_matches == np.count_nonzero(calculator.compare(params).percent_of_fi >= 100)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_filters_match_the_full_comparison(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(40):
+        params = GeoArbitrageInput(
+            portfolio=float(rng.choice([100e3, 200e3, 250e3, 500e3])),
+            annual_expenses=float(rng.choice([20e3, 25e3, 40e3])),
+            home_cost_index=float(rng.choice([60, 100, 120, 150])),
+            annual_savings=float(rng.choice([0, 10e3, 20e3])),
+            annual_rate=float(rng.choice([0, 5, 7])),
+            withdrawal_rate=float(rng.choice([3.5, 4, 5])),
+        )
+        query = LocationQuery(
+            fi_now=bool(rng.random() < 0.5),
+            max_years_to_fi=float(rng.integers(0, 30)) if rng.random() < 0.6 else None,
+        )
+        full = calculator.compare(params)
+        passes = np.ones(len(full), dtype=bool)
+        if query.fi_now:
+            passes &= full.percent_of_fi >= 100
+        if query.max_years_to_fi is not None:
+            passes &= full.years_to_fi <= query.max_years_to_fi
+        result = calculator.compare(params, query)
+        assert result.name.tolist() == full.name[passes].tolist()
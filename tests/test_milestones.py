@@ -0,0 +1,95 @@
+"""Milestones must land in the period a step-by-step scan finds them in."""
+
+import math
+
+import numpy as np
+import pytest
+
+from firefly.core.calculators.compound_interest import (
+    contribution_per_period,
+    inflation_per_period,
+)
+from firefly.core.calculators.milestones import MilestoneFinder
+from firefly.core.models.batch import BatchCompoundInterestInput
+from firefly.core.models.compound_interest import CompoundingFrequency, CompoundInterestInput
+from firefly.core.models.milestones import Milestone, MilestoneInput, MilestoneKind
+
+PLANS = [
+    CompoundInterestInput(
+        principal=10_000,
+        annual_rate=7,
+        years=30,
+        months=4,
+        monthly_contribution=500,
+        compounding_frequency=CompoundingFrequency.MONTHLY,
+        inflation_rate=2.5,
+    ),
+    CompoundInterestInput(
+        principal=50_000,
+        annual_rate=5,
+        years=25,
+        annual_contribution=12_000,
+        compounding_frequency=CompoundingFrequency.ANNUALLY,
+        inflation_rate=3,
+    ),
+    CompoundInterestInput(
+        principal=1_000,
+        annual_rate=6,
+        years=8,
+        monthly_contribution=100,
+        compounding_frequency=CompoundingFrequency.DAILY,
+        inflation_rate=2,
+    ),
+]
+
+MILESTONES = [
+    Milestone(5_000),
+    Milestone(100_000),
+    Milestone(250_000),
+    Milestone(1e12),
+    Milestone(80_000, MilestoneKind.REAL_BALANCE),
+    Milestone(175_000, MilestoneKind.REAL_BALANCE),
+    Milestone(4_000, MilestoneKind.CROSSOVER),
+    Milestone(12_345, MilestoneKind.CROSSOVER),
+]
+
+
+def scan(plan: CompoundInterestInput, milestone: Milestone) -> tuple[float, float]:
+    """Years until `milestone` is met and the balance then, stepping period by period."""
+    n = plan.compounding_frequency.value
+    rate = plan.rate_decimal / n
+    inflation = float(inflation_per_period(plan.inflation_rate / 100, n))
+    contribution = contribution_per_period(plan)
+    balance, price = float(plan.principal), 1.0
+    total = plan.years * n + plan.months * n // 12
+    for period in range(total + 1):
+        if period:
+            balance = balance * (1 + rate) + contribution
+            price *= 1 + inflation
+        value = {
+            MilestoneKind.BALANCE: balance,
+            MilestoneKind.REAL_BALANCE: balance / price,
+            MilestoneKind.CROSSOVER: balance / price * plan.annual_rate / 100,
+        }[milestone.kind]
+        if value >= milestone.amount:
+            return period / n, balance
+    return math.inf, math.nan
+
+
+@pytest.mark.parametrize("plan", PLANS)
+def test_find_matches_scan(plan):
+    result = MilestoneFinder().find(MilestoneInput(plan, MILESTONES))
+    for milestone, years, balance in zip(MILESTONES, result.years, result.balance, strict=True):
+        expected_years, expected_balance = scan(plan, milestone)
+        assert years == pytest.approx(expected_years, abs=1e-12), milestone
+        if math.isfinite(expected_years):
+            assert balance == pytest.approx(expected_balance, rel=1e-9), milestone
+
+
+def test_find_batch_matches_find():
+    finder = MilestoneFinder()
+    batch = finder.find_batch(BatchCompoundInterestInput.from_inputs(PLANS), MILESTONES)
+    for row, plan in enumerate(PLANS):
+        single = finder.find(MilestoneInput(plan, MILESTONES))
+        np.testing.assert_array_equal(batch.years[row], single.years)
+        np.testing.assert_allclose(batch.balance[row], single.balance, rtol=1e-12)
@@ -0,0 +1,84 @@
+"""Monte Carlo results must depend on the seed and chunking only."""
+
+import numpy as np
+import pytest
+
+from firefly.core.calculators.compound_interest import CompoundInterestCalculator
+from firefly.core.calculators.monte_carlo import SKETCH_SIZE, MonteCarloSimulator, simulate_chunk
+from firefly.core.models.compound_interest import CompoundingFrequency, CompoundInterestInput
+from firefly.core.models.monte_carlo import (
+    DistributionType,
+    MonteCarloInput,
+    ReturnDistribution,
+)
+
+PLAN = CompoundInterestInput(
+    principal=10_000,
+    annual_rate=0,
+    years=20,
+    months=6,
+    monthly_contribution=500,
+    compounding_frequency=CompoundingFrequency.MONTHLY,
+)
+
+
+def study(**overrides) -> MonteCarloInput:
+    return MonteCarloInput(
+        **{
+            "plan": PLAN,
+            "distribution": ReturnDistribution(mean=7, volatility=15),
+            "num_paths": 6_000,
+            "seed": 42,
+            "target": 300_000,
+            "chunk_size": 1_000,
+            **overrides,
+        }
+    )
+
+
+def assert_same(a, b):
+    np.testing.assert_array_equal(a.yearly_percentiles, b.yearly_percentiles)
+    np.testing.assert_array_equal(a.final_amount_percentiles, b.final_amount_percentiles)
+    assert a.mean_final_amount == b.mean_final_amount
+    assert a.success_probability == b.success_probability
+
+
+def test_results_do_not_depend_on_workers():
+    params = study()
+    serial = MonteCarloSimulator(workers=1).simulate(params)
+    parallel = MonteCarloSimulator(workers=3).simulate(params)
+    assert_same(serial, parallel)
+
+
+def test_results_repeat_with_a_seed():
+    assert_same(MonteCarloSimulator().simulate(study()), MonteCarloSimulator().simulate(study()))
+
+
+def test_percentiles_exact_up_to_sketch_size():
+    params = study(num_paths=SKETCH_SIZE, chunk_size=500)
+    result = MonteCarloSimulator().simulate(params)
+    balances = np.concatenate(
+        [simulate_chunk(*task) for task in MonteCarloSimulator.chunk_tasks(params)]
+    )
+    np.testing.assert_allclose(
+        result.yearly_percentiles, np.percentile(balances, params.percentiles, axis=0), rtol=1e-12
+    )
+    assert result.mean_final_amount == pytest.approx(balances[:, -1].mean(), rel=1e-12)
+    assert result.success_probability == np.mean(balances[:, -1] >= params.target)
+
+
+@pytest.mark.parametrize("kind", list(DistributionType))
+def test_zero_volatility_reproduces_the_plan(kind):
+    result = MonteCarloSimulator().simulate(
+        study(distribution=ReturnDistribution(mean=7, volatility=0, kind=kind), num_paths=10)
+    )
+    expected = CompoundInterestCalculator().calculate(
+        CompoundInterestInput(**{**vars(PLAN), "annual_rate": 7})
+    )
+    np.testing.assert_allclose(result.final_amount_percentiles, expected.final_amount, rtol=1e-12)
+
+
+@pytest.mark.parametrize("field", ["num_paths", "chunk_size"])
+def test_rejects_empty_studies(field):
+    with pytest.raises(ValueError, match=field):
+        study(**{field: 0})
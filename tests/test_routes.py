@@ -0,0 +1,148 @@
+"""The batch, export and jobs routes must agree with the synchronous calculation."""
+
+import csv
+import io
+import json
+import time
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from firefly.api.main import app  # noqa: E402
+
+SCENARIO = {
+    "principal": 10_000,
+    "annual_rate": 7,
+    "years": 10,
+    "months": 3,
+    "monthly_contribution": 250,
+    "compounding_frequency": "monthly",
+    "inflation_rate": 2,
+}
+
+
+@pytest.fixture(scope="module")
+def client():
+    # Entering the client runs the app's lifespan, which shuts the job pool down on exit
+    with TestClient(app) as client:
+        yield client
+
+
+def calculate(client, scenario: dict) -> dict:
+    response = client.post("/api/calculate", json=scenario)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_batch_reports_invalid_scenarios_inline(client):
+    scenarios = [
+        SCENARIO,
+        {**SCENARIO, "principal": -5},
+        {**SCENARIO, "compounding_frequency": "hourly"},
+        {**SCENARIO, "schedule": [{"start_month": 12, "annual_rate": 3}]},
+        {**SCENARIO, "years": 30, "annual_contribution": 1_000},
+    ]
+    response = client.post("/api/calculate/batch", json=scenarios)
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [line["index"] for line in lines] == list(range(len(scenarios)))
+    assert [("error" in line) for line in lines] == [False, True, True, True, False]
+    assert "principal" in lines[1]["error"]
+    assert "hourly" in lines[2]["error"]
+    assert "schedule" in lines[3]["error"]
+    for index in (0, 4):
+        expected = calculate(client, scenarios[index])
+        result = lines[index]["result"]
+        assert result["final_amount"] == pytest.approx(expected["final_amount"], rel=1e-9)
+        assert len(result["yearly_breakdown"]) == len(expected["yearly_breakdown"])
+
+
+@pytest.mark.parametrize("format", ["csv", "jsonl"])
+def test_export_holds_every_year(client, format):
+    scenarios = [SCENARIO, {**SCENARIO, "years": 3, "months": 0}]
+    response = client.post(f"/api/calculate/export?format={format}", json=scenarios)
+    assert response.status_code == 200
+    assert f"firefly-scenarios.{format}" in response.headers["content-disposition"]
+    if format == "csv":
+        records = list(csv.DictReader(io.StringIO(response.text)))
+    else:
+        records = [json.loads(line) for line in response.text.splitlines()]
+
+    for index, scenario in enumerate(scenarios):
+        expected = calculate(client, scenario)["yearly_breakdown"]
+        rows = [row for row in records if int(row["scenario"]) == index]
+        assert [int(row["year"]) for row in rows] == [row["year"] for row in expected]
+        for row, expected_row in zip(rows, expected, strict=True):
+            assert float(row["ending_balance"]) == pytest.approx(
+                expected_row["ending_balance"], rel=1e-9
+            )
+
+
+def test_export_rejects_unknown_frequency(client):
+    response = client.post(
+        "/api/calculate/export", json=[SCENARIO, {**SCENARIO, "compounding_frequency": "hourly"}]
+    )
+    assert response.status_code == 400
+    assert "Scenario 1" in response.json()["detail"]
+
+
+def wait_for(client, location: str) -> dict:
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        response = client.get(f"{location}/result")
+        if response.status_code != 202:
+            assert response.status_code == 200, response.text
+            return response.json()
+        time.sleep(0.05)
+    raise TimeoutError(f"{location} did not finish")
+
+
+def test_calculate_job_matches_calculate(client):
+    response = client.post(
+        "/api/jobs", json={"kind": "calculate", "params": SCENARIO, "breakdown": "yearly"}
+    )
+    assert response.status_code == 202
+    assert wait_for(client, response.headers["location"]) == calculate(client, SCENARIO)
+
+
+def test_monte_carlo_job_matches_simulate(client):
+    from firefly.core.calculators.monte_carlo import MonteCarloSimulator
+    from firefly.core.models.compound_interest import CompoundingFrequency, CompoundInterestInput
+    from firefly.core.models.monte_carlo import MonteCarloInput, ReturnDistribution
+
+    request = {
+        "kind": "monte_carlo",
+        "plan": SCENARIO,
+        "mean_return": 7,
+        "volatility": 15,
+        "num_paths": 25_000,
+        "seed": 7,
+        "target": 60_000,
+    }
+    response = client.post("/api/jobs", json=request)
+    assert response.status_code == 202
+    result = wait_for(client, response.headers["location"])
+
+    plan = CompoundInterestInput(
+        **{**SCENARIO, "compounding_frequency": CompoundingFrequency.MONTHLY}
+    )
+    expected = MonteCarloSimulator().simulate(
+        MonteCarloInput(
+            plan=plan,
+            distribution=ReturnDistribution(mean=7, volatility=15),
+            num_paths=25_000,
+            seed=7,
+            target=60_000,
+        )
+    )
+    assert result["yearly_percentiles"] == expected.yearly_percentiles.tolist()
+    assert result["mean_final_amount"] == expected.mean_final_amount
+    assert result["success_probability"] == expected.success_probability
+
+
+def test_unknown_job(client):
+    assert client.get("/api/jobs/missing").status_code == 404
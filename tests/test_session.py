@@ -0,0 +1,87 @@
+"""Incremental session updates must match recomputing from scratch."""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from firefly.core.calculators.compound_interest import CompoundInterestCalculator
+from firefly.core.models.compound_interest import (
+    CompoundingFrequency,
+    CompoundInterestInput,
+    Schedule,
+    ScheduleSegment,
+)
+from firefly.core.session import CalculationSession
+
+BASE = CompoundInterestInput(
+    principal=20_000,
+    annual_rate=6,
+    years=10,
+    monthly_contribution=400,
+    annual_contribution=1_000,
+    compounding_frequency=CompoundingFrequency.MONTHLY,
+    inflation_rate=2,
+    tax_drag=1,
+)
+
+
+def schedule(*segments: ScheduleSegment) -> Schedule:
+    return Schedule.from_segments(segments)
+
+
+# Each edit is applied to the plan before it, as a user would make them
+EDITS = [
+    {"years": 25},
+    {"years": 25, "months": 7},
+    {"years": 30, "months": 0},
+    {"schedule": schedule(ScheduleSegment(120, annual_rate=4))},
+    {"schedule": schedule(ScheduleSegment(120, annual_rate=4), ScheduleSegment(200, 3))},
+    {"schedule": schedule(ScheduleSegment(120, annual_rate=4), ScheduleSegment(260, 3))},
+    {"schedule": schedule(ScheduleSegment(60, monthly_contribution=0))},
+    {"annual_contribution": 5_000},
+    {"years": 12},
+    {"annual_rate": 8},
+    {"schedule": None},
+    {"years": 12},
+]
+
+
+def assert_same_result(actual, expected):
+    for name in ("final_amount", "total_contributions", "real_final_amount"):
+        assert getattr(actual, name) == pytest.approx(getattr(expected, name), rel=1e-9)
+    assert actual.after_tax_final_amount == pytest.approx(expected.after_tax_final_amount, rel=1e-9)
+    for name in actual.yearly_breakdown.columns():
+        np.testing.assert_allclose(
+            getattr(actual.yearly_breakdown, name),
+            getattr(expected.yearly_breakdown, name),
+            rtol=1e-9,
+        )
+
+
+def test_edits_match_full_recompute():
+    session = CalculationSession()
+    calculator = CompoundInterestCalculator()
+    params = BASE
+    assert_same_result(session.calculate(params), calculator.calculate(params))
+    for edit in EDITS:
+        params = replace(params, **edit)
+        assert_same_result(session.calculate(params), calculator.calculate(params))
+    assert session.total_cost.years_reused > 0
+
+
+def test_extending_years_reuses_the_shared_years():
+    session = CalculationSession()
+    session.calculate(BASE)
+    session.calculate(replace(BASE, years=40))
+    assert session.last_cost.years_reused == BASE.years
+    assert session.last_cost.years_computed == 40 - BASE.years
+
+
+def test_mutating_inputs_after_calculating_is_noticed():
+    session = CalculationSession()
+    calculator = CompoundInterestCalculator()
+    params = replace(BASE, years=20, schedule=schedule(ScheduleSegment(120, annual_rate=4)))
+    session.calculate(params)
+    params.schedule.annual_rate[0] = 9
+    assert_same_result(session.calculate(params), calculator.calculate(params))
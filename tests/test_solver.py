@@ -0,0 +1,66 @@
+"""Solving for any one variable must invert solving for the others."""
+
+import numpy as np
+import pytest
+
+from firefly.core.calculators.solver import FormulaSolver
+from firefly.core.models.solver import FormulaSolverInput, SolveFor
+
+solver = FormulaSolver()
+
+# Scenarios as columns: savings rate %, real return %, FI multiplier, current portfolio multiple
+SAVINGS_RATE = np.array([10, 25, 50, 65, 80, 40, 30])
+RETURN_RATE = np.array([5, 7, 3, 0, 4, -2, 10])
+FI_MULTIPLIER = np.array([25, 25, 30, 25, 20, 25, 33])
+PORTFOLIO_MULTIPLE = np.array([0, 0.5, 2, 0, 1, 3, 0])
+
+
+def solve(solve_for: SolveFor, **known) -> np.ndarray:
+    result = solver.solve(
+        FormulaSolverInput(solve_for, portfolio_multiple=PORTFOLIO_MULTIPLE, **known)
+    )
+    assert result.feasible.all()
+    return result.value
+
+
+@pytest.fixture(scope="module")
+def years() -> np.ndarray:
+    return solve(
+        SolveFor.YEARS,
+        savings_rate=SAVINGS_RATE,
+        return_rate=RETURN_RATE,
+        fi_multiplier=FI_MULTIPLIER,
+    )
+
+
+def test_years_are_positive(years):
+    assert (years > 0).all()
+
+
+def test_savings_rate_round_trip(years):
+    savings_rate = solve(
+        SolveFor.SAVINGS_RATE, return_rate=RETURN_RATE, fi_multiplier=FI_MULTIPLIER, years=years
+    )
+    np.testing.assert_allclose(savings_rate, SAVINGS_RATE, rtol=1e-9)
+
+
+def test_return_rate_round_trip(years):
+    return_rate = solve(
+        SolveFor.RETURN_RATE, savings_rate=SAVINGS_RATE, fi_multiplier=FI_MULTIPLIER, years=years
+    )
+    np.testing.assert_allclose(return_rate, RETURN_RATE, atol=1e-7)
+
+
+def test_fi_multiplier_round_trip(years):
+    multiplier = solve(
+        SolveFor.FI_MULTIPLIER, savings_rate=SAVINGS_RATE, return_rate=RETURN_RATE, years=years
+    )
+    np.testing.assert_allclose(multiplier, FI_MULTIPLIER, rtol=1e-9)
+
+
+def test_unreachable_return_rate_is_infeasible():
+    result = solver.solve(
+        FormulaSolverInput(SolveFor.RETURN_RATE, savings_rate=5, fi_multiplier=25, years=1)
+    )
+    assert not result.feasible.any()
+    assert np.isnan(result.value).all()